@@ -0,0 +1,22 @@
+'''
+This file runs benchmarks of game engine.
+'''
+
+
+if __name__ == '__main__':
+    from modules.benchmark import memory_report, landing_time
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmarks of game engine.')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--landings', type=int, default=40000)
+    args = parser.parse_args()
+    report = memory_report(args.games, args.players, args.rounds)
+    print(f'Pamięć nowej gry: {report["new_game"]:.0f} B')
+    print(f'Pamięć gry po {args.rounds} rundach: '
+          f'{report["played_game"]:.0f} B')
+    for name, size in report['instances'].items():
+        print(f'{name}: {size} B')
+    print(f'Czas akcji po staniu na polu: '
+          f'{landing_time(args.landings) * 1e6:.2f} µs')
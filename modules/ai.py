@@ -1,10 +1,11 @@
 from modules.player import Player
 from modules.constants import (BID_DIFFERENCE, DEPOSIT, DISTRICTS_SIZES,
-                               MAX_PROPERTY_LEVEL)
-from modules.exceptions import (AlreadyMortagedError, PropertyLevelError,
-                                UnequalBuildingError)
+                               MAX_PROPERTY_LEVEL, AI_MIN_MONEY,
+                               AI_MIN_MONEY_TO_UPGRADE, AI_ROUNDS_IN_JAIL,
+                               AI_PASS_PROBABILITY, ALLOWED)
 from modules.fields import Property, BuyableField
-from random import choice, randint
+from modules.bitboard import DISTRICT_MASKS, mask_ids
+from math import log
 
 
 class AiPlayer(Player):
@@ -22,6 +23,12 @@ class AiPlayer(Player):
         information of player want to make a bid
     bid:
         returns players bid in auction
+    bid_limit:
+        returns highest current bid which player can outbid
+    bids_before_pass:
+        draws number of bids player makes before he passes
+    sealed_bid:
+        returns player's bid in sealed-bid auction
     pricing:
         returns player's price for his field
     want_to_buy:
@@ -53,6 +60,8 @@ class AiPlayer(Player):
     build_houses_ids:
         returns ids of fields which player want to upgrade
     '''
+    __slots__ = ()
+
     def __init__(self, id: int, name: str) -> None:
         super().__init__(id, name)
 
@@ -72,12 +81,10 @@ class AiPlayer(Player):
         Player cannot make bid if after bid he will have less than 300.
         Player do not want to buy field if its price is too high.
         '''
-        if self.money() - (current_bid + BID_DIFFERENCE) < 300:
-            return False
-        elif current_bid + BID_DIFFERENCE > field.price():
+        if current_bid > self.bid_limit(field):
             return False
         else:
-            draw = randint(1, 10)
+            draw = self.random().randint(1, 10)
             if draw > 9:
                 return False
             else:
@@ -92,6 +99,44 @@ class AiPlayer(Player):
         bid = current_bid + BID_DIFFERENCE
         return bid
 
+    def bid_limit(self, field: BuyableField, money: int = None) -> int:
+        '''
+        Returns highest current bid which player can outbid.
+        After bid player has at least 300 and bid is not higher
+        than field's price. Money left for auctions can be given,
+        player's money is used by default.
+        '''
+        if money is None:
+            money = self.money()
+        return min(money - AI_MIN_MONEY, field.price()) - BID_DIFFERENCE
+
+    def bids_before_pass(self) -> int:
+        '''
+        Draws number of bids player makes in auction before he passes
+        by his own will, if his money and price of field let him bid.
+        Every bid is made with the same probability (see want_to_bid),
+        so number of bids has geometric distribution.
+        '''
+        draw = 1 - self.random().random()
+        return int(log(draw) / log(1 - AI_PASS_PROBABILITY))
+
+    def sealed_bid(self, field: BuyableField, start_bid: int,
+                   money: int = None) -> int or None:
+        '''
+        Returns bid in sealed-bid auction or None if player passes.
+        Bid is the price player would reach in open auction if he was
+        outbid every time, so Vickrey auction sells field like open one.
+        Money left for auctions can be given (see bid_limit).
+        '''
+        limit = self.bid_limit(field, money)
+        if limit < start_bid:
+            return None
+        bids = min(self.bids_before_pass(),
+                   (limit - start_bid) // BID_DIFFERENCE + 2)
+        if bids == 0:
+            return None
+        return start_bid + (bids - 1) * BID_DIFFERENCE
+
     def pricing(self, field: BuyableField) -> int:
         '''
         Returns simple pricing of Ai player field.
@@ -99,14 +144,14 @@ class AiPlayer(Player):
         '''
         min = field.price()
         max = 2 * field.price()
-        return randint(min, max)
+        return self.random().randint(min, max)
 
     def want_to_buy(self, field: BuyableField) -> bool:
         '''
         Returns True if player want to buy a field.
         '''
 
-        return self.money() - field.price() >= 300
+        return self.money() - field.price() >= AI_MIN_MONEY
 
     def earn_from_houses(self, debt: int) -> bool:
         '''
@@ -116,12 +161,8 @@ class AiPlayer(Player):
         for i in range(MAX_PROPERTY_LEVEL):
             for field in self.fields().values():
                 if isinstance(field, Property):
-                    try:
+                    if field.check_downgrade() == ALLOWED:
                         field.remove_house()
-                    except PropertyLevelError:
-                        pass
-                    except UnequalBuildingError:
-                        pass
                 if self.money() >= debt:
                     return True
         return False
@@ -132,10 +173,8 @@ class AiPlayer(Player):
         '''
         fields = [field for field in self.fields().values()]
         for field in fields:
-            try:
+            if self.check_sell(field) == ALLOWED:
                 self.sell_to_bank(field)
-            except AlreadyMortagedError:
-                pass
             if self.money() >= debt:
                 return
 
@@ -143,13 +182,13 @@ class AiPlayer(Player):
         '''
         Decision if player want to stay in jail.
         '''
-        return current_round <= 5
+        return current_round <= AI_ROUNDS_IN_JAIL
 
     def deposit_decision(self) -> bool:
         '''
         Decision of paying the deposit.
         '''
-        return self.money() - DEPOSIT >= 300
+        return self.money() - DEPOSIT >= AI_MIN_MONEY
 
     def use_card_decision(self) -> bool:
         '''
@@ -161,26 +200,15 @@ class AiPlayer(Player):
         '''
         Decision if player want to upgrade his properties.
         '''
-        return self.money() - price >= 500
+        return self.money() - price >= AI_MIN_MONEY_TO_UPGRADE
 
     def count_owned_districts(self) -> dict:
         '''
         Counts player properties in each district.
         '''
-        counter = {
-            'grey': 0,
-            'white': 0,
-            'magenta': 0,
-            'cyan': 0,
-            'red': 0,
-            'yellow': 0,
-            'green': 0,
-            'blue': 0
-        }
-        for field in self.fields().values():
-            if isinstance(field, Property):
-                counter[field.district()] += 1
-        return counter
+        bitboard = self.bitboard()
+        return {district: bitboard.district_count(district)
+                for district in DISTRICTS_SIZES}
 
     def almost_full_districts(self) -> list:
         '''
@@ -198,12 +226,9 @@ class AiPlayer(Player):
         '''
         Create a list of player full owned districts.
         '''
-        player_districts = self.count_owned_districts()
-        full_districts = []
-        for district in player_districts:
-            if DISTRICTS_SIZES[district] == player_districts[district]:
-                full_districts.append(district)
-        return full_districts
+        bitboard = self.bitboard()
+        return [district for district in DISTRICTS_SIZES
+                if bitboard.owns_district(district)]
 
     def missing_field_id(self, district: str, board: dict) -> int:
         '''
@@ -228,7 +253,7 @@ class AiPlayer(Player):
         '''
         Reply for pricing from other player.
         '''
-        pricing = randint(field.price(), 2 * field.price())
+        pricing = self.random().randint(field.price(), 2 * field.price())
         if self.want_to_buy(field) and not price > pricing:
             return True
         else:
@@ -238,13 +263,10 @@ class AiPlayer(Player):
         '''
         Ids of fields on which player will try to build house in current turn.
         '''
-        fields = self.fields()
         full_districts = self.full_districts()
         ids = []
         if len(full_districts) > 0:
-            district_color = choice(full_districts)
-            for field in fields.values():
-                if isinstance(field, Property):
-                    if field.district() == district_color:
-                        ids.append(field.id())
+            district_color = self.random().choice(full_districts)
+            owned = self.bitboard().owned()
+            ids = mask_ids(owned & DISTRICT_MASKS[district_color])
         return ids
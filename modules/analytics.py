@@ -0,0 +1,183 @@
+from modules.constants import (NUMBER_OF_FIELDS, JAIL_ID, GO_TO_JAIL_ID,
+                               DRAW_FIELD_IDS, MAX_JAIL_ROUND,
+                               MAX_DOUBLES_IN_ROW)
+from modules.chances import NUMBER_OF_CHANCES, GO_TO_JAIL_CHANCES_IDS
+import numpy as np
+
+
+# jail strategies of AiPlayer.want_to_stay_in_jail
+STAY_IN_JAIL = 'stay'
+LEAVE_JAIL = 'leave'
+
+
+class LandingChain:
+    '''
+    Class LandingChain. Markov chain of one player moving around
+    the board. One step of chain is one roll of dices.
+
+    States:
+        free player on field with number of doubles rolled in row
+        in current turn (field * MAX_DOUBLES_IN_ROW + doubles),
+        arrested player in given jail round (after free states).
+
+    Chain follows Gameplay rules: third double in row, GoToJail
+    field and go to jail chance cards put player to jail.
+    Arrested player with STAY_IN_JAIL strategy rolls for double
+    and pays deposit after MAX_JAIL_ROUND failed rolls.
+    With LEAVE_JAIL strategy he uses card or pays deposit at once
+    and rolls in next turn.
+
+    Attributes:
+    -----------
+    _strategy: str
+        jail strategy, STAY_IN_JAIL or LEAVE_JAIL
+    _matrix: array (states, states)
+        transition matrix
+    _landings: array (states, fields)
+        probability of landing on field in one step from state
+
+    Methods:
+    -------
+    strategy:
+        getter
+    transition_matrix:
+        getter
+    number_of_states:
+        number of states of chain
+    free_state:
+        index of state of free player
+    jail_state:
+        index of state of arrested player
+    stationary_distribution:
+        long-run probabilities of states
+    landing_probabilities:
+        long-run probabilities of landing on fields
+    position_probabilities:
+        long-run probabilities of standing on fields
+    '''
+    def __init__(self, strategy: str = STAY_IN_JAIL):
+        '''
+        Creates LandingChain and builds its transition matrix.
+        '''
+        if strategy not in (STAY_IN_JAIL, LEAVE_JAIL):
+            raise ValueError('Unknown jail strategy.')
+        self._strategy = strategy
+        states = self.number_of_states()
+        self._matrix = np.zeros((states, states))
+        self._landings = np.zeros((states, NUMBER_OF_FIELDS))
+        self._build()
+
+    def strategy(self) -> str:
+        '''
+        Returns jail strategy.
+        '''
+        return self._strategy
+
+    def transition_matrix(self):
+        '''
+        Returns transition matrix, rows are states before roll.
+        '''
+        return self._matrix
+
+    def number_of_states(self) -> int:
+        '''
+        Returns number of states of chain.
+        '''
+        return NUMBER_OF_FIELDS * MAX_DOUBLES_IN_ROW + MAX_JAIL_ROUND
+
+    def free_state(self, field: int, doubles: int) -> int:
+        '''
+        Returns index of state of free player.
+        '''
+        return field * MAX_DOUBLES_IN_ROW + doubles
+
+    def jail_state(self, jail_round: int) -> int:
+        '''
+        Returns index of state of arrested player.
+        '''
+        return NUMBER_OF_FIELDS * MAX_DOUBLES_IN_ROW + jail_round - 1
+
+    def _land(self, state, start, result, probability, doubles):
+        '''
+        Adds transitions after moving from start by result.
+        Doubles is number of doubles in row after move.
+        '''
+        field = (start + result) % NUMBER_OF_FIELDS
+        self._landings[state, field] += probability
+        arrest = self.jail_state(1)
+        if field == GO_TO_JAIL_ID:
+            self._matrix[state, arrest] += probability
+        elif field in DRAW_FIELD_IDS:
+            jail = len(GO_TO_JAIL_CHANCES_IDS) / NUMBER_OF_CHANCES
+            self._matrix[state, arrest] += probability * jail
+            next_state = self.free_state(field, doubles)
+            self._matrix[state, next_state] += probability * (1 - jail)
+        else:
+            self._matrix[state, self.free_state(field, doubles)] += probability
+
+    def _build(self):
+        '''
+        Builds transition matrix from rolls of two dices.
+        '''
+        rolls = [(dice_1, dice_2) for dice_1 in range(1, 7)
+                 for dice_2 in range(1, 7)]
+        probability = 1 / len(rolls)
+        for field in range(NUMBER_OF_FIELDS):
+            for doubles in range(MAX_DOUBLES_IN_ROW):
+                state = self.free_state(field, doubles)
+                for dice_1, dice_2 in rolls:
+                    if dice_1 != dice_2:
+                        self._land(state, field, dice_1 + dice_2,
+                                   probability, 0)
+                    elif doubles + 1 == MAX_DOUBLES_IN_ROW:
+                        self._matrix[state, self.jail_state(1)] += probability
+                    else:
+                        self._land(state, field, dice_1 + dice_2,
+                                   probability, doubles + 1)
+        for jail_round in range(1, MAX_JAIL_ROUND + 1):
+            state = self.jail_state(jail_round)
+            if self.strategy() == LEAVE_JAIL:
+                self._matrix[state, self.free_state(JAIL_ID, 0)] = 1
+                continue
+            for dice_1, dice_2 in rolls:
+                result = dice_1 + dice_2
+                if dice_1 == dice_2 or jail_round == MAX_JAIL_ROUND:
+                    # leaving jail roll does not count as double
+                    self._land(state, JAIL_ID, result, probability, 0)
+                else:
+                    next_state = self.jail_state(jail_round + 1)
+                    self._matrix[state, next_state] += probability
+
+    def stationary_distribution(self):
+        '''
+        Returns long-run probabilities of states.
+        Solves pi * P = pi with sum of pi equal 1.
+        '''
+        states = self.number_of_states()
+        equations = np.vstack([self._matrix.T - np.eye(states),
+                               np.ones(states)])
+        values = np.zeros(states + 1)
+        values[-1] = 1
+        solution = np.linalg.lstsq(equations, values, rcond=None)[0]
+        solution[solution < 0] = 0
+        return solution / solution.sum()
+
+    def landing_probabilities(self):
+        '''
+        Returns long-run probabilities of landing on every field
+        after roll which moves player (before action of field).
+        '''
+        landings = self.stationary_distribution() @ self._landings
+        return landings / landings.sum()
+
+    def position_probabilities(self):
+        '''
+        Returns long-run probabilities of player standing on
+        every field after roll. Arrested players stand on jail.
+        '''
+        distribution = self.stationary_distribution()
+        free = NUMBER_OF_FIELDS * MAX_DOUBLES_IN_ROW
+        positions = distribution[:free].reshape(NUMBER_OF_FIELDS,
+                                                MAX_DOUBLES_IN_ROW).sum(axis=1)
+        positions[JAIL_ID] += distribution[free:].sum()
+        return positions
@@ -0,0 +1,933 @@
+from modules.constants import (FIELDS_PATH, NUMBER_OF_FIELDS, START_ID,
+                               JAIL_ID, PARKING_ID, GO_TO_JAIL_ID,
+                               PROPERTY_IDS, TAX_IDS, STATION_IDS, SERVICE_IDS,
+                               DRAW_FIELD_IDS, DISTRICTS_SIZES,
+                               MAX_PROPERTY_LEVEL, NUMBER_OF_STATIONS,
+                               NUMBER_OF_SERVICES, MAX_NUMBER_OF_PLAYERS,
+                               MIN_NUMBER_OF_PLAYERS, START_MONEY, PAYMENT,
+                               DEPOSIT, START_BID, BID_DIFFERENCE,
+                               SIMULATION_ROUNDS,
+                               AI_MIN_MONEY, AI_MIN_MONEY_TO_UPGRADE,
+                               AI_ROUNDS_IN_JAIL, START_KIND, PROPERTY_KIND,
+                               DRAW_KIND, TAX_KIND, STATION_KIND, JAIL_KIND,
+                               SERVICE_KIND, PARKING_KIND, GO_TO_JAIL_KIND,
+                               MAX_DOUBLES_IN_ROW, MAX_JAIL_ROUND,
+                               GAIN_EFFECT, GAIN_PER_FIELD_EFFECT, FINE_EFFECT,
+                               FINE_PER_FIELD_EFFECT, FINE_PER_HOUSE_EFFECT,
+                               ARREST_EFFECT, GET_OUT_CARD_EFFECT,
+                               SCRATCH_CARD_EFFECT)
+from modules.chances import CHANCE_EFFECTS, NUMBER_OF_CHANCES
+from modules.exceptions import PlayersNumberError
+from modules.board import load_board
+import numpy as np
+
+
+# kinds and values of effects of chance cards, indexed by card id
+CHANCE_KINDS, CHANCE_VALUES = np.array(
+    [CHANCE_EFFECTS[id] for id in range(NUMBER_OF_CHANCES)]).T
+
+# effects of chance cards, indexed by card id (see Gameplay.chance)
+CHANCE_GAINS = np.where(CHANCE_KINDS == GAIN_EFFECT, CHANCE_VALUES, 0)
+CHANCE_GAINS_PER_FIELD = np.where(CHANCE_KINDS == GAIN_PER_FIELD_EFFECT,
+                                  CHANCE_VALUES, 0)
+CHANCE_FINES = np.where(CHANCE_KINDS == FINE_EFFECT, CHANCE_VALUES, 0)
+CHANCE_FINES_PER_FIELD = np.where(CHANCE_KINDS == FINE_PER_FIELD_EFFECT,
+                                  CHANCE_VALUES, 0)
+CHANCE_FINES_PER_HOUSE = np.where(CHANCE_KINDS == FINE_PER_HOUSE_EFFECT,
+                                  CHANCE_VALUES, 0)
+CHANCE_GET_OUT_CARDS = np.where(CHANCE_KINDS == GET_OUT_CARD_EFFECT,
+                                CHANCE_VALUES, 0)
+CHANCE_ARRESTS = CHANCE_KINDS == ARREST_EFFECT
+CHANCE_SCRATCH_CARDS = CHANCE_KINDS == SCRATCH_CARD_EFFECT
+
+
+class BoardTables:
+    '''
+    Class BoardTables. Static data of board stored in NumPy
+    arrays indexed by field id. Values not used by field kind are 0.
+
+    Attributes:
+    -----------
+    _kinds: array (fields,)
+        kind of every field
+    _prices: array (fields,)
+        price of buyable fields
+    _house_prices: array (fields,)
+        price of house on properties
+    _rents: array (fields, levels)
+        rents of properties on every level
+    _station_rents: array (fields, stations)
+        rents of stations for number of owned stations minus one
+    _multipliers: array (fields, services)
+        dices multipliers for number of owned services minus one
+    _taxes: array (fields,)
+        values of tax fields
+    _districts: array (fields,)
+        index of property district, -1 for other fields
+    _district_fields: array (districts, max district size)
+        ids of properties in every district, padded with -1
+    _station_ids: array
+        ids of stations
+    _service_ids: array
+        ids of services
+
+    Methods:
+    -------
+    kinds, prices, house_prices, rents, station_rents, multipliers,
+    taxes, districts, district_fields, station_ids, service_ids:
+        getters
+    '''
+    def __init__(self, data: dict):
+        '''
+        Creates BoardTables from fields config.
+        '''
+        fields = NUMBER_OF_FIELDS
+        districts = list(DISTRICTS_SIZES)
+        self._kinds = np.full(fields, PARKING_KIND, dtype=np.int8)
+        self._kinds[START_ID] = START_KIND
+        self._kinds[JAIL_ID] = JAIL_KIND
+        self._kinds[PARKING_ID] = PARKING_KIND
+        self._kinds[GO_TO_JAIL_ID] = GO_TO_JAIL_KIND
+        self._kinds[PROPERTY_IDS] = PROPERTY_KIND
+        self._kinds[TAX_IDS] = TAX_KIND
+        self._kinds[STATION_IDS] = STATION_KIND
+        self._kinds[SERVICE_IDS] = SERVICE_KIND
+        self._kinds[DRAW_FIELD_IDS] = DRAW_KIND
+
+        self._prices = np.zeros(fields, dtype=np.int64)
+        self._house_prices = np.zeros(fields, dtype=np.int64)
+        self._rents = np.zeros((fields, MAX_PROPERTY_LEVEL + 1),
+                               dtype=np.int64)
+        self._station_rents = np.zeros((fields, NUMBER_OF_STATIONS),
+                                       dtype=np.int64)
+        self._multipliers = np.zeros((fields, NUMBER_OF_SERVICES),
+                                     dtype=np.int64)
+        self._taxes = np.zeros(fields, dtype=np.int64)
+        self._districts = np.full(fields, -1, dtype=np.int8)
+        max_size = max(DISTRICTS_SIZES.values())
+        self._district_fields = np.full((len(districts), max_size), -1,
+                                        dtype=np.int64)
+        for key in data:
+            id = int(key)
+            field = data[key]
+            if id in PROPERTY_IDS:
+                self._prices[id] = field['price']
+                self._house_prices[id] = field['house_price']
+                for level in range(MAX_PROPERTY_LEVEL + 1):
+                    self._rents[id, level] = field['rents'][str(level)]
+                district = districts.index(field['district'])
+                self._districts[id] = district
+                row = self._district_fields[district]
+                row[np.argmax(row < 0)] = id
+            elif id in STATION_IDS:
+                self._prices[id] = field['price']
+                for owned in range(1, NUMBER_OF_STATIONS + 1):
+                    self._station_rents[id, owned - 1] = \
+                        field['rents'][str(owned)]
+            elif id in SERVICE_IDS:
+                self._prices[id] = field['price']
+                for owned in range(1, NUMBER_OF_SERVICES + 1):
+                    self._multipliers[id, owned - 1] = \
+                        field['multipliers'][str(owned)]
+            elif id in TAX_IDS:
+                self._taxes[id] = field['value']
+        self._station_ids = np.array(STATION_IDS)
+        self._service_ids = np.array(SERVICE_IDS)
+
+    def kinds(self):
+        '''
+        Returns kinds of fields.
+        '''
+        return self._kinds
+
+    def prices(self):
+        '''
+        Returns prices of buyable fields.
+        '''
+        return self._prices
+
+    def house_prices(self):
+        '''
+        Returns prices of houses on properties.
+        '''
+        return self._house_prices
+
+    def rents(self):
+        '''
+        Returns rents of properties on every level.
+        '''
+        return self._rents
+
+    def station_rents(self):
+        '''
+        Returns rents of stations by number of owned stations.
+        '''
+        return self._station_rents
+
+    def multipliers(self):
+        '''
+        Returns dices multipliers of services by number of owned services.
+        '''
+        return self._multipliers
+
+    def taxes(self):
+        '''
+        Returns values of tax fields.
+        '''
+        return self._taxes
+
+    def districts(self):
+        '''
+        Returns indexes of districts of properties.
+        '''
+        return self._districts
+
+    def district_fields(self):
+        '''
+        Returns ids of properties in every district.
+        '''
+        return self._district_fields
+
+    def station_ids(self):
+        '''
+        Returns ids of stations.
+        '''
+        return self._station_ids
+
+    def service_ids(self):
+        '''
+        Returns ids of services.
+        '''
+        return self._service_ids
+
+
+def load_board_tables(path=FIELDS_PATH) -> BoardTables:
+    '''
+    Reads BoardTables from fields config file.
+    '''
+    return BoardTables(load_board(path).data())
+
+
+class BatchGame:
+    '''
+    Class BatchGame. Plays many AI games in lock-step.
+    State of all games is stored in NumPy arrays, first axis
+    is index of game. Every step rolls dices once for current
+    player of every unfinished game, so turn with doubles takes
+    few steps. Dices, moves, rents, taxes, chances, purchases,
+    auctions and building are vectorised. Rare paths (selling
+    houses and fields to pay debt, bancruption) are resolved
+    game by game. Rules and AI decisions follow Gameplay and
+    AiPlayer, including trades of missing properties of districts.
+    Only AI players are simulated, so human trades, mortages
+    and auction modes other than open auction are not.
+
+    Attributes:
+    -----------
+    _tables: BoardTables
+        static data of board
+    _random: Generator
+        NumPy generator of random numbers
+    _number_of_rounds: int
+        number of rounds after which games end
+    _positions: array (games, players)
+        positions of players, -1 for bancrupts
+    _money: array (games, players)
+        money of players
+    _bancrupts: array (games, players)
+        True if player is bancrupt
+    _jail_rounds: array (games, players)
+        round of player in jail, 0 if player is not arrested
+    _get_out_cards: array (games, players)
+        number of get out of jail cards
+    _doubles: array (games, players)
+        doubles in row
+    _owners: array (games, fields)
+        id of owner of field, -1 for bank
+    _levels: array (games, fields)
+        level of property
+    _mortaged: array (games, fields)
+        True if field is mortaged
+    _current_players: array (games,)
+        id of player who has the move
+    _current_rounds: array (games,)
+        current round of game
+    _finished: array (games,)
+        True if game is finished
+
+    Methods:
+    -------
+    getters of all attributes
+    number_of_games:
+        number of games in batch
+    number_of_players:
+        number of players in every game
+    dices:
+        rolls two dices for given number of players
+    step:
+        one roll of current player in every unfinished game
+    run:
+        plays all games until they are finished
+    next_jail_rounds:
+        increments jail round of all arrested players of given games
+    rents:
+        rents of given fields
+    fortunes:
+        fortunes of all players
+    winners:
+        mask of players who won
+    rounds_played:
+        number of rounds played in every game
+    '''
+    def __init__(self, number_of_games: int, number_of_players: int,
+                 number_of_rounds: int = SIMULATION_ROUNDS, seed=None,
+                 tables: BoardTables = None):
+        '''
+        Creates BatchGame instance with games in initial state.
+        '''
+        if not (MIN_NUMBER_OF_PLAYERS <= number_of_players
+                <= MAX_NUMBER_OF_PLAYERS):
+            raise PlayersNumberError
+        if tables is None:
+            tables = load_board_tables()
+        games = number_of_games
+        players = number_of_players
+        fields = NUMBER_OF_FIELDS
+        self._tables = tables
+        self._random = np.random.default_rng(seed)
+        self._number_of_rounds = number_of_rounds
+        self._positions = np.full((games, players), START_ID, dtype=np.int64)
+        self._money = np.full((games, players), START_MONEY, dtype=np.int64)
+        self._bancrupts = np.zeros((games, players), dtype=bool)
+        self._jail_rounds = np.zeros((games, players), dtype=np.int64)
+        self._get_out_cards = np.zeros((games, players), dtype=np.int64)
+        self._doubles = np.zeros((games, players), dtype=np.int64)
+        self._owners = np.full((games, fields), -1, dtype=np.int64)
+        self._levels = np.zeros((games, fields), dtype=np.int64)
+        self._mortaged = np.zeros((games, fields), dtype=bool)
+        self._current_players = np.zeros(games, dtype=np.int64)
+        self._current_rounds = np.ones(games, dtype=np.int64)
+        self._finished = np.zeros(games, dtype=bool)
+
+    # GETTERS
+
+    def tables(self):
+        '''
+        Returns static data of board.
+        '''
+        return self._tables
+
+    def random(self):
+        '''
+        Returns NumPy generator of random numbers.
+        '''
+        return self._random
+
+    def number_of_rounds(self):
+        '''
+        Returns number of rounds after which games end.
+        '''
+        return self._number_of_rounds
+
+    def number_of_games(self):
+        '''
+        Returns number of games in batch.
+        '''
+        return self._money.shape[0]
+
+    def number_of_players(self):
+        '''
+        Returns number of players in every game.
+        '''
+        return self._money.shape[1]
+
+    def positions(self):
+        '''
+        Returns positions of players.
+        '''
+        return self._positions
+
+    def money(self):
+        '''
+        Returns money of players.
+        '''
+        return self._money
+
+    def bancrupts(self):
+        '''
+        Returns mask of bancrupt players.
+        '''
+        return self._bancrupts
+
+    def jail_rounds(self):
+        '''
+        Returns jail rounds of players.
+        '''
+        return self._jail_rounds
+
+    def get_out_cards(self):
+        '''
+        Returns numbers of get out of jail cards of players.
+        '''
+        return self._get_out_cards
+
+    def doubles(self):
+        '''
+        Returns doubles in row of players.
+        '''
+        return self._doubles
+
+    def owners(self):
+        '''
+        Returns ids of owners of fields.
+        '''
+        return self._owners
+
+    def levels(self):
+        '''
+        Returns levels of properties.
+        '''
+        return self._levels
+
+    def mortaged(self):
+        '''
+        Returns mask of mortaged fields.
+        '''
+        return self._mortaged
+
+    def current_players(self):
+        '''
+        Returns ids of players who have the move.
+        '''
+        return self._current_players
+
+    def current_rounds(self):
+        '''
+        Returns current rounds of games.
+        '''
+        return self._current_rounds
+
+    def finished(self):
+        '''
+        Returns mask of finished games.
+        '''
+        return self._finished
+
+    # TURN
+
+    def dices(self, number):
+        '''
+        Rolls two dices for given number of players.
+        Returns two arrays of results.
+        '''
+        result = self.random().integers(1, 7, size=(2, number))
+        return result[0], result[1]
+
+    def step(self):
+        '''
+        Rolls dices once for current player of every unfinished game.
+        Player who rolled a double and is still free keeps the move.
+        '''
+        games = np.flatnonzero(~self._finished)
+        if games.size == 0:
+            return
+        players = self._current_players[games]
+        arrested = self._jail_rounds[games, players] > 0
+        self._arrested_turn(games[arrested], players[arrested])
+        again = np.zeros(games.size, dtype=bool)
+        again[~arrested] = self._free_turn(games[~arrested],
+                                           players[~arrested])
+        self._next_players(games[~again])
+        self._check_end(games)
+
+    def run(self):
+        '''
+        Plays all games until they are finished.
+        '''
+        while not self._finished.all():
+            self.step()
+
+    def _free_turn(self, games, players):
+        '''
+        Roll of player who is not in jail.
+        Returns mask of players who rolled a double and keep the move.
+        '''
+        dice_1, dice_2 = self.dices(games.size)
+        double = dice_1 == dice_2
+        doubles = np.where(double, self._doubles[games, players] + 1, 0)
+        self._doubles[games, players] = doubles
+        three = doubles == MAX_DOUBLES_IN_ROW
+        self._arrest(games[three], players[three])
+        go = ~three
+        self._move_and_act(games[go], players[go], (dice_1 + dice_2)[go])
+        again = np.zeros(games.size, dtype=bool)
+        free = self._doubles[games[go], players[go]] > 0
+        alive = ~self._bancrupts[games[go], players[go]]
+        again[go] = free & alive
+        return again
+
+    def _arrested_turn(self, games, players):
+        '''
+        Turn of arrested player (see Gameplay.ai_arrested_turn).
+        '''
+        if games.size == 0:
+            return
+        stay = self._current_rounds[games] <= AI_ROUNDS_IN_JAIL
+        use_card = ~stay & (self._get_out_cards[games, players] > 0)
+        self._get_out_cards[games[use_card], players[use_card]] -= 1
+        self._release(games[use_card], players[use_card])
+        money = self._money[games, players]
+        deposit = ~stay & ~use_card & (money - DEPOSIT >= AI_MIN_MONEY)
+        self._money[games[deposit], players[deposit]] -= DEPOSIT
+        self._release(games[deposit], players[deposit])
+
+        roll = ~use_card & ~deposit
+        games = games[roll]
+        players = players[roll]
+        dice_1, dice_2 = self.dices(games.size)
+        double = dice_1 == dice_2
+        forced = ~double & (self._jail_rounds[games, players]
+                            == MAX_JAIL_ROUND)
+        stay_in_jail = ~double & ~forced
+        self._next_jail_round(games[stay_in_jail], players[stay_in_jail])
+        self._pay(games[forced], players[forced],
+                  np.full(forced.sum(), DEPOSIT))
+        leave = double | (forced & ~self._bancrupts[games, players])
+        self._release(games[leave], players[leave])
+        self._move_and_act(games[leave], players[leave],
+                           (dice_1 + dice_2)[leave])
+
+    def _next_players(self, games):
+        '''
+        Moves turn to next player who is not bancrupt.
+        '''
+        if games.size == 0:
+            return
+        number = self.number_of_players()
+        current = self._current_players[games]
+        candidates = current[:, None] + np.arange(1, number + 1)
+        alive = ~self._bancrupts[games[:, None], candidates % number]
+        chosen = candidates[np.arange(games.size), alive.argmax(axis=1)]
+        self._current_rounds[games] += chosen >= number
+        self._current_players[games] = chosen % number
+
+    def _check_end(self, games):
+        '''
+        Finishes games with one player left or after last round.
+        '''
+        alive = (~self._bancrupts[games]).sum(axis=1)
+        rounds = self._current_rounds[games] > self._number_of_rounds
+        self._finished[games] = (alive <= 1) | rounds
+
+    # JAIL
+
+    def next_jail_rounds(self, games=None):
+        '''
+        Increments jail round of all arrested players of given games,
+        of all games by default.
+        '''
+        if games is None:
+            games = slice(None)
+        rounds = self._jail_rounds[games]
+        rounds += rounds > 0
+        self._jail_rounds[games] = rounds
+
+    def _arrest(self, games, players):
+        self._positions[games, players] = JAIL_ID
+        self._jail_rounds[games, players] = 1
+        self._doubles[games, players] = 0
+
+    def _release(self, games, players):
+        self._jail_rounds[games, players] = 0
+
+    def _next_jail_round(self, games, players):
+        self._jail_rounds[games, players] += 1
+
+    # FIELD ACTIONS
+
+    def _move_and_act(self, games, players, totals):
+        '''
+        Moves players, pays for passing start, does action of field
+        (see Gameplay.field_action) and lets players build houses.
+        '''
+        if games.size == 0:
+            return
+        positions = self._positions[games, players] + totals
+        passed = positions >= NUMBER_OF_FIELDS
+        self._money[games[passed], players[passed]] += PAYMENT
+        positions %= NUMBER_OF_FIELDS
+        self._positions[games, players] = positions
+
+        kinds = self._tables.kinds()[positions]
+        jail = kinds == GO_TO_JAIL_KIND
+        self._arrest(games[jail], players[jail])
+        tax = kinds == TAX_KIND
+        taxes = self._tables.taxes()[positions[tax]]
+        self._pay(games[tax], players[tax], taxes)
+        draw = kinds == DRAW_KIND
+        self._chance(games[draw], players[draw])
+        buyable = ((kinds == PROPERTY_KIND) | (kinds == STATION_KIND)
+                   | (kinds == SERVICE_KIND))
+        self._stand_on_buyable(games[buyable], players[buyable],
+                               positions[buyable])
+
+        alive = ~self._bancrupts[games, players]
+        self._trade(games[alive], players[alive])
+        self._build_houses(games[alive], players[alive])
+
+    def _chance(self, games, players):
+        '''
+        Draws chance cards and does their actions (see Gameplay.chance).
+        '''
+        if games.size == 0:
+            return
+        cards = self.random().integers(0, NUMBER_OF_CHANCES, size=games.size)
+        owned = self._owners[games] == players[:, None]
+        fields_owned = owned.sum(axis=1)
+        houses = (self._levels[games] * owned).sum(axis=1)
+
+        gains = (CHANCE_GAINS[cards]
+                 + CHANCE_GAINS_PER_FIELD[cards] * fields_owned)
+        self._money[games, players] += gains
+        self._get_out_cards[games, players] += CHANCE_GET_OUT_CARDS[cards]
+        arrest = CHANCE_ARRESTS[cards]
+        self._arrest(games[arrest], players[arrest])
+
+        scratch = CHANCE_SCRATCH_CARDS[cards]
+        dice_1, dice_2 = self.dices(scratch.sum())
+        win = (dice_1 + dice_2) * np.where(dice_1 == dice_2, dice_1, 1)
+        self._money[games[scratch], players[scratch]] += win
+
+        fines = (CHANCE_FINES[cards] + CHANCE_FINES_PER_FIELD[cards]
+                 * fields_owned + CHANCE_FINES_PER_HOUSE[cards] * houses)
+        pay = fines > 0
+        self._pay(games[pay], players[pay], fines[pay])
+
+    def _stand_on_buyable(self, games, players, fields):
+        '''
+        Buys field, puts it for auction or pays rent
+        (see Gameplay.stand_on_buyable).
+        '''
+        if games.size == 0:
+            return
+        owners = self._owners[games, fields]
+        active = ~self._mortaged[games, fields]
+        bank = active & (owners < 0)
+        prices = self._tables.prices()[fields]
+        money = self._money[games, players]
+        buy = bank & (money - prices >= AI_MIN_MONEY)
+        self._money[games[buy], players[buy]] -= prices[buy]
+        self._owners[games[buy], fields[buy]] = players[buy]
+        auction = bank & ~buy
+        self._auction(games[auction], fields[auction],
+                      np.full(auction.sum(), START_BID))
+
+        rent = active & (owners >= 0) & (owners != players)
+        games = games[rent]
+        players = players[rent]
+        fields = fields[rent]
+        dice_1, dice_2 = self.dices(games.size)
+        rents = self.rents(games, fields, dice_1 + dice_2)
+        self._pay(games, players, rents, self._owners[games, fields])
+
+    def rents(self, games, fields, dices_totals):
+        '''
+        Returns rents of owned fields in given games
+        (see Property.get_rent, Station.get_rent, Service.get_rent).
+        Dices totals are used only by services.
+        '''
+        tables = self._tables
+        owners = self._owners[games, fields]
+        kinds = tables.kinds()[fields]
+        levels = self._levels[games, fields]
+
+        district_fields = tables.district_fields()[tables.districts()[fields]]
+        valid = district_fields >= 0
+        district_owners = self._owners[games[:, None],
+                                       np.where(valid, district_fields, 0)]
+        full = ((district_owners == owners[:, None]) | ~valid).all(axis=1)
+        property_rents = tables.rents()[fields, levels]
+        property_rents = property_rents * np.where(
+            (levels == 0) & full, 2, 1)
+
+        station_owners = self._owners[games[:, None], tables.station_ids()]
+        stations = (station_owners == owners[:, None]).sum(axis=1)
+        station_rents = tables.station_rents()[fields,
+                                               np.maximum(stations - 1, 0)]
+
+        service_owners = self._owners[games[:, None], tables.service_ids()]
+        services = (service_owners == owners[:, None]).sum(axis=1)
+        multipliers = tables.multipliers()[fields,
+                                           np.maximum(services - 1, 0)]
+
+        rents = np.where(kinds == PROPERTY_KIND, property_rents, 0)
+        rents = np.where(kinds == STATION_KIND, station_rents, rents)
+        return np.where(kinds == SERVICE_KIND, multipliers * dices_totals,
+                        rents)
+
+    # AUCTION
+
+    def _auction(self, games, fields, start_bids):
+        '''
+        Ascending auctions of fields between AI players
+        (see Gameplay.auction and AiPlayer.want_to_bid).
+        Every iteration asks next bidder of every running auction.
+        '''
+        if games.size == 0:
+            return
+        number = self.number_of_players()
+        indexes = np.arange(games.size)
+        participants = ~self._bancrupts[games]
+        participants[indexes, self._current_players[games]] = False
+        bidders = self._current_players[games].copy()
+        bids = start_bids.copy()
+        winners = np.full(games.size, -1)
+        made_first_bid = np.zeros(games.size, dtype=bool)
+        prices = self._tables.prices()[fields]
+        running = participants.any(axis=1)
+        while running.any():
+            auctions = np.flatnonzero(running)
+            candidates = bidders[auctions, None] + np.arange(1, number + 1)
+            candidates %= number
+            taking_part = participants[auctions[:, None], candidates]
+            bidder = candidates[np.arange(auctions.size),
+                                taking_part.argmax(axis=1)]
+            bidders[auctions] = bidder
+
+            bid = bids[auctions]
+            money = self._money[games[auctions], bidder]
+            draws = self.random().integers(1, 11, size=auctions.size)
+            want = ((money - (bid + BID_DIFFERENCE) >= AI_MIN_MONEY)
+                    & (bid + BID_DIFFERENCE <= prices[auctions])
+                    & (draws <= 9))
+            new_bid = np.where(made_first_bid[auctions],
+                               bid + BID_DIFFERENCE, start_bids[auctions])
+            bids[auctions] = np.where(want, new_bid, bid)
+            winners[auctions] = np.where(want, bidder, winners[auctions])
+            made_first_bid[auctions] |= want
+            participants[auctions[~want], bidder[~want]] = False
+
+            left = participants[auctions].sum(axis=1)
+            ended = (left == 0) | ((left == 1) & (winners[auctions] >= 0))
+            running[auctions[ended]] = False
+
+        sold = winners >= 0
+        sold[sold] = participants[indexes[sold], winners[sold]]
+        self._make_deals(games[sold], winners[sold], fields[sold], bids[sold])
+
+    def _make_deals(self, games, buyers, fields, prices):
+        '''
+        Buyers pay prices to owners of fields and take them over
+        (see Game.make_deal).
+        '''
+        sellers = self._owners[games, fields]
+        self._money[games, buyers] -= prices
+        sold = sellers >= 0
+        self._money[games[sold], sellers[sold]] += prices[sold]
+        self._owners[games, fields] = buyers
+
+    # TRADES
+
+    def _trade(self, games, players):
+        '''
+        Players ask owners of missing properties of districts in which
+        they have all but one property to sell them (see Gameplay.ai_actions
+        and Gameplay.ai_owned_trade). Owner prices field and buyer accepts
+        price (see AiPlayer.pricing and AiPlayer.reply_for_pricing).
+        Districts are traded one after another in order of DISTRICTS_SIZES.
+        '''
+        if games.size == 0:
+            return
+        prices = self._tables.prices()
+        indexes = np.arange(games.size)
+        for row in self._tables.district_fields():
+            district = row[row >= 0]
+            owners = self._owners[games[:, None], district]
+            owned = owners == players[:, None]
+            missing = (~owned).argmax(axis=1)
+            fields = district[missing]
+            sellers = owners[indexes, missing]
+            offer = ((owned.sum(axis=1) == district.size - 1)
+                     & (sellers >= 0) & ~self._mortaged[games, fields])
+            offer_games = games[offer]
+            buyers = players[offer]
+            fields = fields[offer]
+            price = prices[fields]
+            pricings = self.random().integers(price, 2 * price + 1)
+            accepted = self.random().integers(price, 2 * price + 1)
+            money = self._money[offer_games, buyers]
+            buy = ((money - price >= AI_MIN_MONEY) & (pricings <= accepted)
+                   & (money >= pricings))
+            self._make_deals(offer_games[buy], buyers[buy], fields[buy],
+                             pricings[buy])
+
+    # HOUSES
+
+    def _build_houses(self, games, players):
+        '''
+        Players build houses in one random full district
+        (see Gameplay.ai_actions and AiPlayer.build_houses_ids).
+        '''
+        if games.size == 0:
+            return
+        tables = self._tables
+        district_fields = tables.district_fields()
+        valid = district_fields >= 0
+        safe_fields = np.where(valid, district_fields, 0)
+        owned = self._owners[games][:, safe_fields] == players[:, None, None]
+        full = (owned | ~valid).all(axis=2)
+        keys = np.where(full, self.random().random(full.shape), -1)
+        districts = keys.argmax(axis=1)
+        chosen = full.any(axis=1)
+
+        fields = safe_fields[districts]
+        in_district = valid[districts]
+        mortaged = (self._mortaged[games[:, None], fields]
+                    & in_district).any(axis=1)
+        for index in range(district_fields.shape[1]):
+            field = fields[:, index]
+            house_price = tables.house_prices()[field]
+            levels = self._levels[games[:, None], fields]
+            min_level = np.where(in_district, levels,
+                                 MAX_PROPERTY_LEVEL).min(axis=1)
+            level = levels[:, index]
+            money = self._money[games, players]
+            build = (chosen & in_district[:, index] & ~mortaged
+                     & (money - house_price >= AI_MIN_MONEY_TO_UPGRADE)
+                     & (level < MAX_PROPERTY_LEVEL) & (level <= min_level))
+            self._levels[games[build], field[build]] += 1
+            self._money[games[build], players[build]] -= house_price[build]
+
+    # PAYMENTS AND BANCRUPTION
+
+    def _pay(self, games, players, amounts, creditors=None):
+        '''
+        Players pay amounts to creditors, -1 or None means bank
+        (see Gameplay.force_to_pay). Players without enough money
+        are resolved one by one.
+        '''
+        if games.size == 0:
+            return
+        if creditors is None:
+            creditors = np.full(games.size, -1)
+        enough = self._money[games, players] >= amounts
+        self._money[games[enough], players[enough]] -= amounts[enough]
+        paid = enough & (creditors >= 0)
+        self._money[games[paid], creditors[paid]] += amounts[paid]
+        for index in np.flatnonzero(~enough):
+            self._force_to_pay(games[index], players[index],
+                               amounts[index], creditors[index])
+
+    def _force_to_pay(self, game, player, amount, creditor):
+        '''
+        Player sells houses and fields to pay amount
+        or becomes bancrupt (see Gameplay.no_money_action).
+        '''
+        if self._fortune(game, player) >= amount:
+            self._earn_money(game, player, amount)
+            self._money[game, player] -= amount
+            if creditor >= 0:
+                self._money[game, creditor] += amount
+        else:
+            self._bancrupt(game, player, creditor)
+
+    def _fortune(self, game, player):
+        '''
+        Returns fortune of one player (see Player.fortune).
+        '''
+        tables = self._tables
+        owned = self._owners[game] == player
+        values = np.where(self._mortaged[game], 0, tables.prices() // 2)
+        values = values + self._levels[game] * tables.house_prices() // 2
+        return self._money[game, player] + values[owned].sum()
+
+    def fortunes(self):
+        '''
+        Returns fortunes of all players, 0 for bancrupts.
+        '''
+        tables = self._tables
+        values = np.where(self._mortaged, 0, tables.prices() // 2)
+        values = values + self._levels * tables.house_prices() // 2
+        number = self.number_of_players()
+        owned = self._owners[:, None, :] == np.arange(number)[None, :, None]
+        fortunes = self._money + (owned * values[:, None, :]).sum(axis=2)
+        return np.where(self._bancrupts, 0, fortunes)
+
+    def _earn_money(self, game, player, debt):
+        '''
+        Sells houses and then fields of player until he has debt
+        (see AiPlayer.earn_from_houses and AiPlayer.earn_from_fields).
+        '''
+        tables = self._tables
+        owners = self._owners[game]
+        levels = self._levels[game]
+        owned = np.flatnonzero(owners == player)
+        for _ in range(MAX_PROPERTY_LEVEL):
+            for field in owned:
+                if tables.kinds()[field] == PROPERTY_KIND and levels[field]:
+                    district = tables.district_fields()[
+                        tables.districts()[field]]
+                    district = district[district >= 0]
+                    district = district[owners[district] == player]
+                    if levels[field] >= levels[district].max():
+                        levels[field] -= 1
+                        self._money[game, player] += \
+                            tables.house_prices()[field] // 2
+                if self._money[game, player] >= debt:
+                    return
+        for field in owned:
+            if not self._mortaged[game, field]:
+                owners[field] = -1
+                self._money[game, player] += tables.prices()[field] // 2
+            if self._money[game, player] >= debt:
+                return
+
+    def _bancrupt(self, game, player, creditor):
+        '''
+        Player becomes bancrupt. Creditor takes over his fortune
+        (see Game.debt_to_player) or bank puts his fields for auction
+        (see Game.debt_to_bank).
+        '''
+        tables = self._tables
+        owned = np.flatnonzero(self._owners[game] == player)
+        houses = self._levels[game, owned] * tables.house_prices()[owned] // 2
+        self._levels[game, owned] = 0
+        if creditor >= 0:
+            mortaged = self._mortaged[game, owned]
+            interests = (tables.prices()[owned] // 2 // 10 * mortaged).sum()
+            self._money[game, creditor] += (houses.sum()
+                                            + self._money[game, player]
+                                            - interests)
+            self._get_out_cards[game, creditor] += \
+                self._get_out_cards[game, player]
+            self._owners[game, owned] = creditor
+        else:
+            self._owners[game, owned] = -1
+            self._mortaged[game, owned] = False
+        self._money[game, player] = 0
+        self._get_out_cards[game, player] = 0
+        self._release(game, player)
+        self._doubles[game, player] = 0
+        self._positions[game, player] = -1
+        self._bancrupts[game, player] = True
+        if creditor < 0:
+            for field in owned:
+                self._auction(np.array([game]), np.array([field]),
+                              np.array([START_BID]))
+
+    # RESULTS
+
+    def winners(self):
+        '''
+        Returns mask of winners: the only player who is not
+        bancrupt or players with the highest fortune.
+        '''
+        fortunes = self.fortunes()
+        richest = fortunes == fortunes.max(axis=1, keepdims=True)
+        return richest & ~self._bancrupts
+
+    def rounds_played(self):
+        '''
+        Returns number of rounds played in every game.
+        '''
+        return np.minimum(self._current_rounds, self._number_of_rounds)
@@ -0,0 +1,85 @@
+'''
+Benchmarks of game engine.
+'''
+from modules.simulation import Simulation, create_ai_game
+from modules.fields import BuyableField
+from modules.constants import START_MONEY
+from time import perf_counter
+import tracemalloc
+import sys
+
+
+def instance_size(instance) -> int:
+    '''
+    Returns size of object with its attributes dict if it has one.
+    Values of attributes are not counted.
+    '''
+    size = sys.getsizeof(instance)
+    if hasattr(instance, '__dict__'):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def bytes_per_game(number_of_games: int, number_of_players: int = 4,
+                   number_of_rounds: int = 0) -> float:
+    '''
+    Returns mean number of bytes allocated by game kept in memory.
+    Every game is played for given number of rounds before measure.
+    '''
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        games = []
+        for seed in range(number_of_games):
+            game = create_ai_game(number_of_players,
+                                  max(number_of_rounds, 1), seed)
+            if number_of_rounds:
+                Simulation(game).run()
+            games.append(game)
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return used / number_of_games
+
+
+def landing_time(number_of_landings: int = 40000) -> float:
+    '''
+    Returns mean time in seconds of action after standing on field.
+    Player stands in turn on every field of board and pays rent
+    for every buyable field, which are all owned by other player.
+    His money is restored before every landing, so he never goes bancrupt.
+    '''
+    game = create_ai_game(2, seed=0)
+    gameplay = Simulation(game).gameplay()
+    player, owner = game.players().values()
+    for field in game.fields().values():
+        if isinstance(field, BuyableField):
+            game.make_deal(owner, field, 0)
+    positions = list(game.fields())
+    start = perf_counter()
+    for index in range(number_of_landings):
+        player.set_money(START_MONEY)
+        player.set_position(positions[index % len(positions)])
+        gameplay.field_action()
+        if player.in_jail_round():
+            game.leave_jail(player)
+    return (perf_counter() - start) / number_of_landings
+
+
+def memory_report(number_of_games: int, number_of_players: int = 4,
+                  number_of_rounds: int = 20) -> dict:
+    '''
+    Returns bytes per new game, per played game
+    and sizes of instances of every field and player class.
+    '''
+    game = create_ai_game(number_of_players)
+    instances = {}
+    for field in game.fields().values():
+        instances[type(field).__name__] = instance_size(field)
+    instances['AiPlayer'] = instance_size(game.players()[0])
+    return {
+        'new_game': bytes_per_game(number_of_games, number_of_players),
+        'played_game': bytes_per_game(number_of_games, number_of_players,
+                                      number_of_rounds),
+        'instances': instances,
+    }
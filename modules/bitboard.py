@@ -0,0 +1,175 @@
+'''
+Bitboards of fields. Set of fields of 40-field board is kept
+in one integer, field with given id is bit number id. Masks of districts,
+stations and services are precomputed from field ids, so checks
+of player's fields take one AND and popcount instead of loop over fields.
+'''
+from modules.constants import (PROPERTY_IDS, STATION_IDS, SERVICE_IDS,
+                               DISTRICTS_SIZES)
+from modules.fields import Property
+
+
+def field_mask(ids) -> int:
+    '''
+    Returns bitboard of fields with given ids.
+    '''
+    mask = 0
+    for id in ids:
+        mask |= 1 << id
+    return mask
+
+
+def mask_ids(mask: int) -> list:
+    '''
+    Returns ids of fields in bitboard in ascending order.
+    '''
+    ids = []
+    while mask:
+        lowest = mask & -mask
+        ids.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return ids
+
+
+def district_masks() -> dict:
+    '''
+    Returns bitboards of districts by district name. Properties
+    of districts follow each other in PROPERTY_IDS in order
+    of DISTRICTS_SIZES.
+    '''
+    masks = {}
+    start = 0
+    for name, size in DISTRICTS_SIZES.items():
+        masks[name] = field_mask(PROPERTY_IDS[start:start + size])
+        start += size
+    return masks
+
+
+DISTRICT_MASKS = district_masks()
+STATIONS_MASK = field_mask(STATION_IDS)
+SERVICES_MASK = field_mask(SERVICE_IDS)
+
+
+class Bitboard:
+    '''
+    Class Bitboard. Fields owned by player kept as bitboards,
+    updated with player's indexes of fields.
+
+    Attributes
+    ---------
+    _owned: int
+        owned fields
+    _mortaged: int
+        owned mortaged fields
+    _built: int
+        owned properties with at least one house
+
+    Methods
+    -------
+    owned:
+        getter
+    mortaged:
+        getter
+    built:
+        getter
+    add:
+        add field to bitboards
+    remove:
+        remove field from bitboards
+    district_count:
+        number of owned properties in district
+    owns_district:
+        checks if all properties of district are owned
+    district_mortaged:
+        checks if any owned property in district is mortaged
+    district_built:
+        checks if any owned property in district has houses
+    stations:
+        number of owned stations
+    services:
+        number of owned services
+    '''
+    __slots__ = ('_owned', '_mortaged', '_built')
+
+    def __init__(self):
+        '''
+        Creates empty Bitboard.
+        '''
+        self._owned = 0
+        self._mortaged = 0
+        self._built = 0
+
+    def owned(self) -> int:
+        '''
+        Returns bitboard of owned fields.
+        '''
+        return self._owned
+
+    def mortaged(self) -> int:
+        '''
+        Returns bitboard of owned mortaged fields.
+        '''
+        return self._mortaged
+
+    def built(self) -> int:
+        '''
+        Returns bitboard of owned properties with houses.
+        '''
+        return self._built
+
+    def add(self, field) -> None:
+        '''
+        Add field in its current state to bitboards.
+        '''
+        bit = 1 << field.id()
+        self._owned |= bit
+        if field.mortaged():
+            self._mortaged |= bit
+        if isinstance(field, Property) and field.level() > 0:
+            self._built |= bit
+
+    def remove(self, field) -> None:
+        '''
+        Remove field from bitboards.
+        '''
+        bit = ~(1 << field.id())
+        self._owned &= bit
+        self._mortaged &= bit
+        self._built &= bit
+
+    def district_count(self, name: str) -> int:
+        '''
+        Returns number of owned properties in district.
+        '''
+        return (self._owned & DISTRICT_MASKS[name]).bit_count()
+
+    def owns_district(self, name: str) -> bool:
+        '''
+        Checks if all properties of district are owned.
+        '''
+        mask = DISTRICT_MASKS[name]
+        return self._owned & mask == mask
+
+    def district_mortaged(self, name: str) -> bool:
+        '''
+        Checks if any owned property in district is mortaged.
+        '''
+        return self._mortaged & DISTRICT_MASKS[name] != 0
+
+    def district_built(self, name: str) -> bool:
+        '''
+        Checks if any owned property in district has houses.
+        '''
+        return self._built & DISTRICT_MASKS[name] != 0
+
+    def stations(self) -> int:
+        '''
+        Returns number of owned stations.
+        '''
+        return (self._owned & STATIONS_MASK).bit_count()
+
+    def services(self) -> int:
+        '''
+        Returns number of owned services.
+        '''
+        return (self._owned & SERVICES_MASK).bit_count()
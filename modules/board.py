@@ -0,0 +1,204 @@
+'''
+Board definitions compiled from fields config.
+Config is parsed and validated once, compiled board is cached
+in memory and on disk. Cache is invalidated by hash of config file.
+'''
+from modules.constants import (FIELDS_PATH, BOARD_CACHE_PATH, START_ID,
+                               JAIL_ID, PARKING_ID, GO_TO_JAIL_ID,
+                               PROPERTY_IDS, TAX_IDS, STATION_IDS,
+                               SERVICE_IDS, DRAW_FIELD_IDS, START_KIND,
+                               PROPERTY_KIND, DRAW_KIND, TAX_KIND,
+                               STATION_KIND, JAIL_KIND, SERVICE_KIND,
+                               PARKING_KIND, GO_TO_JAIL_KIND)
+from modules.fields import (Start, Jail, Parking, GoToJail, Property, Tax,
+                            Station, Service, DrawField)
+from hashlib import blake2b
+import inspect
+import json
+import os
+import pickle
+
+
+FIELD_CLASSES = {START_ID: Start, JAIL_ID: Jail, PARKING_ID: Parking,
+                 GO_TO_JAIL_ID: GoToJail}
+FIELD_CLASSES.update({id: Property for id in PROPERTY_IDS})
+FIELD_CLASSES.update({id: Tax for id in TAX_IDS})
+FIELD_CLASSES.update({id: Station for id in STATION_IDS})
+FIELD_CLASSES.update({id: Service for id in SERVICE_IDS})
+FIELD_CLASSES.update({id: DrawField for id in DRAW_FIELD_IDS})
+
+# field class -> kind of field, fields of other classes have no action
+FIELD_KINDS = {Start: START_KIND, Jail: JAIL_KIND, Parking: PARKING_KIND,
+               GoToJail: GO_TO_JAIL_KIND, Property: PROPERTY_KIND,
+               Tax: TAX_KIND, Station: STATION_KIND, Service: SERVICE_KIND,
+               DrawField: DRAW_KIND}
+
+# version of compiled board, changed with attributes of fields definitions
+CACHE_FORMAT = b'2'
+
+# compiled boards of read config files: path -> (stat signature, board)
+_boards = {}
+
+
+class Board:
+    '''
+    Class Board. Parsed and validated board definition.
+    Creates fields of new games.
+
+    Attributes:
+    -----------
+    _data: dict
+        fields config
+    _digest: str
+        hash of config file
+    _prototypes: dict
+        validated fields in starting state sorted by id
+
+    Methods:
+    -------
+    data:
+        getter
+    digest:
+        getter
+    prototypes:
+        getter
+    create_fields:
+        creates new fields of game
+    '''
+    def __init__(self, data: dict, digest: str = None):
+        '''
+        Compiles board from fields config.
+        Config is validated by creating prototypes of fields.
+        '''
+        prototypes = {}
+        for key in data:
+            id = int(key)
+            if id in FIELD_CLASSES:
+                prototypes[id] = FIELD_CLASSES[id](data[key])
+        self._data = data
+        self._digest = digest
+        self._prototypes = dict(sorted(prototypes.items()))
+
+    def data(self) -> dict:
+        '''
+        Returns fields config.
+        '''
+        return self._data
+
+    def digest(self) -> str:
+        '''
+        Returns hash of config file.
+        '''
+        return self._digest
+
+    def prototypes(self) -> dict:
+        '''
+        Returns validated fields in starting state sorted by id.
+        '''
+        return self._prototypes
+
+    def create_fields(self) -> dict:
+        '''
+        Returns new fields of game sorted by id.
+        '''
+        return {id: field.clone() for id, field in self._prototypes.items()}
+
+
+def field_kind(field) -> int:
+    '''
+    Returns kind of field by its class or nearest base class,
+    fields of unknown classes are parking fields.
+    '''
+    for cls in type(field).__mro__:
+        if cls in FIELD_KINDS:
+            return FIELD_KINDS[cls]
+    return PARKING_KIND
+
+
+def field_kinds(fields: dict) -> dict:
+    '''
+    Returns kinds of given fields by field id.
+    '''
+    return {id: field_kind(field) for id, field in fields.items()}
+
+
+def source_digest(paths) -> bytes:
+    '''
+    Returns hash of source files of compiled board,
+    empty if they cannot be read.
+    '''
+    digest = blake2b(digest_size=16)
+    try:
+        for path in paths:
+            with open(path, 'rb') as handle:
+                digest.update(handle.read())
+    except OSError:
+        return b''
+    return digest.digest()
+
+
+# hash of code of board and fields, changed with classes of pickled board
+SOURCE_DIGEST = source_digest([__file__, inspect.getfile(Property)])
+
+
+def config_digest(content: bytes) -> str:
+    '''
+    Returns hash of fields config, format of compiled board
+    and source of board and fields, so cache of board compiled
+    by older version of code is not read.
+    '''
+    return blake2b(CACHE_FORMAT + SOURCE_DIGEST + content,
+                   digest_size=16).hexdigest()
+
+
+def read_cache(cache_path: str, digest: str):
+    '''
+    Returns board saved in cache file if it was compiled
+    from config with given hash, else None.
+    '''
+    try:
+        with open(cache_path, 'rb') as handle:
+            board = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError):
+        return None
+    if not isinstance(board, Board) or board.digest() != digest:
+        return None
+    return board
+
+
+def write_cache(cache_path: str, board: Board) -> None:
+    '''
+    Saves board to cache file, cache is skipped if it cannot be written.
+    '''
+    try:
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        with open(cache_path, 'wb') as handle:
+            pickle.dump(board, handle)
+    except OSError:
+        pass
+
+
+def load_board(path: str = FIELDS_PATH,
+               cache_path: str = BOARD_CACHE_PATH) -> Board:
+    '''
+    Returns compiled board of fields config. Config is compiled only
+    if it is not cached in memory or on disk with the same hash.
+    '''
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _boards.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, 'rb') as handle:
+        content = handle.read()
+    digest = config_digest(content)
+    if cached is not None and cached[1].digest() == digest:
+        board = cached[1]
+    else:
+        board = read_cache(cache_path, digest)
+        if board is None:
+            board = Board(json.loads(content), digest)
+            write_cache(cache_path, board)
+    _boards[path] = (signature, board)
+    return board
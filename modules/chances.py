@@ -1,6 +1,13 @@
 '''
-Chances cards descriptions.
+Chances cards descriptions and effects.
+Effect of card is its kind and value, so new cards
+are added only by adding their descriptions and effects.
 '''
+from modules.constants import (NOTHING_EFFECT, GAIN_EFFECT,
+                               GAIN_PER_FIELD_EFFECT, FINE_EFFECT,
+                               FINE_PER_FIELD_EFFECT, FINE_PER_HOUSE_EFFECT,
+                               ARREST_EFFECT, GET_OUT_CARD_EFFECT,
+                               SCRATCH_CARD_EFFECT)
 
 CHANCES = {
         0: 'Zwrot podatku. Pobierz 30$.\n',
@@ -43,3 +50,28 @@ CHANCES = {
 
         16: 'Wyjdź bezpłatnie z więzienia.\n'
 }
+
+# id -> (kind of effect, value)
+CHANCE_EFFECTS = {
+        0: (GAIN_EFFECT, 30),
+        1: (ARREST_EFFECT, 0),
+        2: (GAIN_EFFECT, 150),
+        3: (GAIN_EFFECT, 10),
+        4: (NOTHING_EFFECT, 0),
+        5: (FINE_EFFECT, 200),
+        6: (GET_OUT_CARD_EFFECT, 1),
+        7: (GAIN_EFFECT, 50),
+        8: (FINE_PER_FIELD_EFFECT, 20),
+        9: (FINE_EFFECT, 15),
+        10: (FINE_PER_HOUSE_EFFECT, 25),
+        11: (GAIN_PER_FIELD_EFFECT, 20),
+        12: (GAIN_EFFECT, 100),
+        13: (FINE_EFFECT, 100),
+        14: (ARREST_EFFECT, 0),
+        15: (SCRATCH_CARD_EFFECT, 0),
+        16: (GET_OUT_CARD_EFFECT, 1)
+}
+
+NUMBER_OF_CHANCES = len(CHANCE_EFFECTS)
+GO_TO_JAIL_CHANCES_IDS = [id for id, (kind, value) in CHANCE_EFFECTS.items()
+                          if kind == ARREST_EFFECT]
@@ -5,7 +5,12 @@ MIN_NUMBER_OF_ROUNDS = 1
 DEPOSIT = 50
 START_BID = 10
 BID_DIFFERENCE = 10
+OPEN_AUCTION = 0
+FIRST_PRICE_AUCTION = 1
+VICKREY_AUCTION = 2
+AUCTION_MODES = (OPEN_AUCTION, FIRST_PRICE_AUCTION, VICKREY_AUCTION)
 FIELDS_PATH = 'modules/fields.json'
+BOARD_CACHE_PATH = 'modules/__pycache__/fields.cache'
 NUMBER_OF_FIELDS = 40
 START_ID = 0
 JAIL_ID = 10
@@ -33,3 +38,58 @@ DISTRICTS_SIZES = {
 MAX_NUMBER_OF_PLAYERS = 6
 MIN_NUMBER_OF_PLAYERS = 2
 MAX_NAME_LENGTH = 15
+MAX_JAIL_ROUND = 3
+MAX_DOUBLES_IN_ROW = 3
+
+# kinds of effects of chance cards
+NOTHING_EFFECT = 0
+GAIN_EFFECT = 1
+GAIN_PER_FIELD_EFFECT = 2
+FINE_EFFECT = 3
+FINE_PER_FIELD_EFFECT = 4
+FINE_PER_HOUSE_EFFECT = 5
+ARREST_EFFECT = 6
+GET_OUT_CARD_EFFECT = 7
+SCRATCH_CARD_EFFECT = 8
+
+# ai
+AI_MIN_MONEY = 300
+AI_MIN_MONEY_TO_UPGRADE = 500
+AI_ROUNDS_IN_JAIL = 5
+AI_PASS_PROBABILITY = 0.1
+
+# zobrist hashing
+ZOBRIST_COUNTER_LIMIT = 8
+
+# simulation
+SIMULATION_ROUNDS = 100
+TASKS_PER_PROCESS = 4
+EVENTS_CAPACITY = 65536
+KEYFRAME_INTERVAL = 100
+
+# reasons why action on field is not allowed
+ALLOWED = 0
+NOT_OWNED = 1
+ALREADY_MORTAGED = 2
+NOT_MORTAGED = 3
+BUILT_UP = 4
+DISTRICT_MORTAGED = 5
+NOT_OWNED_DISTRICT = 6
+MAX_LEVEL = 7
+MIN_LEVEL = 8
+UNEQUAL_BUILDING = 9
+NO_MONEY = 10
+
+# field kinds used by array based engines
+START_KIND = 0
+PROPERTY_KIND = 1
+DRAW_KIND = 2
+TAX_KIND = 3
+STATION_KIND = 4
+JAIL_KIND = 5
+SERVICE_KIND = 6
+PARKING_KIND = 7
+GO_TO_JAIL_KIND = 8
+
+# debug
+CHECK_FORTUNE = False
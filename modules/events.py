@@ -0,0 +1,147 @@
+'''
+Binary log of game events.
+Every event is fixed-width record (turn, kind, player, target, value).
+'''
+from modules.constants import EVENTS_CAPACITY
+from struct import Struct
+
+
+RECORD = Struct('<IBbbi')
+
+# kinds of events, meaning of target and value in comments
+TURN = 0            # value: current round
+ROLL = 1            # roll of current player, target: dice 1, value: dice 2
+DICES = 2           # other roll, target: dice 1, value: dice 2
+MOVE = 3            # target: new position
+INCOME = 4          # bank pays player, value: amount
+CHARGE = 5          # player pays bank, value: amount
+TRANSFER = 6        # player pays other player, target: receiver id
+PURCHASE = 7        # target: field id, value: price paid to owner or bank
+BID = 8             # target: field id, value: bid
+MORTGAGE = 9        # target: field id, value: money from bank
+END_MORTGAGE = 10   # target: field id, value: money paid to bank
+BUILD = 11          # target: field id, value: house price
+SELL_HOUSE = 12     # target: field id, value: money from bank
+SELL_FIELD = 13     # target: field id, value: money from bank
+ARREST = 14
+RELEASE = 15
+JAIL_ROUND = 16
+CHANCE = 17         # target: card id
+GET_OUT_CARD = 18   # value: change of number of cards
+BANCRUPTCY = 19     # target: creditor id, -1 for bank
+
+
+class EventLog:
+    '''
+    Class EventLog. Append-only log of game events.
+    Events are packed into preallocated buffer and written
+    to file in bulk when buffer is full. Log without file
+    keeps all events in memory and grows its buffer.
+
+    Attributes:
+    -----------
+    _handle: binary file or None
+        file to which events are flushed
+    _buffer: bytearray
+        packed events not flushed yet
+    _capacity: int
+        number of events fitting in buffer
+    _length: int
+        number of events in buffer
+    _flushed: int
+        number of events written to file
+    _turn: int
+        number of current turn
+
+    Methods:
+    -------
+    turn:
+        getter
+    length:
+        number of recorded events
+    record:
+        appends event
+    next_turn:
+        starts new turn
+    flush:
+        writes buffered events to file
+    events:
+        iterates over events kept in memory
+    '''
+    def __init__(self, handle=None, capacity: int = EVENTS_CAPACITY):
+        '''
+        Creates EventLog writing to given binary file.
+        '''
+        if capacity <= 0:
+            raise ValueError('Capacity must be positive.')
+        self._handle = handle
+        self._buffer = bytearray(capacity * RECORD.size)
+        self._capacity = capacity
+        self._length = 0
+        self._flushed = 0
+        self._turn = 0
+
+    def turn(self) -> int:
+        '''
+        Returns number of current turn.
+        '''
+        return self._turn
+
+    def length(self) -> int:
+        '''
+        Returns number of recorded events.
+        '''
+        return self._flushed + self._length
+
+    def record(self, kind: int, player: int, target: int = -1,
+               value: int = 0) -> None:
+        '''
+        Appends event to log.
+        '''
+        if self._length == self._capacity:
+            if self._handle is not None:
+                self.flush()
+            else:
+                self._buffer.extend(bytes(len(self._buffer)))
+                self._capacity *= 2
+        RECORD.pack_into(self._buffer, self._length * RECORD.size,
+                         self._turn, kind, player, target, value)
+        self._length += 1
+
+    def next_turn(self, player: int, round: int) -> None:
+        '''
+        Starts new turn of player and records it.
+        '''
+        self._turn += 1
+        self.record(TURN, player, -1, round)
+
+    def flush(self) -> None:
+        '''
+        Writes buffered events to file.
+        '''
+        if self._handle is None:
+            return
+        size = self._length * RECORD.size
+        self._handle.write(memoryview(self._buffer)[:size])
+        self._flushed += self._length
+        self._length = 0
+
+    def events(self):
+        '''
+        Iterates over events kept in memory
+        as tuples (turn, kind, player, target, value).
+        '''
+        size = self._length * RECORD.size
+        return RECORD.iter_unpack(memoryview(self._buffer)[:size])
+
+
+def read_events(handle, chunk: int = EVENTS_CAPACITY):
+    '''
+    Iterates over events written to binary file
+    as tuples (turn, kind, player, target, value).
+    '''
+    while True:
+        data = handle.read(chunk * RECORD.size)
+        if not data:
+            return
+        yield from RECORD.iter_unpack(data)
@@ -87,3 +87,23 @@ class NotArrestedError(Exception):
 class RepeatedIdError(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__('Id is repated.')
+
+
+class HumanPlayerError(Exception):
+    def __init__(self, *args: object) -> None:
+        super().__init__('Headless game can be played only by AI players.')
+
+
+class SnapshotError(Exception):
+    def __init__(self, *args: object) -> None:
+        super().__init__('Snapshot is damaged or has unknown format.')
+
+
+class FortuneError(Exception):
+    def __init__(self, *args: object) -> None:
+        super().__init__('Fortune of player differs from calculated one.')
+
+
+class AuctionModeError(Exception):
+    def __init__(self, *args: object) -> None:
+        super().__init__('Unknown auction mode.')
@@ -1,23 +1,112 @@
 from modules.exceptions import (WrongIdError, BuiltUpError, NotMortagedError,
                                 NotOwnedError, PropertyLevelError,
                                 NoMoneyError, AlreadyMortagedError,
-                                NotOwnedDistrictError, UnequalBuildingError,
-                                AlreadyArrestedError, NotArrestedError)
-from modules.constants import (DISTRICTS_SIZES, MAX_PROPERTY_LEVEL,
-                               NUMBER_OF_STATIONS, NUMBER_OF_SERVICES)
+                                NotOwnedDistrictError, UnequalBuildingError)
+from modules.constants import (MAX_PROPERTY_LEVEL,
+                               NUMBER_OF_STATIONS, NUMBER_OF_SERVICES,
+                               ALLOWED, NOT_OWNED, ALREADY_MORTAGED,
+                               NOT_MORTAGED, BUILT_UP, DISTRICT_MORTAGED,
+                               NOT_OWNED_DISTRICT, MAX_LEVEL, MIN_LEVEL,
+                               UNEQUAL_BUILDING, NO_MONEY)
+from modules.zobrist import OWNER, LEVEL, MORTAGED
 from termcolor import colored
 
 
+# exceptions raised by actions which are not allowed for given reason
+ELIGIBILITY_ERRORS = {
+    NOT_OWNED: NotOwnedError,
+    ALREADY_MORTAGED: AlreadyMortagedError,
+    NOT_MORTAGED: NotMortagedError,
+    BUILT_UP: BuiltUpError,
+    DISTRICT_MORTAGED: AlreadyMortagedError,
+    NOT_OWNED_DISTRICT: NotOwnedDistrictError,
+    MAX_LEVEL: PropertyLevelError,
+    MIN_LEVEL: PropertyLevelError,
+    UNEQUAL_BUILDING: UnequalBuildingError,
+    NO_MONEY: NoMoneyError,
+}
+
+
+def check_allowed(reason: int) -> bool:
+    '''
+    Raises exception matching reason if action is not allowed,
+    else returns True.
+    '''
+    if reason != ALLOWED:
+        raise ELIGIBILITY_ERRORS[reason]
+    return True
+
+
+def read_table(values: dict, first: int) -> tuple:
+    '''
+    Converts table from config keyed by numbers written as strings,
+    starting from first, to tuple indexed from zero.
+    '''
+    keys = [str(number) for number in range(first, first + len(values))]
+    if sorted(values) != sorted(keys):
+        raise ValueError('Wrong keys of table.')
+    return tuple(values[key] for key in keys)
+
+
+class FieldDefinition:
+    '''
+    Class FieldDefinition. Static data of field read from config.
+    Definition is shared by fields of all games created from the same
+    board and it is not changed after its field is created.
+    Attributes which do not concern kind of field are None.
+
+    Attributes
+    ---------
+    id: int
+        identify of field
+    name: str
+        name of field
+    value: int
+        tax value
+    price: int
+        price of buying empty field
+    mortage_value: int
+        money that can be recived for mortage in bank
+    district: str
+        color of property district
+    house_price: int
+        cost of building house or hotel
+    rents: tuple
+        rents of property or station
+    multipliers: tuple
+        multipliers of dices of service
+    rent_table: tuple
+        rents of buyable field indexed by its state (see rent_index),
+        multipliers of dices for service
+    '''
+    __slots__ = ('id', 'name', 'value', 'price', 'mortage_value',
+                 'district', 'house_price', 'rents', 'multipliers',
+                 'rent_table')
+
+    def __init__(self, id: int, name: str):
+        '''
+        Creates definition of field with given id and name.
+        '''
+        self.id = id
+        self.name = name
+        self.value = None
+        self.price = None
+        self.mortage_value = None
+        self.district = None
+        self.house_price = None
+        self.rents = None
+        self.multipliers = None
+        self.rent_table = None
+
+
 class Field:
     '''
     A basic class to represent field on Monopoly's board.
 
     Attributes
     ---------
-    _id: int
-        identify of field [0; number_of_fields)
-    _name: str
-        name of field
+    _definition: FieldDefinition
+        static data of field, id [0; number_of_fields) and name
 
     Methods
     -------
@@ -25,11 +114,18 @@ class Field:
         getter
     name:
         getter
+    definition:
+        getter
     short description:
         generates short description (id and name)
     description:
         generates long description
+    zobrist_state:
+        values of state in hash of game
+    clone:
+        new field with the same definition in starting state
     '''
+    __slots__ = ('_definition',)
 
     def __init__(self, data: dict):
         '''
@@ -38,21 +134,25 @@ class Field:
         _id = data['id']
         if _id < 0:
             raise WrongIdError
-        else:
-            self._id = _id
-        self._name = data['name']
+        self._definition = FieldDefinition(_id, data['name'])
 
     def id(self):
         '''
         Returns field's id.
         '''
-        return self._id
+        return self._definition.id
 
     def name(self):
         '''
         Returns field's name
         '''
-        return self._name
+        return self._definition.name
+
+    def definition(self):
+        '''
+        Returns static data of field.
+        '''
+        return self._definition
 
     def short_description(self):
         '''
@@ -72,6 +172,23 @@ class Field:
         line_2 = '{:<15}{:>25}\n'.format('ID:', self.id())
         return line_1 + line_2
 
+    def zobrist_state(self):
+        '''
+        Returns values of field's state in hash of game,
+        field without owner has no such state.
+        '''
+        return ()
+
+    def clone(self):
+        '''
+        Returns new field sharing definition with this one,
+        in starting state. Skips validation of config, used to create
+        fields of new game from compiled board.
+        '''
+        field = object.__new__(type(self))
+        field._definition = self._definition
+        return field
+
 
 class Start(Field):
     '''
@@ -79,6 +196,8 @@ class Start(Field):
     Every time player comes through Start, gets salary.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         '''
         Creates Start instance.
@@ -92,6 +211,8 @@ class Parking(Field):
     this field nothing happens.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         '''
         Creates Parking instance.
@@ -103,12 +224,13 @@ class Jail(Field):
     '''
     Class Jail inherits from Field. If player is not arrested
     nothing happens on this field. If player is arrested has to
-    stay there until he can get out.
+    stay there until he can get out. Jail round of player is the only
+    state of arrest, jail sets it and keeps index of arrested players.
 
     Attributes
     ----------
     _arrested_players: dict
-        players in jail
+        players in jail by id
 
     Methods
     -------
@@ -121,7 +243,12 @@ class Jail(Field):
         adds player to jail
     relase:
         remove player from jail
+    next_round:
+        increments jail round of arrested players
+    clone:
+        new empty jail
     '''
+    __slots__ = ('_arrested_players',)
 
     def __init__(self, data: dict):
         '''
@@ -150,26 +277,49 @@ class Jail(Field):
 
     def add(self, player):
         '''
-        Add player to jail.
+        Add player to jail, player starts first jail round.
+        Player raises AlreadyArrestedError if he is arrested.
         '''
-        if player in self.arrested_players().values():
-            raise AlreadyArrestedError
+        player.go_to_jail()
         self._arrested_players[player.id()] = player
 
     def relase(self, player):
         '''
         Relase player from jail.
+        Player raises NotArrestedError if he is not arrested.
         '''
-        if player not in self.arrested_players().values():
-            raise NotArrestedError
+        player.leave_jail()
         del self._arrested_players[player.id()]
 
+    def next_round(self, ids=None):
+        '''
+        Increments jail round of all arrested players
+        or of arrested players with given ids.
+        '''
+        arrested = self._arrested_players
+        if ids is None:
+            players = arrested.values()
+        else:
+            players = [arrested[id] for id in ids if id in arrested]
+        for player in players:
+            player.next_jail_round()
+
+    def clone(self):
+        '''
+        Returns new empty jail.
+        '''
+        field = super().clone()
+        field._arrested_players = {}
+        return field
+
 
 class GoToJail(Field):
     '''
     Class GoToJail inherits from Field. When player stand on
     this field have to go to jail and stay there for few rounds.
     '''
+    __slots__ = ()
+
     def __init__(self, data: dict):
         '''
         Creates GoToJail instance.
@@ -182,10 +332,7 @@ class Tax(Field):
     Class Tax inherits from Field. Every time player stand
     on this field have to pay tax to bank.
 
-    Attributes
-    ---------
-    _value: int
-        amount of money player have to pay
+    Tax value is kept in definition of field.
 
     Methods
     -------
@@ -196,6 +343,7 @@ class Tax(Field):
     description:
         long description of field
     '''
+    __slots__ = ()
 
     def __init__(self, data: dict):
         '''
@@ -205,13 +353,13 @@ class Tax(Field):
         _value = data['value']
         if _value < 0:
             raise ValueError('Tax value cannot be negative number.')
-        self._value = _value
+        self._definition.value = _value
 
     def value(self):
         '''
         Returns Tax value.
         '''
-        return self._value
+        return self._definition.value
 
     def get_tax(self, player):
         '''
@@ -235,6 +383,8 @@ class DrawField(Field):
     to do.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         '''
         Creates DrawField instance.
@@ -247,16 +397,19 @@ class BuyableField(Field):
     Class BuyableField inhertits from Field. Represent field
     that can be bought by player. Base class for Property, Station, Service.
 
+    Price and mortage value are kept in definition of field.
+
     Attributes:
     ----------
-    _price: int
-        price of buying empty field
-    _mortage_value: int
-        money that can be recived for mortage in bank
     _mortaged: bool
         is field mortaged in bank
     _owner: int
         field's owner object
+    _rent: int
+        current rent read from rent table, updated when state changes
+    _zobrist: ZobristHash or None
+        hash of state of field's game updated with every change of state,
+        None if state of game is not hashed
 
     Methods
     -------
@@ -272,15 +425,36 @@ class BuyableField(Field):
         long description of field
     mortage_field:
         mortage field in bank
+    check_mortage:
+        reason why field cannot be mortaged or ALLOWED
     start_mortage:
         mortage field in bank
+    check_end_mortage:
+        reason why mortage cannot be ended or ALLOWED
     end_mortage:
         buy back field from mortage
     set_owner:
         set new owner to field
+    rent_index:
+        index of state of field in rent table
+    update_rent:
+        read current rent from rent table
+    set_mortaged:
+        set if field is mortaged
+    set_zobrist:
+        set hash of game state updated by field
+    zobrist_state:
+        values of state in hash of game
+    update_hash:
+        update hash of game after change of state
+    in_owner_fields:
+        check if field is in its owner's fields
     capitalisation:
         value of selling all field to bank
+    clone:
+        new field owned by bank
     '''
+    __slots__ = ('_mortaged', '_owner', '_rent', '_zobrist')
 
     def __init__(self, data: dict):
         '''
@@ -290,22 +464,25 @@ class BuyableField(Field):
         _price = data['price']
         if _price <= 0:
             raise ValueError('Price of field cannot be negative or zero')
-        self._price = _price
-        self._mortage_value = _price // 2
+        self._definition.price = _price
+        self._definition.mortage_value = _price // 2
+        self._definition.rent_table = (0,)
         self._mortaged = False
         self._owner = None
+        self._rent = 0
+        self._zobrist = None
 
     def price(self):
         '''
         Returns price of field.
         '''
-        return self._price
+        return self._definition.price
 
     def mortage_value(self):
         '''
         Returns mortage value of field.
         '''
-        return self._mortage_value
+        return self._definition.mortage_value
 
     def mortaged(self):
         '''
@@ -319,18 +496,36 @@ class BuyableField(Field):
         '''
         return self._owner
 
+    def check_mortage(self):
+        '''
+        Returns reason why field cannot be mortaged or ALLOWED.
+        '''
+        if not self.in_owner_fields():
+            return NOT_OWNED
+        elif self.mortaged():
+            return ALREADY_MORTAGED
+        return ALLOWED
+
     def start_mortage(self):
         '''
         Mortage field to bank.
         '''
         owner = self.owner()
-        if self not in owner.fields().values():
-            raise NotOwnedError
-        elif self.mortaged():
-            raise AlreadyMortagedError
-        else:
-            owner.add_money(self.mortage_value())
-            self._mortaged = True
+        check_allowed(self.check_mortage())
+        owner.add_money(self.mortage_value())
+        self.set_mortaged(True)
+
+    def check_end_mortage(self):
+        '''
+        Returns reason why mortage of field cannot be ended or ALLOWED.
+        '''
+        if not self.mortaged():
+            return NOT_MORTAGED
+        owner = self.owner()
+        amount = int(1.1 * self.mortage_value())
+        if owner is not None and owner.money() < amount:
+            return NO_MONEY
+        return ALLOWED
 
     def end_mortage(self):
         '''
@@ -338,13 +533,10 @@ class BuyableField(Field):
         Player person who buy up the mortage.
         '''
         owner = self.owner()
-        if not self.mortaged():
-            raise NotMortagedError
-        else:
-            if owner is not None:
-                amount = int(1.1 * self.mortage_value())
-                owner.substract_money(amount)
-            self._mortaged = False
+        check_allowed(self.check_end_mortage())
+        if owner is not None:
+            owner.substract_money(int(1.1 * self.mortage_value()))
+        self.set_mortaged(False)
 
     def description(self):
         '''
@@ -364,7 +556,67 @@ class BuyableField(Field):
         '''
         Set new owner to field.
         '''
+        if self._zobrist is not None:
+            old = self._owner
+            self.update_hash(OWNER, None if old is None else old.id(),
+                             None if new_owner is None else new_owner.id())
         self._owner = new_owner
+        self.update_rent(new_owner)
+
+    def rent_index(self, owner):
+        '''
+        Returns index of state of field owned by given owner
+        in rent table.
+        '''
+        return 0
+
+    def update_rent(self, owner):
+        '''
+        Reads current rent of field owned by given owner from rent table.
+        Owner calls it when number of his fields affecting rent changes.
+        '''
+        self._rent = self._definition.rent_table[self.rent_index(owner)]
+
+    def set_mortaged(self, mortaged):
+        '''
+        Set if field is mortaged without any payment.
+        '''
+        indexed = self.in_owner_fields()
+        if indexed:
+            self.owner().unindex_field(self)
+        self.update_hash(MORTAGED, self._mortaged, mortaged)
+        self._mortaged = mortaged
+        if indexed:
+            self.owner().index_field(self)
+
+    def set_zobrist(self, zobrist):
+        '''
+        Set hash of game state updated by field.
+        '''
+        self._zobrist = zobrist
+
+    def zobrist_state(self):
+        '''
+        Returns values of field's state in hash of game
+        in order of kinds of state: owner id, level, mortaged.
+        '''
+        owner = None if self._owner is None else self._owner.id()
+        return (owner, 0, self._mortaged)
+
+    def update_hash(self, kind, old, new):
+        '''
+        Updates hash of game after change of field's state.
+        '''
+        if self._zobrist is not None:
+            self._zobrist.update_field(self.id(), kind, old, new)
+
+    def in_owner_fields(self):
+        '''
+        Checks if field is in its owner's fields,
+        so owner's indexes contain this field.
+        '''
+        owner = self.owner()
+        return owner is not None and owner.fields().get(self.id()) is self
 
     def capitalisation(self):
         '''
@@ -375,20 +627,28 @@ class BuyableField(Field):
         else:
             return self.mortage_value()
 
+    def clone(self):
+        '''
+        Returns new field owned by bank.
+        '''
+        field = super().clone()
+        field._mortaged = False
+        field._owner = None
+        field._rent = self._definition.rent_table[0]
+        field._zobrist = None
+        return field
+
 
 class Property(BuyableField):
     '''
     Class Property inherits from BuyablePlace. Represents
     property field.
 
+    District, house price and rents on every property level
+    are kept in definition of field.
+
     Attributes
     ---------
-    _district: str
-        color of property district
-    _house_price: int
-        cost of building house or hotel
-    _rents: dict
-        rents on every property level
     _level: int
         number of houses max level is hotel
 
@@ -406,18 +666,22 @@ class Property(BuyableField):
         set level to new value
     build_house
         build house on field
-    start_mortage:
-        start mortage of property
+    check_mortage:
+        reason why property cannot be mortaged or ALLOWED
     field_in_district_has_buildings:
         check if district has any building
     all_district_owned:
         checks if owner has all district
+    check_upgrade:
+        reason why owner cannot build house or ALLOWED
     allow_to_be_upgraded:
         checks if owner can build house
     field_in_district_mortaged:
         check if any field in district is mortaged
     balanced_upgrade:
         checks if upgrade of property is balanced
+    check_downgrade:
+        reason why owner cannot sell house or ALLOWED
     allow_to_be_downgraded:
         checks if owner can sell house
     balanced_downgrade:
@@ -428,26 +692,33 @@ class Property(BuyableField):
         set level to 0
     get_owned_fields_from_district:
         returns other field from field's district
+    rent_index:
+        index of level and completeness of district in rent table
+    zobrist_state:
+        values of state in hash of game
     get_rent:
         get actual rent of field
     description
         long description of field
     capitalisation:
         value of selling field and houses to bank
+    clone:
+        new property without houses
     '''
+    __slots__ = ('_level',)
 
     def __init__(self, data: dict):
         '''
         Create Property instance.
         '''
         super().__init__(data)
-        self._district = data['district']
+        self._definition.district = data['district']
 
         _house_price = data['house_price']
         if _house_price <= 0:
             raise ValueError('House price cannot be negative or zero')
         else:
-            self._house_price = _house_price
+            self._definition.house_price = _house_price
 
         _rents = data['rents']
         if len(_rents) != MAX_PROPERTY_LEVEL + 1:
@@ -455,26 +726,30 @@ class Property(BuyableField):
         for level in _rents:
             if _rents[level] <= 0:
                 raise ValueError('Rent cannot be negative or zero')
-        self._rents = _rents
+        self._definition.rents = read_table(_rents, 0)
+        self._definition.rent_table = (self._definition.rents
+                                       + (self._definition.rents[0] * 2,)
+                                       + self._definition.rents[1:])
         self._level = 0
+        self.update_rent(None)
 
     def district(self):
         '''
         Returns property's district.
         '''
-        return self._district
+        return self._definition.district
 
     def house_price(self):
         '''
         Returns price of buliding house on property.
         '''
-        return self._house_price
+        return self._definition.house_price
 
     def rents(self):
         '''
         Returns property rents.
         '''
-        return self._rents
+        return self._definition.rents
 
     def level(self):
         '''
@@ -488,7 +763,14 @@ class Property(BuyableField):
         '''
         if not 0 <= value <= MAX_PROPERTY_LEVEL:
             raise ValueError
+        indexed = self.in_owner_fields()
+        if indexed:
+            self.owner().unindex_field(self)
+        self.update_hash(LEVEL, self._level, value)
         self._level = value
+        if indexed:
+            self.owner().index_field(self)
+        self.update_rent(self.owner())
 
     def build_house(self):
         '''
@@ -497,77 +779,57 @@ class Property(BuyableField):
         owner = self.owner()
         if self.allow_to_be_upgraded():
             owner.substract_money(self.house_price())
-            self._level += 1
+            self.set_level(self.level() + 1)
 
-    def start_mortage(self):
+    def check_mortage(self):
         '''
-        Mortage field to bank.
+        Returns reason why property cannot be mortaged or ALLOWED.
         '''
-        owner = self.owner()
-        if self not in owner.fields().values():
-            raise NotOwnedError
-        elif self.mortaged():
-            raise AlreadyMortagedError
-        elif self.field_in_district_has_buildings():
-            raise BuiltUpError
-        else:
-            owner.add_money(self.mortage_value())
-            self._mortaged = True
+        reason = super().check_mortage()
+        if reason == ALLOWED and self.field_in_district_has_buildings():
+            return BUILT_UP
+        return reason
 
     def field_in_district_has_buildings(self):
         '''
         Check if any fileld in this district has buildings.
         '''
-        owner = self.owner()
-        for field in owner.fields().values():
-            district = self.district()
-            if isinstance(field, Property) and field.district() == district:
-                if field.level() > 0:
-                    return True
-        return False
+        return self.owner().bitboard().district_built(self.district())
 
     def all_district_owned(self):
         '''
         Checks if owner of field has all properties in district.
         '''
-        owner = self.owner()
-        counter = 0
-        district = self.district()
-        for field in owner.fields().values():
-            if isinstance(field, Property) and field.district() == district:
-                counter += 1
-        return DISTRICTS_SIZES[self.district()] == counter
+        return self.owner().bitboard().owns_district(self.district())
 
-    def allow_to_be_upgraded(self):
+    def check_upgrade(self):
         '''
-        Check if owner can upgrade property.
+        Returns reason why owner cannot build house or ALLOWED.
         '''
-        owner = self.owner()
-        if self.field_in_district_mortaged():
-            raise AlreadyMortagedError
-        elif not self.all_district_owned():
-            raise NotOwnedDistrictError
+        bitboard = self.owner().bitboard()
+        if bitboard.district_mortaged(self.district()):
+            return DISTRICT_MORTAGED
+        elif not bitboard.owns_district(self.district()):
+            return NOT_OWNED_DISTRICT
         elif self.level() == MAX_PROPERTY_LEVEL:
-            raise PropertyLevelError('Property level cannot be higher\
-                 than max level')
+            return MAX_LEVEL
         elif not self.balanced_upgrade():
-            raise UnequalBuildingError
-        elif owner.money() < self.house_price():
-            raise NoMoneyError
-        else:
-            return True
+            return UNEQUAL_BUILDING
+        elif self.owner().money() < self.house_price():
+            return NO_MONEY
+        return ALLOWED
+
+    def allow_to_be_upgraded(self):
+        '''
+        Check if owner can upgrade property.
+        '''
+        return check_allowed(self.check_upgrade())
 
     def field_in_district_mortaged(self):
         '''
         Check if any field in district is mortaged.
         '''
-        owner = self.owner()
-        for field in owner.fields().values():
-            district = self.district()
-            if isinstance(field, Property) and field.district() == district:
-                if field.mortaged():
-                    return True
-        return False
+        return self.owner().bitboard().district_mortaged(self.district())
 
     def balanced_upgrade(self):
         '''
@@ -575,24 +837,27 @@ class Property(BuyableField):
         Owner cannot build house on field if its level
         is higher than minimal level in district.
         '''
-        fields = self.get_owned_fields_from_district()
+        fields = self.owner().district(self.district()).fields()
         for field in fields.values():
             if self.level() > field.level():
                 return False
         return True
 
+    def check_downgrade(self):
+        '''
+        Returns reason why owner cannot sell house or ALLOWED.
+        '''
+        if self.level() == 0:
+            return MIN_LEVEL
+        elif not self.balanced_downgrade():
+            return UNEQUAL_BUILDING
+        return ALLOWED
+
     def allow_to_be_downgraded(self):
         '''
         Check if owner can sell house from his field.
         '''
-        min_level = 0
-        if self.level() == min_level:
-            raise PropertyLevelError('Property level cannot be lower\
-                 than min level')
-        elif not self.balanced_downgrade():
-            raise UnequalBuildingError
-        else:
-            return True
+        return check_allowed(self.check_downgrade())
 
     def balanced_downgrade(self):
         '''
@@ -600,7 +865,7 @@ class Property(BuyableField):
         Owner cannot sell house from field if its level
         is smaller than maximal level in district.
         '''
-        fields = self.get_owned_fields_from_district()
+        fields = self.owner().district(self.district()).fields()
         for field in fields.values():
             if self.level() < field.level():
                 return False
@@ -614,36 +879,48 @@ class Property(BuyableField):
         if self.allow_to_be_downgraded():
             amount = int(self.house_price() / 2)
             owner.add_money(amount)
-            self._level -= 1
+            self.set_level(self.level() - 1)
 
     def remove_all_houses(self):
         '''
         Removes all houses on field.
         Used only when owner is bancrupt.
         '''
-        self._level = 0
+        self.set_level(0)
 
     def get_owned_fields_from_district(self):
         '''
         Returns fields that has the same owner like
         this field and belongs to the same district.
         '''
-        fields = {}
-        owner = self.owner()
-        district = self.district()
-        for field in owner.fields().values():
-            if isinstance(field, Property) and field.district() == district:
-                fields[field.id()] = field
-        return fields
+        fields = self.owner().district(self.district()).fields()
+        return dict(sorted(fields.items()))
+
+    def rent_index(self, owner):
+        '''
+        Returns index of level of property in rent table. Levels
+        of property with all district owned follow levels of property
+        without it.
+        '''
+        if owner is None:
+            return self._level
+        complete = owner.bitboard().owns_district(self.district())
+        return complete * (MAX_PROPERTY_LEVEL + 1) + self._level
+
+    def zobrist_state(self):
+        '''
+        Returns values of property's state in hash of game
+        in order of kinds of state: owner id, level, mortaged.
+        '''
+        owner = None if self._owner is None else self._owner.id()
+        return (owner, self._level, self._mortaged)
 
     def get_rent(self):
         '''
         Returns current field's rent.
+        Rent without houses is doubled if owner has all district.
         '''
-        if self.level() == 0 and self.all_district_owned():
-            return self.rents()[str(self.level())] * 2
-        else:
-            return self.rents()[str(self.level())]
+        return self._rent
 
     def description(self):
         '''
@@ -656,8 +933,8 @@ class Property(BuyableField):
         line_10 = '{:<15}'.format('Opłaty:')
         line_11 = '\n{:<15}{:>25}\n'.format('Poziom', 'Wartość')
         dsc += (line_7 + line_8 + line_9 + line_10 + line_11)
-        for level in self.rents():
-            line = '{:<15}{:>25}\n'.format(level, self.rents()[level])
+        for level, rent in enumerate(self.rents()):
+            line = '{:<15}{:>25}\n'.format(level, rent)
             dsc += line
         return dsc
 
@@ -669,27 +946,36 @@ class Property(BuyableField):
         base = super().capitalisation()
         return base + int(0.5 * (self.level() * self.house_price()))
 
+    def clone(self):
+        '''
+        Returns new property without houses.
+        '''
+        field = super().clone()
+        field._level = 0
+        return field
+
 
 class Station(BuyableField):
     '''
     Class Station inherits from BuyableField. Represents
     Station field.
 
-    Attributes
-    ----------
-    _rents: dict
-        rents for standing on station
+    Rents for standing on station for every number of owned stations
+    are kept in definition of field.
 
     Methods
     -------
     rents
         getter
+    rent_index
+        number of stations owned by owner
     get_rent
         gets rent depending on owner number of stations
     description
         long description of field
 
     '''
+    __slots__ = ()
 
     def __init__(self, data: dict):
         '''
@@ -702,20 +988,26 @@ class Station(BuyableField):
         for level in _rents:
             if _rents[level] <= 0:
                 raise ValueError('Rent cannot be negative or zero')
-        self._rents = _rents
+        self._definition.rents = read_table(_rents, 1)
+        self._definition.rent_table = (0,) + self._definition.rents
 
     def rents(self):
         '''
         Returns station rents.
         '''
-        return self._rents
+        return self._definition.rents
+
+    def rent_index(self, owner):
+        '''
+        Returns number of stations owned by owner.
+        '''
+        return 0 if owner is None else owner.stations_owned()
 
     def get_rent(self):
         '''
         Returns rent for given number of owned stations
         '''
-        stations_owned = self.owner().stations_owned()
-        return self._rents[str(stations_owned)]
+        return self._rent
 
     def description(self):
         '''
@@ -725,8 +1017,8 @@ class Station(BuyableField):
         line_7 = '{:<15}'.format('Opłaty:')
         line_8 = '\n{:<15}{:>25}\n'.format('Ilość', 'Wartość')
         dsc += (line_7 + line_8)
-        for level in self.rents():
-            line = '{:<15}{:>25}\n'.format(level, self.rents()[level])
+        for number, rent in enumerate(self.rents(), 1):
+            line = '{:<15}{:>25}\n'.format(number, rent)
             dsc += line
         return dsc
 
@@ -736,20 +1028,21 @@ class Service(BuyableField):
     Class Service inherits from BuyablePlace.
     Represents Service field.
 
-    Attributes
-    ----------
-    _multipliers: dict
-        multipliers of dices when player stand on field
+    Multipliers of dices for every number of owned services
+    are kept in definition of field.
 
     Methods
     -------
     multipliers:
         getter
+    rent_index:
+        number of services owned by owner
     get_rent:
         get rent depending on owner number of services
     description:
         long description of field
     '''
+    __slots__ = ()
 
     def __init__(self, data: dict):
         '''
@@ -763,20 +1056,26 @@ class Service(BuyableField):
             if _multipliers[level] <= 0:
                 raise ValueError('Multipliers of dice cannot be negative\
                      or zero')
-        self._multipliers = _multipliers
+        self._definition.multipliers = read_table(_multipliers, 1)
+        self._definition.rent_table = (0,) + self._definition.multipliers
 
     def multipliers(self):
         '''
         Returns Service's dices multiplier.
         '''
-        return self._multipliers
+        return self._definition.multipliers
+
+    def rent_index(self, owner):
+        '''
+        Returns number of services owned by owner.
+        '''
+        return 0 if owner is None else owner.services_owned()
 
     def get_rent(self, dices):
         '''
         Returns rent for given number of dices.
         '''
-        services_owned = self.owner().services_owned()
-        return self._multipliers[str(services_owned)] * sum(dices)
+        return self._rent * sum(dices)
 
     def description(self):
         '''
@@ -786,7 +1085,7 @@ class Service(BuyableField):
         line_7 = '{:<15}'.format('Mnożniki:')
         line_8 = '\n{:<15}{:>25}\n'.format('Ilość', 'Mnożnik')
         dsc += (line_7 + line_8)
-        for level in self.multipliers():
-            line = '{:<15}{:>25}\n'.format(level, self.multipliers()[level])
+        for number, multiplier in enumerate(self.multipliers(), 1):
+            line = '{:<15}{:>25}\n'.format(number, multiplier)
             dsc += line
         return dsc
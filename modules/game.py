@@ -1,12 +1,17 @@
 from modules.constants import (MIN_NUMBER_OF_PLAYERS, MAX_NUMBER_OF_PLAYERS,
-                               START_ID, JAIL_ID, PARKING_ID, GO_TO_JAIL_ID,
-                               PROPERTY_IDS, TAX_IDS, STATION_IDS, SERVICE_IDS,
-                               DRAW_FIELD_IDS, MIN_NUMBER_OF_ROUNDS)
-from modules.fields import (Start, Jail, Parking, GoToJail, Property, Tax,
-                            Station, Service, DrawField, BuyableField)
+                               JAIL_ID, MIN_NUMBER_OF_ROUNDS, OPEN_AUCTION,
+                               AUCTION_MODES)
+from modules.chances import NUMBER_OF_CHANCES
+from modules.fields import Property, BuyableField
+from modules.board import Board, load_board, field_kinds
+from modules.player import PlayerRing
+from modules.zobrist import ZobristHash
 from modules.exceptions import (NotAllBancruptError, PlayersNumberError,
-                                RepeatedIdError, TooShortGameError)
-from random import randint
+                                RepeatedIdError, TooShortGameError,
+                                AuctionModeError)
+from modules.events import (ROLL, ARREST, RELEASE, PURCHASE, BANCRUPTCY,
+                            CHANCE)
+from random import Random
 import json
 
 
@@ -20,6 +25,8 @@ class Game:
         players in game
     _fields: dict
         fields in game
+    _field_kinds: dict
+        kinds of fields by field id, used to choose action of landing
     _number_of_players: int
         number of players in game
     _number_of_rounds: int or None
@@ -30,6 +37,23 @@ class Game:
         number of current round
     _finished: bool
         if game finished
+    _auction_mode: int
+        open, first-price sealed-bid or Vickrey auction
+    _chance_deck: list or None
+        ids of chance cards in order of shuffled deck,
+        None if cards are drawn with replacement
+    _deck_position: int
+        number of cards drawn from shuffled deck
+    _random: Random
+        generator of random numbers shared by game and its players
+    _event_log: EventLog or None
+        log of game events, None if events are not recorded
+    _active_players: PlayerRing or None
+        players who are not bancrupt, created with first move to next
+        player, bancrupt players are removed when they are passed
+    _zobrist: ZobristHash or None
+        hash of game state updated by players and fields
+        with every change of their state, None if state is not hashed
 
     Methods:
     -------
@@ -37,6 +61,8 @@ class Game:
         getter
     fields:
         getter
+    field_kinds:
+        getter
     number_of_players:
         getter
     number_of_rounds:
@@ -47,6 +73,28 @@ class Game:
         getter
     finished:
         getter
+    auction_mode:
+        getter
+    chance_deck:
+        getter
+    deck_position:
+        getter
+    random:
+        getter
+    event_log:
+        getter
+    zobrist:
+        getter
+    zobrist_hash:
+        getter of hash of game state
+    set_auction_mode:
+        setter
+    set_chance_deck:
+        setter
+    set_event_log:
+        setter
+    set_zobrist:
+        setter
     set_players:
         setter
     set_fields:
@@ -55,6 +103,10 @@ class Game:
         setter
     set_number_of_rounds:
         setter
+    set_current_player_id:
+        setter
+    set_current_round:
+        setter
 
     read_from_json:
         reads fields from json config
@@ -66,6 +118,8 @@ class Game:
         put player to jail
     leave_jail:
         relase player from jail
+    active_players:
+        ring of players who are not bancrupt
     next_player:
         find next_player_id
     bidding_players:
@@ -94,19 +148,33 @@ class Game:
         take all over from bancrupt to bank
     make_deal:
         buy end sell
+    sell_estate:
+        bank sells fields of bancrupt's estate at once
     next_bidder_id:
         id of next bidder
     draw_card:
         choice id of chance
+    record:
+        record event in event log
+    record_turn:
+        record start of turn in event log
     '''
-    def __init__(self):
+    def __init__(self, seed=None):
         self._players = {}
         self._fields = {}
+        self._field_kinds = {}
         self._number_of_players = len(self._players)
         self._number_of_rounds = None
         self._current_player_id = 0
         self._current_round = 1
         self._finished = False
+        self._auction_mode = OPEN_AUCTION
+        self._chance_deck = None
+        self._deck_position = 0
+        self._random = Random(seed)
+        self._event_log = None
+        self._active_players = None
+        self._zobrist = None
 
     # GETTERS GETTERS GETTERS GETTERS
     def players(self) -> dict:
@@ -121,6 +189,12 @@ class Game:
         '''
         return self._fields
 
+    def field_kinds(self) -> dict:
+        '''
+        Returns kinds of game's fields by field id.
+        '''
+        return self._field_kinds
+
     def number_of_rounds(self) -> int or None:
         '''
         Returns number of rounds.
@@ -151,27 +225,131 @@ class Game:
         '''
         return self._finished
 
+    def auction_mode(self) -> int:
+        '''
+        Returns kind of auctions played in game.
+        '''
+        return self._auction_mode
+
+    def chance_deck(self) -> list or None:
+        '''
+        Returns ids of chance cards in order of shuffled deck
+        or None if cards are drawn with replacement.
+        '''
+        return self._chance_deck
+
+    def deck_position(self) -> int:
+        '''
+        Returns number of cards drawn from shuffled deck.
+        '''
+        return self._deck_position
+
+    def random(self) -> Random:
+        '''
+        Returns game's generator of random numbers.
+        '''
+        return self._random
+
+    def event_log(self):
+        '''
+        Returns game's event log or None.
+        '''
+        return self._event_log
+
+    def zobrist(self):
+        '''
+        Returns hash of game state or None.
+        '''
+        return self._zobrist
+
+    def zobrist_hash(self) -> int or None:
+        '''
+        Returns 64-bit hash of game state or None if state is not hashed.
+        '''
+        if self._zobrist is None:
+            return None
+        return self._zobrist.value()
+
     # SETTERS SETTERS SETTERTS SETTERS
     def set_finished(self):
         self._finished = True
 
+    def set_auction_mode(self, mode: int) -> None:
+        '''
+        Set kind of auctions: open, first-price sealed-bid or Vickrey.
+        '''
+        if mode not in AUCTION_MODES:
+            raise AuctionModeError
+        self._auction_mode = mode
+
+    def set_chance_deck(self, deck: list = None, position: int = None):
+        '''
+        Set chance cards to be drawn from deck without replacement,
+        deck is shuffled again when all cards are drawn. Without position
+        deck is shuffled before first draw. None deck restores drawing
+        with replacement.
+        '''
+        if deck is not None:
+            deck = list(deck)
+            if sorted(deck) != list(range(NUMBER_OF_CHANCES)):
+                raise ValueError
+            if position is None:
+                position = len(deck)
+            if not 0 <= position <= len(deck):
+                raise ValueError
+        self._chance_deck = deck
+        self._deck_position = position or 0
+
+    def set_event_log(self, event_log) -> None:
+        '''
+        Set log to which game events are recorded.
+        '''
+        self._event_log = event_log
+
+    def set_zobrist(self, zobrist: ZobristHash = None) -> None:
+        '''
+        Set hash of game state updated by players and fields
+        and calculates it for current state. None stops hashing.
+        '''
+        self._zobrist = zobrist
+        for player in self._players.values():
+            player.set_zobrist(zobrist)
+        for field in self._fields.values():
+            if isinstance(field, BuyableField):
+                field.set_zobrist(zobrist)
+        if zobrist is not None:
+            zobrist.rehash(self)
+
     def set_players(self, players: dict) -> None:
         '''
         Set players to game.
+        Players use game's generator of random numbers.
         '''
         ids = [player.id() for player in players.values()]
         if len(set(ids)) != len(ids):
             raise RepeatedIdError()
+        for player in players.values():
+            player.set_random(self.random())
+            player.set_zobrist(self._zobrist)
         self._players = players
+        self._active_players = None
+        if self._zobrist is not None:
+            self._zobrist.rehash(self)
 
     def set_fields(self, fields: dict) -> None:
         '''
-        Set fields to game.
+        Set fields to game and finds their kinds.
         '''
         ids = [field.id() for field in fields.values()]
         if len(set(ids)) != len(ids):
             raise RepeatedIdError()
         self._fields = fields
+        self._field_kinds = field_kinds(fields)
+        for field in fields.values():
+            if isinstance(field, BuyableField):
+                field.set_zobrist(self._zobrist)
+        if self._zobrist is not None:
+            self._zobrist.rehash(self)
 
     def set_number_of_players(self, number: int) -> None:
         '''
@@ -180,6 +358,7 @@ class Game:
         if not (MIN_NUMBER_OF_PLAYERS <= number <= MAX_NUMBER_OF_PLAYERS):
             raise PlayersNumberError
         self._number_of_players = number
+        self._active_players = None
 
     def set_number_of_rounds(self, number_of_rounds: int) -> None:
         '''
@@ -190,41 +369,37 @@ class Game:
                 raise TooShortGameError
         self._number_of_rounds = number_of_rounds
 
+    def set_current_player_id(self, id: int) -> None:
+        '''
+        Set id of player that have turn.
+        '''
+        if not 0 <= id < self.number_of_players():
+            raise ValueError('Wrong id of player.')
+        if self._zobrist is not None:
+            self._zobrist.update_current_player(self._current_player_id, id)
+        self._current_player_id = id
+
+    def set_current_round(self, round: int) -> None:
+        '''
+        Set number of current round.
+        '''
+        if round < 1:
+            raise ValueError('Round number must be positive.')
+        self._current_round = round
+
     def read_from_json(self, handle):
         '''
         Reads fields from json config.
         '''
-        all_data = json.load(handle)
-        fields = {}
-        for key in all_data:
-            id = int(key)
-            if id == START_ID:
-                fields[id] = Start(all_data[key])
-            if id == JAIL_ID:
-                fields[id] = Jail(all_data[key])
-            if id == PARKING_ID:  # parking id
-                fields[id] = Parking(all_data[key])
-            if id == GO_TO_JAIL_ID:  # go to jail id
-                fields[id] = GoToJail(all_data[key])
-            if id in PROPERTY_IDS:
-                fields[id] = Property(all_data[key])
-            if id in TAX_IDS:
-                fields[id] = Tax(all_data[key])
-            if id in STATION_IDS:
-                fields[id] = Station(all_data[key])
-            if id in SERVICE_IDS:
-                fields[id] = Service(all_data[key])
-            if id in DRAW_FIELD_IDS:
-                fields[id] = DrawField(all_data[key])
-        fields = dict(sorted(fields.items()))
-        self.set_fields(fields)
+        board = Board(json.load(handle))
+        self.set_fields(board.create_fields())
 
     def create_fields(self, path):  # WORKS
         '''
         Creates fields from config file.
+        Config is compiled once and cached.
         '''
-        with open(path) as handle:
-            self.read_from_json(handle)
+        self.set_fields(load_board(path).create_fields())
 
     def roll_dices(self):
         '''
@@ -236,6 +411,7 @@ class Game:
             player.add_double()
         else:
             player.reset_doubles()
+        self.record(ROLL, player.id(), result[0], result[1])
         return result
 
     def arrest(self, player):
@@ -245,7 +421,7 @@ class Game:
         player.reset_doubles()
         jail = self.fields()[JAIL_ID]
         jail.add(player)
-        player.go_to_jail()
+        self.record(ARREST, player.id())
 
     def leave_jail(self, player):
         '''
@@ -253,33 +429,46 @@ class Game:
         '''
         jail = self.fields()[JAIL_ID]
         jail.relase(player)
-        player.leave_jail()
+        self.record(RELEASE, player.id())
+
+    def active_players(self) -> PlayerRing:
+        '''
+        Returns ring of players who are not bancrupt.
+        Bancrupt players still in ring are removed when they are passed.
+        '''
+        if self._active_players is None:
+            players = {id: player for id, player in self.players().items()
+                       if not player.is_bancrupt()}
+            self._active_players = PlayerRing(players,
+                                              self.number_of_players())
+        return self._active_players
 
     def next_player(self):
         '''
         Find next player who is not a bancrupt.
         '''
-        found = False
-        while not found:
-            self._current_player_id += 1
-            id = self.current_player_id()
-
-            if id != id % self.number_of_players():
-                self._current_round += 1
-            self._current_player_id %= self.number_of_players()
-            id = self.current_player_id()
-            found = not self.players()[id].is_bancrupt()
+        active_players = self.active_players()
+        id = self.current_player_id()
+        next_id = active_players.next(id)
+        while active_players[next_id].is_bancrupt():
+            active_players.remove(next_id)
+            next_id = active_players.next(id)
+        if next_id <= id:
+            self._current_round += 1
+        if self._zobrist is not None:
+            self._zobrist.update_current_player(id, next_id)
+        self._current_player_id = next_id
 
-    def bidding_players(self):
+    def bidding_players(self) -> PlayerRing:
         '''
-        Return players who can take part in auction.
+        Return ring of players who can take part in auction.
         '''
         bidding_players = {}
         for player in self.players().values():
             current_id = self.current_player_id()
             if not (player.id() == current_id or player.is_bancrupt()):
                 bidding_players[player.id()] = player
-        return bidding_players
+        return PlayerRing(bidding_players, self.number_of_players())
 
     def fields_for_sell(self):
         '''
@@ -390,6 +579,7 @@ class Game:
 
         # make player bancrupt
         player.set_bancrupt()
+        self.record(BANCRUPTCY, player.id(), creditor.id())
 
     def remove_houses(self, fields):
         '''
@@ -451,34 +641,75 @@ class Game:
 
         # make player bancrupt
         player.set_bancrupt()
+        self.record(BANCRUPTCY, player.id())
 
     def make_deal(self, buyer, field, price):
         '''
         Make deal between buyer and owner.
         '''
         seller = field.owner()
+        buyer.substract_money(price)
         if seller is not None:
             seller.add_money(price)
             seller.remove_field(field)
-        buyer.substract_money(price)
         buyer.add_field(field)
         field.set_owner(buyer)
+        self.record(PURCHASE, buyer.id(), field.id(), price)
+
+    def sell_estate(self, deals):
+        '''
+        Bank sells fields of bancrupt's estate in one update.
+        Deals are tuples of buyer, field and price, every buyer
+        pays for all his fields at once.
+        '''
+        totals = {}
+        for buyer, field, price in deals:
+            totals[buyer] = totals.get(buyer, 0) + price
+        for buyer, total in totals.items():
+            buyer.substract_money(total)
+        for buyer, field, price in deals:
+            buyer.add_field(field)
+            field.set_owner(buyer)
+            self.record(PURCHASE, buyer.id(), field.id(), price)
 
-    def next_bidder_id(self, id, participants):
+    def next_bidder_id(self, id, participants: PlayerRing):
         '''
         Find id of next player who can make bid.
         '''
-        found = False
-        while not found:
-            id = (id + 1) % self.number_of_players()
-            found = id in participants
-        return id
+        return participants.next(id)
 
     # CHANCES CHANCES
 
     def draw_card(self):
         '''
-        Choice id of chance card.
+        Choice id of chance card. Card is drawn with replacement
+        or from top of shuffled deck if game has one.
         '''
-        id = randint(0, 16)
+        deck = self._chance_deck
+        if deck is None:
+            id = self.random().randint(0, NUMBER_OF_CHANCES - 1)
+        else:
+            if self._deck_position == len(deck):
+                self.random().shuffle(deck)
+                self._deck_position = 0
+            id = deck[self._deck_position]
+            self._deck_position += 1
+        self.record(CHANCE, self.current_player_id(), id)
         return id
+
+    # EVENTS EVENTS
+
+    def record(self, kind, player_id, target=-1, value=0):
+        '''
+        Record event in event log if game has one.
+        '''
+        if self._event_log is not None:
+            self._event_log.record(kind, player_id, target, value)
+
+    def record_turn(self):
+        '''
+        Record start of current player's turn in event log.
+        '''
+        if self._event_log is not None:
+            self._event_log.next_turn(self.current_player_id(),
+                                      self.current_round())
@@ -1,11 +1,23 @@
-from modules.constants import FIELDS_PATH, DEPOSIT, START_BID
-from modules.fields import (Property, BuyableField, GoToJail, DrawField,
-                            Station, Service, Tax)
+from modules.constants import (FIELDS_PATH, DEPOSIT, START_BID, PAYMENT,
+                               MAX_DOUBLES_IN_ROW, MAX_JAIL_ROUND,
+                               BID_DIFFERENCE, OPEN_AUCTION, VICKREY_AUCTION,
+                               ALLOWED, NOTHING_EFFECT, GAIN_EFFECT,
+                               GAIN_PER_FIELD_EFFECT, FINE_EFFECT,
+                               FINE_PER_FIELD_EFFECT, FINE_PER_HOUSE_EFFECT,
+                               ARREST_EFFECT, GET_OUT_CARD_EFFECT,
+                               SCRATCH_CARD_EFFECT, START_KIND, PROPERTY_KIND,
+                               DRAW_KIND, TAX_KIND, STATION_KIND, JAIL_KIND,
+                               SERVICE_KIND, PARKING_KIND, GO_TO_JAIL_KIND)
+from modules.chances import CHANCE_EFFECTS
+from modules.fields import Property, BuyableField, GoToJail
 from modules.exceptions import (AlreadyMortagedError, NotOwnedDistrictError,
                                 PropertyLevelError, UnequalBuildingError,
                                 NotMortagedError, NoMoneyError, BuiltUpError)
 from modules.player import Player
 from modules.ai import AiPlayer
+from modules.events import (DICES, MOVE, INCOME, CHARGE, TRANSFER, PURCHASE,
+                            BID, MORTGAGE, END_MORTGAGE, BUILD, SELL_HOUSE,
+                            SELL_FIELD, JAIL_ROUND, GET_OUT_CARD)
 import sys
 
 
@@ -16,6 +28,36 @@ class Gameplay:
     def __init__(self, interface, game):
         self._interface = interface
         self._game = game
+        self._chance_actions = {
+            NOTHING_EFFECT: self.chance_nothing,
+            GAIN_EFFECT: self.chance_gain,
+            GAIN_PER_FIELD_EFFECT: self.chance_gain_per_field,
+            FINE_EFFECT: self.chance_fine,
+            FINE_PER_FIELD_EFFECT: self.chance_fine_per_field,
+            FINE_PER_HOUSE_EFFECT: self.chance_fine_per_house,
+            ARREST_EFFECT: self.chance_arrest,
+            GET_OUT_CARD_EFFECT: self.chance_get_out,
+            SCRATCH_CARD_EFFECT: self.chance_scratch,
+        }
+        self._kind_actions = {
+            START_KIND: self.no_action,
+            JAIL_KIND: self.no_action,
+            PARKING_KIND: self.no_action,
+            DRAW_KIND: self.draw,
+            GO_TO_JAIL_KIND: self.go_to_jail,
+            TAX_KIND: self.pay_tax,
+            PROPERTY_KIND: self.stand_on_buyable,
+            STATION_KIND: self.stand_on_buyable,
+            SERVICE_KIND: self.stand_on_buyable,
+        }
+        self._kind_rents = {
+            PROPERTY_KIND: self.field_rent,
+            STATION_KIND: self.field_rent,
+            SERVICE_KIND: self.service_rent,
+        }
+        self._field_kinds = None
+        self._field_actions = {}
+        self._rents = {}
 
     # GETTERS
 
@@ -111,7 +153,14 @@ class Gameplay:
         Main function of Monopoly game.
         '''
         self.preparations()
+        self.play()
+
+    def play(self):
+        '''
+        Plays turns one after another until game is finished.
+        '''
         while not self.game().finished():
+            self.game().record_turn()
             self.turn()
             self.game().next_player()
             self.chcek_end()
@@ -297,6 +346,8 @@ class Gameplay:
         if choice == '1':
             try:
                 field.start_mortage()
+                self.game().record(MORTGAGE, field.owner().id(), field.id(),
+                                   field.mortage_value())
                 self.interface().mortaged_message(field)
                 # go_back = True
             except BuiltUpError:
@@ -317,6 +368,9 @@ class Gameplay:
         if choice == '1':
             try:
                 field.end_mortage()
+                amount = int(1.1 * field.mortage_value())
+                self.game().record(END_MORTGAGE, field.owner().id(),
+                                   field.id(), amount)
                 self.interface().end_mortage_message(field)
             except NotMortagedError:
                 self.interface().not_mortaged_message(field)
@@ -335,7 +389,10 @@ class Gameplay:
         choice = self.interface().ask_sold_to_bank(field)
         if choice == '1':
             try:
-                field.owner().sell_to_bank(field)
+                owner = field.owner()
+                owner.sell_to_bank(field)
+                self.game().record(SELL_FIELD, owner.id(), field.id(),
+                                   field.mortage_value())
                 self.interface().sold_to_bank_message(field)
             except AlreadyMortagedError:
                 self.interface().already_mortaged_message()
@@ -357,6 +414,8 @@ class Gameplay:
             if choice == '1':
                 try:
                     field.build_house()
+                    self.game().record(BUILD, field.owner().id(), field.id(),
+                                       field.house_price())
                     self.interface().house_build_message()
                 except ValueError:
                     self.interface().build_not_on_property_message()
@@ -386,6 +445,9 @@ class Gameplay:
             if choice == '1':
                 try:
                     field.remove_house()
+                    self.game().record(SELL_HOUSE, field.owner().id(),
+                                       field.id(),
+                                       int(field.house_price() / 2))
                     self.interface().house_sold_message()
                 except PropertyLevelError:
                     self.interface().min_level_message()
@@ -466,8 +528,11 @@ class Gameplay:
         player = self.game().players()[id]
         want_to_buy = player.reply_for_pricing(field, price)
         if want_to_buy:
-            self.game().make_deal(player, field, price)
-            self.interface().bought_message(field)
+            try:
+                self.game().make_deal(player, field, price)
+                self.interface().bought_message(field)
+            except NoMoneyError:
+                self.interface().not_buy_message(player, field)
         else:
             self.interface().not_buy_message(player, field)
 
@@ -517,24 +582,18 @@ class Gameplay:
         Equivalent to main_menu for human player.
         '''
         player = self.game().players()[self.game().current_player_id()]
-        fields = player.fields()
         missing_ids = player.missing_fields_ids(self.game().fields())
         for id in missing_ids:
             self.ai_buy_from_another_player(id)
+        fields = player.fields()
         build_houses_ids = player.build_houses_ids()
         for id in build_houses_ids:
             field = fields[id]
-            if player.want_to_upgrade(field.house_price()):
-                try:
-                    field.build_house()
-                except AlreadyMortagedError:
-                    pass
-                except NotOwnedDistrictError:
-                    pass
-                except PropertyLevelError:
-                    pass
-                except UnequalBuildingError:
-                    pass
+            if (player.want_to_upgrade(field.house_price())
+                    and field.check_upgrade() == ALLOWED):
+                field.build_house()
+                self.game().record(BUILD, player.id(), field.id(),
+                                   field.house_price())
 
     def turn(self):
         '''
@@ -563,7 +622,7 @@ class Gameplay:
             self.interface().dices_message(dices_result)
 
             # arrest player if he has 3 doubles in row
-            if player.doubles_in_row() == 3:
+            if player.doubles_in_row() == MAX_DOUBLES_IN_ROW:
                 player.reset_doubles()
                 self.game().arrest(player)
                 self.interface().arrest_player_message()
@@ -636,6 +695,7 @@ class Gameplay:
         id = self.game().current_player_id()
         player = self.game().players()[id]
         dices_result = player.dices()
+        self.game().record(DICES, player.id(), *dices_result)
         self.interface().dices_message(dices_result)
 
         if dices_result[0] == dices_result[1]:
@@ -654,7 +714,7 @@ class Gameplay:
             else:
                 self.ai_actions()
 
-        elif player.in_jail_round() == 3:
+        elif player.in_jail_round() == MAX_JAIL_ROUND:
             # try to pay deposit
             if not isinstance(player, AiPlayer):
                 self.interface().pay_deposit()
@@ -677,6 +737,7 @@ class Gameplay:
             # stay in jail
             self.interface().stay_in_jail_message()
             player.next_jail_round()
+            self.game().record(JAIL_ROUND, player.id())
 
     def force_to_pay(self, player, value, receiver=None):
         '''
@@ -690,6 +751,10 @@ class Gameplay:
                 player.substract_money(value)
                 if receiver is not None:
                     receiver.add_money(value)
+                    self.game().record(TRANSFER, player.id(), receiver.id(),
+                                       value)
+                else:
+                    self.game().record(CHARGE, player.id(), -1, value)
                 paid = True
             except NoMoneyError:
                 self.no_money_action(value, receiver)
@@ -705,6 +770,7 @@ class Gameplay:
         player = self.game().players()[id]
         try:
             player.substract_money(DEPOSIT)
+            self.game().record(CHARGE, player.id(), -1, DEPOSIT)
             self.game().leave_jail(player)
             self.interface().leave_jail_message()
         except NoMoneyError:
@@ -720,6 +786,7 @@ class Gameplay:
         player = self.game().players()[id]
         try:
             player.use_get_out_card()
+            self.game().record(GET_OUT_CARD, player.id(), -1, -1)
             self.game().leave_jail(player)
             self.interface().leave_jail_message()
         except ValueError:
@@ -740,40 +807,56 @@ class Gameplay:
         if player.pass_start():
             # gives payment and print messages of move and payment
             field = self.game().fields()[player.position()]
+            self.game().record(MOVE, player.id(), player.position())
             player.get_payment()
+            self.game().record(INCOME, player.id(), -1, PAYMENT)
             self.interface().move_message(dices_result, field)
             self.interface().start_payment_message()
         else:
             # print message of move
             field = self.game().fields()[player.position()]
+            self.game().record(MOVE, player.id(), player.position())
             self.interface().move_message(dices_result, field)
 
-    def field_action(self):
+    def field_actions(self):
         '''
-        Action after standing on fields.
+        Returns actions of standing on fields by field id.
+        Actions are chosen by kinds of fields once for game's board.
         DrawField - draw
         GoToJail - put player to jail
         Tax - pay tax
         BuyableField - actions of buyable field
         '''
+        kinds = self.game().field_kinds()
+        if kinds is not self._field_kinds:
+            self._field_actions = {id: self._kind_actions[kind]
+                                   for id, kind in kinds.items()}
+            self._rents = {id: self._kind_rents[kind]
+                           for id, kind in kinds.items()
+                           if kind in self._kind_rents}
+            self._field_kinds = kinds
+        return self._field_actions
+
+    def field_action(self):
+        '''
+        Action after standing on fields.
+        '''
         id = self.game().current_player_id()
         player = self.game().players()[id]
-        field = self.game().fields()[player.position()]
-
-        if isinstance(field, DrawField):
-            self.draw()
+        self.field_actions()[player.position()]()
 
-        elif isinstance(field, GoToJail):
-            self.arrest(player)
-
-        elif isinstance(field, Tax):
-            # player pay tax
-            # print message of tax
-            self.pay_tax()
+    def no_action(self):
+        '''
+        Nothing happens after standing on field.
+        '''
+        pass
 
-        elif isinstance(field, BuyableField):
-            # stand on buyable action
-            self.stand_on_buyable()
+    def go_to_jail(self):
+        '''
+        Action of standing on GoToJail field.
+        '''
+        id = self.game().current_player_id()
+        self.arrest(self.game().players()[id])
 
     def arrest(self, player):
         '''
@@ -797,96 +880,75 @@ class Gameplay:
     def chance(self, id):
         '''
         Actions launched when player draw a card.
+        Action is chosen by kind of card effect.
         '''
         player = self.game().players()[self.game().current_player_id()]
-        if id == 0:
-            # tax refund
-            tax = 30
-            player.add_money(tax)
-
-        elif id == 1:
-            # go to jail
-            self.game().arrest(player)
-
-        elif id == 2:
-            # tax_refund
-            tax = 150
-            player.add_money(tax)
-
-        elif id == 3:
-            # found a wallet
-            in_wallet = 10
-            player.add_money(in_wallet)
-
-        elif id == 4:
-            # holidays
-            pass
-
-        elif id == 5:
-            # PIPR condition
-            condition = 200
-            self.force_to_pay(player, condition)
-
-        elif id == 6:
-            # add jail left card
-            player.add_get_out_cards()
-
-        elif id == 7:
-            # get dividend
-            dividend = 50
-            player.add_money(dividend)
-
-        elif id == 8:
-            # underpayment of tax
-            fields_number = len(player.fields())
-            tax_per_field = 20
-            amount = fields_number * tax_per_field
-            self.force_to_pay(player, amount)
-
-        elif id == 9:
-            # pay fine
-            fine = 15
-            self.force_to_pay(player, fine)
-
-        elif id == 10:
-            # renovation
-            houses = player.count_houses()
-            price_per_house = 25
-            amount = houses * price_per_house
-            self.force_to_pay(player, amount)
-
-        elif id == 11:
-            # tax overpayment
-            fields_number = len(player.fields())
-            tax_per_field = 20
-            amount = fields_number * tax_per_field
-            player.add_money(amount)
-
-        elif id == 12:
-            # inheritance
-            inheritance = 100
-            player.add_money(inheritance)
-
-        elif id == 13:
-            # pay tax
-            tax = 100
-            self.force_to_pay(player, tax)
-        elif id == 14:
-            # go to jail
-            self.game().arrest(player)
-
-        elif id == 15:
-            # find scratch card
-            dices = player.dices()
-            win = sum(dices)
-            if dices[0] == dices[1]:
-                win = win * dices[0]
-            player.add_money(win)
-            self.interface().scratch_card(dices, win)
-
-        elif id == 16:
-            # add jail left card
-            player.add_get_out_cards()
+        kind, value = CHANCE_EFFECTS[id]
+        self._chance_actions[kind](player, value)
+
+    def chance_gain(self, player, amount):
+        '''
+        Card effect: player gets amount from bank.
+        '''
+        player.add_money(amount)
+        self.game().record(INCOME, player.id(), -1, amount)
+
+    def chance_gain_per_field(self, player, amount):
+        '''
+        Card effect: player gets amount for every owned field.
+        '''
+        self.chance_gain(player, len(player.fields()) * amount)
+
+    def chance_fine(self, player, amount):
+        '''
+        Card effect: player pays amount to bank.
+        '''
+        self.force_to_pay(player, amount)
+
+    def chance_fine_per_field(self, player, amount):
+        '''
+        Card effect: player pays amount for every owned field.
+        '''
+        self.force_to_pay(player, len(player.fields()) * amount)
+
+    def chance_fine_per_house(self, player, amount):
+        '''
+        Card effect: player pays amount for every house.
+        '''
+        self.force_to_pay(player, player.count_houses() * amount)
+
+    def chance_arrest(self, player, value):
+        '''
+        Card effect: player goes to jail.
+        '''
+        self.game().arrest(player)
+
+    def chance_get_out(self, player, number):
+        '''
+        Card effect: player gets cards to leave jail.
+        '''
+        player.add_get_out_cards(number)
+        self.game().record(GET_OUT_CARD, player.id(), -1, number)
+
+    def chance_scratch(self, player, value):
+        '''
+        Card effect: player rolls dices and wins their sum,
+        multiplied by number on dice if it is double.
+        '''
+        dices = player.dices()
+        self.game().record(DICES, player.id(), *dices)
+        win = sum(dices)
+        if dices[0] == dices[1]:
+            win = win * dices[0]
+        player.add_money(win)
+        self.game().record(INCOME, player.id(), -1, win)
+        self.interface().scratch_card(dices, win)
+
+    def chance_nothing(self, player, value):
+        '''
+        Card effect: nothing happens.
+        '''
+        pass
 
     # TAX
 
@@ -956,6 +1018,8 @@ class Gameplay:
                 # buy
                 try:
                     player.buy_from_bank(field)
+                    self.game().record(PURCHASE, player.id(), field.id(),
+                                       field.price())
                     self.interface().bought_message(field)
                     return
                 except NoMoneyError:
@@ -975,6 +1039,8 @@ class Gameplay:
         field = self.game().fields()[player.position()]
         if player.want_to_buy(field):
             player.buy_from_bank(field)
+            self.game().record(PURCHASE, player.id(), field.id(),
+                               field.price())
             self.interface().bought_message(field)
         else:
             self.auction(field)
@@ -988,20 +1054,29 @@ class Gameplay:
         id = self.game().current_player_id()
         player = self.game().players()[id]
         field = self.game().fields()[player.position()]
+        self.field_actions()
+        rent = self._rents[field.id()](player, field)
         owner = field.owner()
-        if isinstance(field, Property):
-            rent = field.get_rent()
-        elif isinstance(field, Station):
-            rent = field.get_rent()
-        elif isinstance(field, Service):
-            dices = player.dices()
-            rent = field.get_rent(dices)
-            self.interface().dices_message(dices)
-
         self.interface().pay_rent_message(rent, owner)
 
         self.force_to_pay(player, rent, owner)
 
+    def field_rent(self, player, field):
+        '''
+        Returns rent of Property or Station.
+        '''
+        return field.get_rent()
+
+    def service_rent(self, player, field):
+        '''
+        Player rolls dices, returns rent of Service for their result.
+        '''
+        dices = player.dices()
+        self.game().record(DICES, player.id(), *dices)
+        rent = field.get_rent(dices)
+        self.interface().dices_message(dices)
+        return rent
+
     # AUCTION
 
     def auction(self, field, start_bid=START_BID):
@@ -1009,9 +1084,17 @@ class Gameplay:
         Auction of field. It takes until only one participant
         left or if nobody make a bid.
         Param start_bid is given when it is auction of player's owned field.
+        Game can play sealed-bid auctions instead (see sealed_auction).
         '''
+        if self.game().auction_mode() != OPEN_AUCTION:
+            self.sealed_auction(field, start_bid)
+            return
         id = self.game().current_player_id()
         participants = self.game().bidding_players()
+        if all(isinstance(bidder, AiPlayer)
+               for bidder in participants.values()):
+            self.ai_auction(field, participants, start_bid)
+            return
         current_bid = start_bid
         winner_id = None
         made_first_bid = False
@@ -1027,6 +1110,7 @@ class Gameplay:
                         bid = bidder.bid(current_bid)
                     current_bid = bid
                     winner_id = bidder.id()
+                    self.game().record(BID, winner_id, field.id(), bid)
                     self.interface().successfully_made_bid(bidder, bid)
                     made_first_bid = True
                 else:
@@ -1051,6 +1135,8 @@ class Gameplay:
                             # somebody make a bid
                             current_bid = input
                             winner_id = bidder.id()
+                            self.game().record(BID, winner_id, field.id(),
+                                               current_bid)
                             winner = participants[winner_id]
                             self.interface().successfully_made_bid(winner, current_bid)
                             made_first_bid = True
@@ -1077,6 +1163,184 @@ class Gameplay:
                 # next turn of auction
                 continue
 
+    def bidding_order(self, participants):
+        '''
+        Returns participants of auction in order of bidding,
+        starting after current player.
+        '''
+        bidders = []
+        id = self.game().current_player_id()
+        for _ in range(len(participants)):
+            id = participants.next(id)
+            bidders.append(participants[id])
+        return bidders
+
+    def ai_auction(self, field, participants, start_bid=START_BID):
+        '''
+        Auction of field between AI players only (see ai_auction_result).
+        '''
+        bidders = self.bidding_order(participants)
+        result = self.ai_auction_result(field, bidders, start_bid)
+        if result is None:
+            self.interface().nobody_make_bid()
+            return
+        winner, price = result
+        self.game().record(BID, winner.id(), field.id(), price)
+        self.game().make_deal(winner, field, price)
+        self.interface().winner_of_bid(winner, price)
+
+    def ai_auction_result(self, field, bidders, start_bid=START_BID,
+                          budgets=None):
+        '''
+        Returns winner and price of open auction between AI players
+        or None if nobody bid. Winner and price have the same
+        distribution as in auction, but every bidder draws only once
+        how many times he bids before he passes. Whole rounds
+        in which everybody bids are resolved at once.
+        Budgets are money of bidders by id left for auction.
+        '''
+        if budgets is None:
+            budgets = {bidder.id(): bidder.money() for bidder in bidders}
+        # bidder, bids before pass, most bids before his last bid
+        order = bidders
+        bidders = []
+        for bidder in order:
+            limit = bidder.bid_limit(field, budgets[bidder.id()])
+            if limit < start_bid:
+                last_bid = -1
+            else:
+                last_bid = (limit - start_bid) // BID_DIFFERENCE + 1
+            bidders.append([bidder, bidder.bids_before_pass(), last_bid])
+        if not bidders:
+            return None
+        bids = 0
+        winner = None
+        while True:
+            number = len(bidders)
+            if number > 1:
+                rounds = min(min(will, (last_bid - bids - index) // number + 1)
+                             for index, (_, will, last_bid)
+                             in enumerate(bidders))
+                if rounds > 0:
+                    bids += rounds * number
+                    for bidder in bidders:
+                        bidder[1] -= rounds
+                    winner = bidders[-1][0]
+            for bidder in list(bidders):
+                if bidder[1] > 0 and bids <= bidder[2]:
+                    bids += 1
+                    bidder[1] -= 1
+                    winner = bidder[0]
+                else:
+                    bidders.remove(bidder)
+                if not bidders:
+                    return None
+                elif len(bidders) == 1 and winner is not None:
+                    return winner, start_bid + (bids - 1) * BID_DIFFERENCE
+
+    def sealed_auction(self, field, start_bid=START_BID):
+        '''
+        Sealed-bid auction of field in one round. Every participant
+        makes one bid or passes, the highest bid wins, first one
+        in order of bidding if bids are equal. Winner pays his bid
+        in first-price auction and the second highest bid
+        (or start bid if nobody else bid) in Vickrey auction.
+        '''
+        participants = self.game().bidding_players()
+        bids = []
+        id = self.game().current_player_id()
+        for _ in range(len(participants)):
+            id = participants.next(id)
+            bidder = participants[id]
+            if isinstance(bidder, AiPlayer):
+                bid = bidder.sealed_bid(field, start_bid)
+            else:
+                bid = self.player_sealed_bid(field, bidder, start_bid)
+            if bid is None:
+                self.interface().pass_message(bidder)
+            else:
+                self.game().record(BID, bidder.id(), field.id(), bid)
+                bids.append((bid, bidder))
+        result = self.sealed_auction_result(bids, start_bid)
+        if result is None:
+            self.interface().nobody_make_bid()
+            return
+        winner, price = result
+        self.game().make_deal(winner, field, price)
+        self.interface().winner_of_bid(winner, price)
+
+    def sealed_auction_result(self, bids, start_bid=START_BID):
+        '''
+        Returns winner and price of sealed-bid auction
+        or None if nobody bid. Bids are pairs of bid and bidder
+        in order of bidding.
+        '''
+        if not bids:
+            return None
+        bids = sorted(bids, key=lambda bid: -bid[0])
+        price, winner = bids[0]
+        if self.game().auction_mode() == VICKREY_AUCTION:
+            price = bids[1][0] if len(bids) > 1 else start_bid
+        return winner, price
+
+    def liquidate_estate(self, fields):
+        '''
+        Sells fields of player bancrupt to bank.
+        If all bidders are AI players, all fields are auctioned
+        in one pass with money of bidders reduced by fields they
+        have already won, then bank sells them all at once.
+        Otherwise every field is put for auction one by one.
+        '''
+        participants = self.game().bidding_players()
+        if not all(isinstance(bidder, AiPlayer)
+                   for bidder in participants.values()):
+            for field in fields:
+                self.auction(field)
+            return
+        bidders = self.bidding_order(participants)
+        budgets = {bidder.id(): bidder.money() for bidder in bidders}
+        sealed = self.game().auction_mode() != OPEN_AUCTION
+        deals = []
+        for field in fields:
+            if sealed:
+                bids = []
+                for bidder in bidders:
+                    bid = bidder.sealed_bid(field, START_BID,
+                                            budgets[bidder.id()])
+                    if bid is not None:
+                        bids.append((bid, bidder))
+                result = self.sealed_auction_result(bids)
+            else:
+                result = self.ai_auction_result(field, bidders,
+                                                budgets=budgets)
+            if result is None:
+                self.interface().nobody_make_bid()
+                continue
+            winner, price = result
+            budgets[winner.id()] -= price
+            self.game().record(BID, winner.id(), field.id(), price)
+            deals.append((winner, field, price))
+        self.game().sell_estate(deals)
+        for winner, field, price in deals:
+            self.interface().winner_of_bid(winner, price)
+
+    def player_sealed_bid(self, field, bidder, start_bid):
+        '''
+        Human player's bid in sealed-bid auction, None if he passes.
+        '''
+        while True:
+            choice = self.interface().player_auction(field, bidder, start_bid)
+            if choice == '2':
+                return None
+            input = self.interface().make_first_bid(start_bid, bidder)
+            if input == 'q':
+                continue
+            elif bidder.money() < input:
+                self.interface().no_money_message()
+                continue
+            else:
+                return input
+
     # BANCRUPTION
 
     def no_money_action(self, amount, creditor=None):
@@ -1102,8 +1366,7 @@ class Gameplay:
                 self.game().debt_to_bank()
 
                 # puts all fields for auction
-                for field in fields:
-                    self.auction(field)
+                self.liquidate_estate(fields)
             else:
                 # creditor takes over player's fortune
                 self.interface().creditor_take_over_fortune(creditor, player)
@@ -1126,8 +1389,30 @@ class Gameplay:
         if not earned earn from fields.
         '''
         player = self.game().players()[self.game().current_player_id()]
+        logged = self.game().event_log() is not None
+        if logged:
+            fields = dict(player.fields())
+            levels = {id: field.level() for id, field in fields.items()
+                      if isinstance(field, Property)}
         if not player.earn_from_houses(debt):
             player.earn_from_fields(debt)
+        if logged:
+            self.record_sales(player, fields, levels)
+
+    def record_sales(self, player, fields, levels):
+        '''
+        Records houses and fields sold by player to bank
+        comparing given fields and levels with current ones.
+        '''
+        for id, level in levels.items():
+            field = fields[id]
+            for _ in range(level - field.level()):
+                self.game().record(SELL_HOUSE, player.id(), id,
+                                   int(field.house_price() / 2))
+        for id, field in fields.items():
+            if id not in player.fields():
+                self.game().record(SELL_FIELD, player.id(), id,
+                                   field.mortage_value())
 
     def human_make_money(self, amount):
         '''
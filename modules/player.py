@@ -1,10 +1,238 @@
 from modules.constants import (MAX_NUMBER_OF_PLAYERS, JAIL_ID, START_ID,
-                               START_MONEY, NUMBER_OF_FIELDS, PAYMENT)
-from modules.exceptions import (WrongIdError, NoMoneyError, BuiltUpError,
-                                AlreadyMortagedError, AlreadyArrestedError,
-                                NotArrestedError, NotOwnedError)
-from modules.fields import Property, Station, Service
-from random import randint
+                               START_MONEY, NUMBER_OF_FIELDS, PAYMENT,
+                               DISTRICTS_SIZES, CHECK_FORTUNE, ALLOWED,
+                               NOT_OWNED, BUILT_UP, ALREADY_MORTAGED)
+from modules.exceptions import (WrongIdError, NoMoneyError,
+                                AlreadyArrestedError, NotArrestedError,
+                                FortuneError)
+from modules.fields import Property, Station, Service, check_allowed
+from modules.bitboard import (Bitboard, STATIONS_MASK, SERVICES_MASK,
+                             mask_ids)
+from modules.zobrist import (POSITION, MONEY, JAIL_ROUND, GET_OUT_CARDS,
+                             DOUBLES)
+from collections.abc import Mapping
+from bisect import bisect_left, insort
+from random import Random
+
+
+# generator of players outside game, game sets its own generator
+_default_random = Random()
+
+
+class OwnedFields(Mapping):
+    '''
+    Class OwnedFields. Fields owned by player, mapping of field id
+    to field which keeps ids sorted. Field is added and removed
+    by binary search in sorted ids without rebuilding the mapping.
+
+    Attributes
+    ---------
+    _fields: dict
+        owned fields by id
+    _ids: list
+        sorted ids of owned fields
+
+    Methods
+    -------
+    add:
+        add field keeping order of ids
+    remove:
+        remove field
+    keys, values, items:
+        ids, fields and pairs sorted by id
+    '''
+    __slots__ = ('_fields', '_ids')
+
+    def __init__(self):
+        '''
+        Creates empty OwnedFields.
+        '''
+        self._fields = {}
+        self._ids = []
+
+    def __getitem__(self, id):
+        return self._fields[id]
+
+    def __contains__(self, id):
+        return id in self._fields
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self.items())})'
+
+    def add(self, field):
+        '''
+        Add field keeping order of ids.
+        '''
+        id = field.id()
+        if id not in self._fields:
+            insort(self._ids, id)
+        self._fields[id] = field
+
+    def remove(self, field):
+        '''
+        Remove field, raises KeyError if field is not owned.
+        '''
+        id = field.id()
+        del self._fields[id]
+        del self._ids[bisect_left(self._ids, id)]
+
+    def keys(self):
+        '''
+        Returns list of sorted ids of owned fields.
+        '''
+        return list(self._ids)
+
+    def values(self):
+        '''
+        Returns list of owned fields sorted by id.
+        '''
+        fields = self._fields
+        return [fields[id] for id in self._ids]
+
+    def items(self):
+        '''
+        Returns list of pairs of id and field sorted by id.
+        '''
+        fields = self._fields
+        return [(id, fields[id]) for id in self._ids]
+
+
+class OwnedDistrict:
+    '''
+    Class OwnedDistrict. Properties owned by player in one district,
+    updated when player gets or loses property.
+
+    Attributes
+    ---------
+    _fields: dict
+        owned properties from district
+
+    Methods
+    -------
+    fields:
+        getter
+    add:
+        add property to district
+    remove:
+        remove property from district
+    '''
+    __slots__ = ('_fields',)
+
+    def __init__(self):
+        '''
+        Creates empty OwnedDistrict.
+        '''
+        self._fields = {}
+
+    def fields(self):
+        '''
+        Returns owned properties from district.
+        '''
+        return self._fields
+
+    def add(self, field):
+        '''
+        Add property to district.
+        '''
+        self._fields[field.id()] = field
+
+    def remove(self, field):
+        '''
+        Remove property from district.
+        '''
+        del self._fields[field.id()]
+
+
+class PlayerRing(Mapping):
+    '''
+    Class PlayerRing. Active players, mapping of player id to player
+    linked in ring in order of ids. Removing player and finding
+    next active player after any id take O(1). Removed players keep
+    their link forward, so the ring can be entered from any id.
+
+    Attributes
+    ---------
+    _players: dict
+        active players by id
+    _next: list
+        id of next player for every id [0; number_of_players)
+    _previous: list
+        id of previous player for every id [0; number_of_players)
+
+    Methods
+    -------
+    next:
+        id of next active player after given id
+    remove:
+        remove player from ring
+    '''
+    __slots__ = ('_players', '_next', '_previous')
+
+    def __init__(self, players: dict, number_of_players: int):
+        '''
+        Creates PlayerRing of given players.
+        '''
+        self._players = dict(players)
+        ids = sorted(id for id in self._players
+                     if 0 <= id < number_of_players)
+        self._next = [None] * number_of_players
+        self._previous = [None] * number_of_players
+        if not ids:
+            return
+        index = 0
+        for id in range(number_of_players):
+            if index < len(ids) and ids[index] == id:
+                index += 1
+            self._next[id] = ids[index % len(ids)]
+        for index, id in enumerate(ids):
+            self._previous[id] = ids[index - 1]
+
+    def __getitem__(self, id):
+        return self._players[id]
+
+    def __contains__(self, id):
+        return id in self._players
+
+    def __iter__(self):
+        return iter(sorted(self._players))
+
+    def __len__(self):
+        return len(self._players)
+
+    def __delitem__(self, id):
+        self.remove(id)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self.items())})'
+
+    def next(self, id):
+        '''
+        Returns id of next active player after given id.
+        '''
+        if not self._players:
+            raise ValueError('There are no active players.')
+        next_id = self._next[id]
+        while next_id not in self._players:
+            next_id = self._next[next_id]
+        self._next[id] = next_id
+        return next_id
+
+    def remove(self, id):
+        '''
+        Remove player with given id from ring,
+        raises KeyError if player is not in ring.
+        '''
+        del self._players[id]
+        next_id = self._next[id]
+        previous_id = self._previous[id]
+        self._next[previous_id] = next_id
+        self._previous[next_id] = previous_id
 
 
 class Player:
@@ -21,12 +249,8 @@ class Player:
         id of field on which player stand
     _money: int
         player's account balance
-    _fields: list
-        fields owned by player
-    _stations_owned: int
-        number of stations owned by player
-    _services_owned: int
-        number of services owned by player
+    _fields: OwnedFields
+        fields owned by player sorted by id
     _in_jail_left: int
         number of rounds to come out of jail
     _get_out_cards_number: int
@@ -35,6 +259,20 @@ class Player:
         is player bancrupt
     _doubles_in_row: int
         number of the same points on dices in row
+    _districts: dict
+        owned properties in every district
+    _bitboard: Bitboard
+        owned, mortaged and built fields as bitboards
+    _zobrist: ZobristHash or None
+        hash of state of player's game updated with every change of state,
+        None if state of game is not hashed
+    _capital: int
+        sum of capitalisations of owned fields
+    _check_fortune: bool
+        if fortune is checked against full calculation
+    _random: Random
+        generator of random numbers, shared with game,
+        one module generator for players outside game
 
     Methods
     -------
@@ -60,6 +298,30 @@ class Player:
         getter
     doubles_in_row:
         getter
+    random:
+        getter
+    district:
+        getter of owned district index
+    bitboard:
+        getter
+    capital:
+        getter
+    set_check_fortune:
+        setter
+    set_random:
+        setter
+    set_zobrist:
+        setter
+    set_position:
+        setter
+    set_money:
+        setter
+    set_in_jail_round:
+        setter
+    set_get_out_cards_number:
+        setter
+    set_doubles_in_row:
+        setter
 
     move:
         move player a numbe rof fields
@@ -89,6 +351,8 @@ class Player:
         reste plyer's doubles
     buy_from_bank:
         buy field from bank
+    check_sell:
+        reason why field cannot be sold to bank or ALLOWED
     sell_to_bank:
         sell field to bank
     pay_rent:
@@ -97,8 +361,20 @@ class Player:
         add field to player fields
     remove_field:
         remove field from player's fields
+    index_field:
+        add owned field to indexes
+    unindex_field:
+        remove owned field from indexes
+    update_rents:
+        update rents of fields which depend on given field
+    zobrist_state:
+        values of state in hash of game
+    update_hash:
+        update hash of game after change of state
     fortune:
-        calculate player fortune
+        player fortune
+    calculate_fortune:
+        calculate player fortune from all fields
     can_pay:
         check if player can pay
     set_bancrupt:
@@ -113,6 +389,11 @@ class Player:
         long description of player
     '''
 
+    __slots__ = ('_id', '_name', '_position', '_money', '_fields',
+                 '_in_jail_round', '_get_out_cards_number', '_is_bancrupt',
+                 '_doubles_in_row', '_random', '_districts', '_bitboard',
+                 '_capital', '_check_fortune', '_zobrist')
+
     def __init__(self, id: int, name: str):
         '''
         Creates Player instance.
@@ -123,13 +404,17 @@ class Player:
         self._name = name
         self._position = START_ID
         self._money = START_MONEY
-        self._fields = {}
-        self._stations_owned = 0
-        self._services_owned = 0
+        self._fields = OwnedFields()
         self._in_jail_round = None
         self._get_out_cards_number = 0
         self._is_bancrupt = False
         self._doubles_in_row = 0
+        self._random = _default_random
+        self._districts = {name: OwnedDistrict() for name in DISTRICTS_SIZES}
+        self._bitboard = Bitboard()
+        self._capital = 0
+        self._check_fortune = CHECK_FORTUNE
+        self._zobrist = None
 
     # GETTERS GETTERS GETTERS
 
@@ -167,13 +452,13 @@ class Player:
         '''
         Returns player's number of stations.
         '''
-        return self._stations_owned
+        return self._bitboard.stations()
 
     def services_owned(self):
         '''
         Returns player's number of services.
         '''
-        return self._services_owned
+        return self._bitboard.services()
 
     def in_jail_round(self):
         '''
@@ -199,6 +484,96 @@ class Player:
         '''
         return self._doubles_in_row
 
+    def random(self):
+        '''
+        Returns player's generator of random numbers.
+        '''
+        return self._random
+
+    def district(self, name):
+        '''
+        Returns player's properties in district.
+        '''
+        return self._districts[name]
+
+    def bitboard(self):
+        '''
+        Returns bitboards of player's fields.
+        '''
+        return self._bitboard
+
+    def capital(self):
+        '''
+        Returns sum of capitalisations of player's fields.
+        '''
+        return self._capital
+
+    def set_check_fortune(self, check):
+        '''
+        Set if fortune is checked against full calculation.
+        '''
+        self._check_fortune = check
+
+    def set_random(self, generator):
+        '''
+        Set generator of random numbers used by player.
+        '''
+        self._random = generator
+
+    def set_zobrist(self, zobrist):
+        '''
+        Set hash of game state updated by player.
+        '''
+        self._zobrist = zobrist
+
+    def set_position(self, position):
+        '''
+        Set id of field on which player stand.
+        '''
+        if not 0 <= position < NUMBER_OF_FIELDS:
+            raise ValueError('Wrong id of field.')
+        old = self._position
+        self._position = position
+        self.update_hash(POSITION, old, position)
+
+    def set_money(self, amount):
+        '''
+        Set player's account balance.
+        '''
+        if amount < 0:
+            raise ValueError
+        if self._zobrist is not None:
+            self.update_hash(MONEY, self._money, amount)
+        self._money = amount
+
+    def set_in_jail_round(self, round):
+        '''
+        Set player's jail round, None if player is free.
+        '''
+        old = self._in_jail_round
+        self._in_jail_round = round
+        self.update_hash(JAIL_ROUND, old, round)
+
+    def set_get_out_cards_number(self, number):
+        '''
+        Set number of cards relasing from jail.
+        '''
+        if number < 0:
+            raise ValueError
+        old = self._get_out_cards_number
+        self._get_out_cards_number = number
+        self.update_hash(GET_OUT_CARDS, old, number)
+
+    def set_doubles_in_row(self, number):
+        '''
+        Set number of doubles in row.
+        '''
+        if number < 0:
+            raise ValueError
+        old = self._doubles_in_row
+        self._doubles_in_row = number
+        self.update_hash(DOUBLES, old, number)
+
     def arrested(self):
         '''
         Return true if player is arrested.
@@ -213,6 +588,9 @@ class Player:
         '''
         if number_of_fields <= 0:
             raise ValueError('Player cannot move back.')
+        if self._zobrist is not None:
+            self.update_hash(POSITION, self._position,
+                             self._position + number_of_fields)
         self._position += number_of_fields
 
     def pass_start(self):
@@ -238,6 +616,8 @@ class Player:
         '''
         if amount < 0:
             raise ValueError
+        if self._zobrist is not None:
+            self.update_hash(MONEY, self._money, self._money + amount)
         self._money += amount
 
     def substract_money(self, amount):
@@ -248,6 +628,8 @@ class Player:
             raise ValueError
         if self.money() < amount:
             raise NoMoneyError('Player has not got enough money.')
+        if self._zobrist is not None:
+            self.update_hash(MONEY, self._money, self._money - amount)
         self._money -= amount
 
     def go_to_jail(self):
@@ -256,6 +638,8 @@ class Player:
         '''
         if self.arrested():
             raise AlreadyArrestedError
+        self.update_hash(POSITION, self._position, JAIL_ID)
+        self.update_hash(JAIL_ROUND, None, 1)
         self._position = JAIL_ID
         self._in_jail_round = 1
 
@@ -265,6 +649,7 @@ class Player:
         '''
         if not self.arrested():
             raise NotArrestedError
+        self.update_hash(JAIL_ROUND, self._in_jail_round, None)
         self._in_jail_round = None
 
     def next_jail_round(self):
@@ -274,6 +659,8 @@ class Player:
         if not self.arrested():
             raise NotArrestedError
         self._in_jail_round += 1
+        self.update_hash(JAIL_ROUND, self._in_jail_round - 1,
+                         self._in_jail_round)
 
     def add_get_out_cards(self, value=1):
         '''
@@ -282,6 +669,8 @@ class Player:
         if value < 0:
             raise ValueError
         self._get_out_cards_number += value
+        self.update_hash(GET_OUT_CARDS, self._get_out_cards_number - value,
+                         self._get_out_cards_number)
 
     def substract_get_out_cards(self, value=1):
         '''
@@ -292,6 +681,8 @@ class Player:
         if value > self._get_out_cards_number:
             raise ValueError
         self._get_out_cards_number -= value
+        self.update_hash(GET_OUT_CARDS, self._get_out_cards_number + value,
+                         self._get_out_cards_number)
 
     def use_get_out_card(self):
         '''
@@ -300,13 +691,15 @@ class Player:
         if self.get_out_cards_number() == 0:
             raise ValueError
         self._get_out_cards_number -= 1
+        self.update_hash(GET_OUT_CARDS, self._get_out_cards_number + 1,
+                         self._get_out_cards_number)
 
     def dices(self):
         '''
         Roll two dices and returns result.
         '''
-        dice_1 = randint(1, 6)
-        dice_2 = randint(1, 6)
+        dice_1 = self.random().randint(1, 6)
+        dice_2 = self.random().randint(1, 6)
         return dice_1, dice_2
 
     def add_double(self):
@@ -314,11 +707,14 @@ class Player:
         Increment player's doubles in row.
         '''
         self._doubles_in_row += 1
+        self.update_hash(DOUBLES, self._doubles_in_row - 1,
+                         self._doubles_in_row)
 
     def reset_doubles(self):
         '''
         Set player's doubles to zero.
         '''
+        self.update_hash(DOUBLES, self._doubles_in_row, 0)
         self._doubles_in_row = 0
 
     def buy_from_bank(self, field):
@@ -334,22 +730,29 @@ class Player:
             field.set_owner(self)
             self.add_field(field)
 
+    def check_sell(self, field):
+        '''
+        Returns reason why field cannot be sold to bank or ALLOWED.
+        '''
+        if not field.owner() is self:
+            return NOT_OWNED
+        elif (isinstance(field, Property)
+              and field.field_in_district_has_buildings()):
+            return BUILT_UP
+        elif field.mortaged():
+            return ALREADY_MORTAGED
+        return ALLOWED
+
     def sell_to_bank(self, field):
         '''
         Sell field to bank.
         Remove field from player's fields.
         Add money to player account.
         '''
-        if not field.owner() is self:
-            raise NotOwnedError
-        elif isinstance(field, Property) and field.field_in_district_has_buildings():
-            raise BuiltUpError
-        elif field.mortaged():
-            raise AlreadyMortagedError
-        else:
-            self.add_money(field.mortage_value())
-            field.set_owner(None)
-            self.remove_field(field)
+        check_allowed(self.check_sell(field))
+        self.add_money(field.mortage_value())
+        field.set_owner(None)
+        self.remove_field(field)
 
     def pay_rent(self, rent, owner):
         '''
@@ -365,24 +768,82 @@ class Player:
         '''
         Add field to player's fields.
         '''
-        self._fields[field.id()] = field
-        if isinstance(field, Station):
-            self._stations_owned += 1
-        if isinstance(field, Service):
-            self._services_owned += 1
-        self._fields = dict(sorted(self._fields.items()))
+        self._fields.add(field)
+        if isinstance(field, Property):
+            self.district(field.district()).add(field)
+        self.index_field(field)
+        self.update_rents(field)
 
     def remove_field(self, field):
         '''
         Remove field from player's fields.
         '''
-        del self._fields[field.id()]
-        if isinstance(field, Station):
-            self._stations_owned -= 1
-        if isinstance(field, Service):
-            self._services_owned -= 1
+        self._fields.remove(field)
+        if isinstance(field, Property):
+            self.district(field.district()).remove(field)
+        self.unindex_field(field)
+        self.update_rents(field)
+
+    def index_field(self, field):
+        '''
+        Add owned field to player's indexes.
+        Fields call it after change of their level or mortage.
+        '''
+        self._capital += field.capitalisation()
+        self._bitboard.add(field)
+
+    def unindex_field(self, field):
+        '''
+        Remove owned field from player's indexes.
+        Fields call it before change of their level or mortage.
+        '''
+        self._capital -= field.capitalisation()
+        self._bitboard.remove(field)
+
+    def update_rents(self, field):
+        '''
+        Updates rents of player's fields which depend on number
+        of owned fields like given one: properties from its district,
+        stations or services. Called after field is added or removed.
+        '''
+        if isinstance(field, Property):
+            fields = self.district(field.district()).fields().values()
+        elif isinstance(field, (Station, Service)):
+            mask = (STATIONS_MASK if isinstance(field, Station)
+                    else SERVICES_MASK)
+            owned = self._bitboard.owned() & mask
+            fields = [self._fields[id] for id in mask_ids(owned)]
+        else:
+            fields = []
+        for owned in fields:
+            owned.update_rent(self)
+
+    def zobrist_state(self):
+        '''
+        Returns values of player's state in hash of game
+        in order of kinds of state.
+        '''
+        return (self._position, self._money, self._in_jail_round,
+                self._get_out_cards_number, self._doubles_in_row)
+
+    def update_hash(self, kind, old, new):
+        '''
+        Updates hash of game after change of player's state.
+        '''
+        if self._zobrist is not None:
+            self._zobrist.update_player(self._id, kind, old, new)
 
     def fortune(self):
+        '''
+        Returns player fortune kept up to date with every change.
+        In check mode compares it with full calculation.
+        '''
+        fortune = self.money() + self._capital
+        if self._check_fortune and fortune != self.calculate_fortune():
+            raise FortuneError
+        return fortune
+
+    def calculate_fortune(self):
         '''
         Calculate player fortune
         '''
@@ -402,6 +863,7 @@ class Player:
         set player bancrupt
         '''
         self._is_bancrupt = True
+        self.update_hash(POSITION, self._position, None)
         self._position = None
 
     def count_houses(self):
@@ -0,0 +1,299 @@
+'''
+Fast-forward replay of games recorded in event log.
+Events are applied directly to game state, without AI decisions
+and without interface.
+'''
+from modules.constants import FIELDS_PATH, KEYFRAME_INTERVAL
+from modules.game import Game
+from modules.player import Player
+from modules.fields import BuyableField, Property
+from modules.events import (TURN, ROLL, DICES, MOVE, INCOME, CHARGE,
+                            TRANSFER, PURCHASE, BID, MORTGAGE, END_MORTGAGE,
+                            BUILD, SELL_HOUSE, SELL_FIELD, ARREST, RELEASE,
+                            JAIL_ROUND, CHANCE, GET_OUT_CARD, BANCRUPTCY)
+from modules.snapshot import to_bytes, from_bytes
+from bisect import bisect_right
+
+
+def game_state(game: Game) -> tuple:
+    '''
+    Returns state of game as tuple
+    (current player id, current round, players states, fields states).
+    '''
+    players = tuple(
+        (player.position(), player.money(), player.in_jail_round(),
+         player.get_out_cards_number(), player.is_bancrupt(),
+         player.doubles_in_row())
+        for player in game.players().values()
+    )
+    fields = tuple(
+        (field.id(), field.owner().id(),
+         field.level() if isinstance(field, Property) else 0,
+         field.mortaged())
+        for field in game.fields().values()
+        if isinstance(field, BuyableField) and field.owner() is not None
+    )
+    return (game.current_player_id(), game.current_round(), players, fields)
+
+
+class Replayer:
+    '''
+    Class Replayer. Rebuilds state of recorded game at any turn.
+    Every KEYFRAME_INTERVAL turns snapshot of game is kept as keyframe,
+    so jump to given turn replays only events after nearest keyframe.
+
+    Attributes:
+    -----------
+    _events: list
+        recorded events (turn, kind, player, target, value)
+    _number_of_players: int
+        number of players in recorded game
+    _number_of_rounds: int or None
+        number of rounds of recorded game
+    _interval: int
+        number of turns between keyframes
+    _path: str
+        path to fields config
+    _ends: list
+        index of first event after every turn
+    _keyframes: list
+        snapshots of game after every interval turns
+    _game: Game
+        game in replayed state
+    _turn: int
+        turn after which game is in replayed state
+    _actions: dict
+        functions applying events of every kind
+
+    Methods:
+    -------
+    events:
+        getter
+    number_of_players:
+        getter
+    interval:
+        getter
+    game:
+        getter
+    turn:
+        getter
+    number_of_turns:
+        number of recorded turns
+    create_game:
+        creates game in starting state
+    apply:
+        applies one event to game
+    forward:
+        replays events until end of given turn
+    game_at:
+        returns game after given turn
+    '''
+    def __init__(self, events, number_of_players: int,
+                 number_of_rounds: int = None,
+                 interval: int = KEYFRAME_INTERVAL, path: str = FIELDS_PATH):
+        '''
+        Creates Replayer of given events and prepares keyframes.
+        '''
+        if interval <= 0:
+            raise ValueError('Interval must be positive.')
+        self._events = list(events)
+        self._number_of_players = number_of_players
+        self._number_of_rounds = number_of_rounds
+        self._interval = interval
+        self._path = path
+        self._actions = {
+            TURN: self._turn_event,
+            ROLL: self._roll_event,
+            MOVE: self._move_event,
+            INCOME: self._income_event,
+            CHARGE: self._charge_event,
+            TRANSFER: self._transfer_event,
+            PURCHASE: self._purchase_event,
+            MORTGAGE: self._mortgage_event,
+            END_MORTGAGE: self._end_mortgage_event,
+            BUILD: self._build_event,
+            SELL_HOUSE: self._sell_house_event,
+            SELL_FIELD: self._sell_field_event,
+            ARREST: self._arrest_event,
+            RELEASE: self._release_event,
+            JAIL_ROUND: self._jail_round_event,
+            GET_OUT_CARD: self._get_out_card_event,
+            BANCRUPTCY: self._bancruptcy_event,
+        }
+        for kind in (DICES, BID, CHANCE):
+            self._actions[kind] = self._ignore_event
+        turns = [event[0] for event in self._events]
+        last_turn = turns[-1] if turns else 0
+        self._ends = [bisect_right(turns, turn)
+                      for turn in range(last_turn + 1)]
+        self._game = self.create_game()
+        self._turn = 0
+        self._keyframes = [to_bytes(self._game)]
+        for turn in range(interval, last_turn + 1, interval):
+            self.forward(turn)
+            self._keyframes.append(to_bytes(self._game))
+
+    def events(self) -> list:
+        '''
+        Returns recorded events.
+        '''
+        return self._events
+
+    def number_of_players(self) -> int:
+        '''
+        Returns number of players in recorded game.
+        '''
+        return self._number_of_players
+
+    def interval(self) -> int:
+        '''
+        Returns number of turns between keyframes.
+        '''
+        return self._interval
+
+    def game(self) -> Game:
+        '''
+        Returns game in replayed state.
+        '''
+        return self._game
+
+    def turn(self) -> int:
+        '''
+        Returns turn after which game is in replayed state.
+        '''
+        return self._turn
+
+    def number_of_turns(self) -> int:
+        '''
+        Returns number of recorded turns.
+        '''
+        return len(self._ends) - 1
+
+    def create_game(self) -> Game:
+        '''
+        Creates game with players in starting state.
+        '''
+        game = Game()
+        game.create_fields(self._path)
+        game.set_number_of_players(self.number_of_players())
+        players = {}
+        for id in range(self.number_of_players()):
+            players[id] = Player(id, f'Gracz {id}')
+        game.set_players(players)
+        if self._number_of_rounds is not None:
+            game.set_number_of_rounds(self._number_of_rounds)
+        return game
+
+    def apply(self, event: tuple) -> None:
+        '''
+        Applies one event to replayed game.
+        '''
+        turn, kind, player_id, target, value = event
+        player = self._game.players()[player_id]
+        self._actions[kind](player, target, value)
+
+    def forward(self, turn: int) -> Game:
+        '''
+        Replays events until end of given turn.
+        Turn must not be earlier than current turn.
+        '''
+        if not self._turn <= turn <= self.number_of_turns():
+            raise ValueError('Wrong number of turn.')
+        start = self._ends[self._turn]
+        for event in self._events[start:self._ends[turn]]:
+            self.apply(event)
+        self._turn = turn
+        return self._game
+
+    def game_at(self, turn: int) -> Game:
+        '''
+        Returns game after given turn, 0 is start of game.
+        Goes forward from current state or from nearest keyframe.
+        Previously returned game objects become outdated.
+        '''
+        if not 0 <= turn <= self.number_of_turns():
+            raise ValueError('Wrong number of turn.')
+        keyframe = turn // self._interval
+        if not keyframe * self._interval <= self._turn <= turn:
+            self._game = from_bytes(self._keyframes[keyframe], self._path)
+            self._turn = keyframe * self._interval
+        return self.forward(turn)
+
+    # EVENTS EVENTS
+
+    def _ignore_event(self, player, target, value):
+        pass
+
+    def _turn_event(self, player, target, value):
+        self._game.set_current_player_id(player.id())
+        self._game.set_current_round(value)
+
+    def _roll_event(self, player, target, value):
+        if target == value:
+            player.add_double()
+        else:
+            player.reset_doubles()
+
+    def _move_event(self, player, target, value):
+        player.set_position(target)
+
+    def _income_event(self, player, target, value):
+        player.add_money(value)
+
+    def _charge_event(self, player, target, value):
+        player.substract_money(value)
+
+    def _transfer_event(self, player, target, value):
+        player.substract_money(value)
+        self._game.players()[target].add_money(value)
+
+    def _purchase_event(self, player, target, value):
+        self._game.make_deal(player, self._game.fields()[target], value)
+
+    def _mortgage_event(self, player, target, value):
+        player.add_money(value)
+        self._game.fields()[target].set_mortaged(True)
+
+    def _end_mortgage_event(self, player, target, value):
+        player.substract_money(value)
+        self._game.fields()[target].set_mortaged(False)
+
+    def _build_event(self, player, target, value):
+        field = self._game.fields()[target]
+        player.substract_money(value)
+        field.set_level(field.level() + 1)
+
+    def _sell_house_event(self, player, target, value):
+        field = self._game.fields()[target]
+        player.add_money(value)
+        field.set_level(field.level() - 1)
+
+    def _sell_field_event(self, player, target, value):
+        field = self._game.fields()[target]
+        player.add_money(value)
+        field.set_owner(None)
+        player.remove_field(field)
+
+    def _arrest_event(self, player, target, value):
+        self._game.arrest(player)
+
+    def _release_event(self, player, target, value):
+        self._game.leave_jail(player)
+
+    def _jail_round_event(self, player, target, value):
+        player.next_jail_round()
+
+    def _get_out_card_event(self, player, target, value):
+        if value > 0:
+            player.add_get_out_cards(value)
+        else:
+            player.substract_get_out_cards(-value)
+
+    def _bancruptcy_event(self, player, target, value):
+        current_player_id = self._game.current_player_id()
+        self._game.set_current_player_id(player.id())
+        if target == -1:
+            self._game.debt_to_bank()
+        else:
+            self._game.debt_to_player(self._game.players()[target])
+        self._game.set_current_player_id(current_player_id)
@@ -0,0 +1,215 @@
+from modules.constants import FIELDS_PATH, SIMULATION_ROUNDS, OPEN_AUCTION
+from modules.chances import NUMBER_OF_CHANCES
+from modules.exceptions import HumanPlayerError
+from modules.game import Game
+from modules.gameplay import Gameplay
+from modules.ai import AiPlayer
+from modules.zobrist import ZobristHash
+from hashlib import blake2b
+
+
+class HeadlessInterface:
+    '''
+    Class HeadlessInterface. Replaces Interface in games played
+    only by AI players. Every message used by Gameplay on AI
+    turns does nothing, so game runs without any input or output.
+    Methods asking human player for a choice are not defined.
+    '''
+
+    def dices_message(self, result):
+        pass
+
+    def move_message(self, result, field):
+        pass
+
+    def start_payment_message(self):
+        pass
+
+    def arrest_player_message(self):
+        pass
+
+    def leave_jail_message(self):
+        pass
+
+    def stay_in_jail_message(self):
+        pass
+
+    def chance_drawn_message(self, id):
+        pass
+
+    def scratch_card(self, dices, amount):
+        pass
+
+    def pay_tax_message(self, value):
+        pass
+
+    def mortaged_message(self, field):
+        pass
+
+    def already_owned_message(self, field):
+        pass
+
+    def bought_message(self, field):
+        pass
+
+    def not_buy_message(self, player, field):
+        pass
+
+    def pay_rent_message(self, rent, owner):
+        pass
+
+    def successfully_made_bid(self, bidder, bid):
+        pass
+
+    def pass_message(self, player):
+        pass
+
+    def nobody_make_bid(self):
+        pass
+
+    def winner_of_bid(self, winner, bid):
+        pass
+
+    def bancrupt(self, player):
+        pass
+
+    def bank_take_over_fortune(self, bancrupt):
+        pass
+
+    def creditor_take_over_fortune(self, creditor, bancrupt):
+        pass
+
+    def simple_winner(self, winner):
+        pass
+
+    def calculated_winners(self, winners):
+        pass
+
+
+class Simulation:
+    '''
+    Class Simulation. Plays whole game between AI players
+    using Gameplay rules and HeadlessInterface.
+
+    Attributes:
+    -----------
+    _game: Game
+        state of simulated game
+    _gameplay: Gameplay
+        rules of game connected with headless interface
+
+    Methods:
+    -------
+    game:
+        getter
+    gameplay:
+        getter
+    run:
+        plays game until it is finished
+    winners_ids:
+        ids of players who won the game
+    rounds_played:
+        number of played rounds
+    result:
+        summary of finished game
+    '''
+    def __init__(self, game: Game):
+        '''
+        Creates Simulation of prepared game.
+        '''
+        for player in game.players().values():
+            if not isinstance(player, AiPlayer):
+                raise HumanPlayerError
+        self._game = game
+        self._gameplay = Gameplay(HeadlessInterface(), game)
+
+    def game(self) -> Game:
+        '''
+        Returns simulated game.
+        '''
+        return self._game
+
+    def gameplay(self) -> Gameplay:
+        '''
+        Returns gameplay of simulated game.
+        '''
+        return self._gameplay
+
+    def run(self) -> dict:
+        '''
+        Plays game until it is finished and returns its result.
+        '''
+        self.gameplay().play()
+        return self.result()
+
+    def winners_ids(self) -> list:
+        '''
+        Returns ids of players who won the game.
+        '''
+        if self.game().one_remainded():
+            return [self.game().simple_winner().id()]
+        return list(self.game().richest_players())
+
+    def rounds_played(self) -> int:
+        '''
+        Returns number of rounds played in game.
+        '''
+        if self.game().reached_number_of_rounds():
+            return self.game().number_of_rounds()
+        return self.game().current_round()
+
+    def result(self) -> dict:
+        '''
+        Returns summary of game: winners, number of rounds
+        and fortunes of all players (zero for bancrupts).
+        '''
+        fortunes = {}
+        for player in self.game().players().values():
+            fortune = 0 if player.is_bancrupt() else player.fortune()
+            fortunes[player.id()] = fortune
+        return {
+            'winners': self.winners_ids(),
+            'rounds': self.rounds_played(),
+            'fortunes': fortunes
+        }
+
+
+def create_ai_game(number_of_players: int,
+                   number_of_rounds: int = SIMULATION_ROUNDS,
+                   seed: int = None,
+                   auction_mode: int = OPEN_AUCTION,
+                   shuffled_deck: bool = False,
+                   zobrist: bool = False) -> Game:
+    '''
+    Creates game with board from config and only AI players.
+    Game with given seed is always played the same way.
+    If shuffled_deck is True, chance cards are drawn without replacement.
+    If zobrist is True, game state is hashed with keys generated
+    from game's seed.
+    '''
+    game = Game(seed)
+    game.create_fields(FIELDS_PATH)
+    game.set_number_of_players(number_of_players)
+    players = {}
+    for id in range(number_of_players):
+        players[id] = AiPlayer(id, f'AI {id}')
+    game.set_players(players)
+    game.set_number_of_rounds(number_of_rounds)
+    game.set_auction_mode(auction_mode)
+    if shuffled_deck:
+        game.set_chance_deck(range(NUMBER_OF_CHANCES))
+    if zobrist:
+        game.set_zobrist(ZobristHash(seed))
+    return game
+
+
+def game_seed(root_seed: int, index: int) -> int:
+    '''
+    Derives seed of game with given index from root seed.
+    Seeds of games are independent of each other and of order
+    in which games are played, so every game of tournament
+    can be replayed only from root seed and its index.
+    '''
+    data = f'{root_seed}:{index}'.encode()
+    digest = blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
@@ -0,0 +1,161 @@
+'''
+Compact binary snapshots of whole game state.
+Snapshot contains players, ownership of fields, levels of properties,
+mortages, jail state, get out cards, current player and round,
+auction mode, shuffled deck of chance cards and state of game's generator
+of random numbers, so game loaded from snapshot is played the same way
+as original one.
+Board is not saved, it is created from fields config.
+'''
+from modules.constants import FIELDS_PATH, JAIL_ID
+from modules.game import Game
+from modules.player import Player
+from modules.ai import AiPlayer
+from modules.fields import BuyableField, Property
+from modules.exceptions import (SnapshotError, AuctionModeError,
+                               PlayersNumberError, RepeatedIdError)
+from struct import Struct, error as StructError
+
+
+MAGIC = b'MNPL'
+VERSION = 3
+
+# magic, version, number of players, current player id, current round,
+# number of rounds (0 if not given), finished, auction mode,
+# number of saved fields, number of chance cards in deck (0 if cards are
+# drawn with replacement), number of cards drawn from deck
+HEADER = Struct('<4sBBBII?BBBB')
+# id, is ai, position (-1 if bancrupt), money, jail round (0 if free),
+# get out cards, doubles in row, is bancrupt, length of name
+PLAYER = Struct('<B?bIBBB?B')
+# id, owner id, level, mortaged
+FIELD = Struct('<BBB?')
+# state of Mersenne Twister, has gauss next, gauss next
+RANDOM = Struct('<625I?d')
+
+
+def to_bytes(game: Game) -> bytes:
+    '''
+    Returns snapshot of game state.
+    '''
+    fields = [field for field in game.fields().values()
+              if isinstance(field, BuyableField) and field.owner() is not None]
+    deck = game.chance_deck() or []
+    parts = [HEADER.pack(MAGIC, VERSION, game.number_of_players(),
+                         game.current_player_id(), game.current_round(),
+                         game.number_of_rounds() or 0, game.finished(),
+                         game.auction_mode(), len(fields), len(deck),
+                         game.deck_position())]
+    for player in game.players().values():
+        name = player.name().encode()
+        jail_round = player.in_jail_round() or 0
+        position = -1 if player.is_bancrupt() else player.position()
+        parts.append(PLAYER.pack(player.id(), isinstance(player, AiPlayer),
+                                 position, player.money(), jail_round,
+                                 player.get_out_cards_number(),
+                                 player.doubles_in_row(),
+                                 player.is_bancrupt(), len(name)))
+        parts.append(name)
+    for field in fields:
+        level = field.level() if isinstance(field, Property) else 0
+        parts.append(FIELD.pack(field.id(), field.owner().id(), level,
+                                field.mortaged()))
+    parts.append(bytes(deck))
+    version, internal_state, gauss_next = game.random().getstate()
+    parts.append(RANDOM.pack(*internal_state, gauss_next is not None,
+                             gauss_next or 0.0))
+    return b''.join(parts)
+
+
+def from_bytes(data: bytes, path: str = FIELDS_PATH) -> Game:
+    '''
+    Creates game from snapshot, board is created from fields config.
+    '''
+    try:
+        return _read_game(memoryview(data), path)
+    except (StructError, UnicodeDecodeError, KeyError, ValueError,
+            AuctionModeError, PlayersNumberError, RepeatedIdError) as e:
+        raise SnapshotError() from e
+
+
+def _read_game(data, path):
+    '''
+    Reads game from snapshot data.
+    '''
+    (magic, version, number_of_players, current_player_id, current_round,
+     number_of_rounds, finished, auction_mode, number_of_fields, deck_size,
+     deck_position) = \
+        HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError()
+    offset = HEADER.size
+    game = Game()
+    game.create_fields(path)
+    game.set_number_of_players(number_of_players)
+    if number_of_rounds:
+        game.set_number_of_rounds(number_of_rounds)
+    game.set_auction_mode(auction_mode)
+    players = {}
+    jail = game.fields()[JAIL_ID]
+    for _ in range(number_of_players):
+        (id, is_ai, position, money, jail_round, cards, doubles,
+         bancrupt, length) = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        name = bytes(data[offset:offset + length]).decode()
+        offset += length
+        player = (AiPlayer if is_ai else Player)(id, name)
+        if jail_round:
+            jail.add(player)
+            player.set_in_jail_round(jail_round)
+        if bancrupt:
+            player.set_bancrupt()
+        else:
+            player.set_position(position)
+        player.set_money(money)
+        player.set_get_out_cards_number(cards)
+        player.set_doubles_in_row(doubles)
+        players[id] = player
+    game.set_players(players)
+    for _ in range(number_of_fields):
+        id, owner_id, level, mortaged = FIELD.unpack_from(data, offset)
+        offset += FIELD.size
+        field = game.fields().get(id)
+        if not isinstance(field, BuyableField) or owner_id not in players:
+            raise SnapshotError()
+        owner = players[owner_id]
+        field.set_owner(owner)
+        owner.add_field(field)
+        if isinstance(field, Property):
+            field.set_level(level)
+        field.set_mortaged(mortaged)
+    if deck_size:
+        deck = list(data[offset:offset + deck_size])
+        offset += deck_size
+        game.set_chance_deck(deck, deck_position)
+    *internal_state, has_gauss_next, gauss_next = \
+        RANDOM.unpack_from(data, offset)
+    if offset + RANDOM.size != len(data):
+        raise SnapshotError()
+    game.random().setstate((3, tuple(internal_state),
+                            gauss_next if has_gauss_next else None))
+    game.set_current_player_id(current_player_id)
+    game.set_current_round(current_round)
+    if finished:
+        game.set_finished()
+    return game
+
+
+def save_game(game: Game, path: str) -> None:
+    '''
+    Saves snapshot of game to file.
+    '''
+    with open(path, 'wb') as handle:
+        handle.write(to_bytes(game))
+
+
+def load_game(path: str, fields_path: str = FIELDS_PATH) -> Game:
+    '''
+    Loads game from snapshot file.
+    '''
+    with open(path, 'rb') as handle:
+        return from_bytes(handle.read(), fields_path)
@@ -0,0 +1,228 @@
+from modules.constants import (SIMULATION_ROUNDS, TASKS_PER_PROCESS,
+                               MIN_NUMBER_OF_PLAYERS, MAX_NUMBER_OF_PLAYERS,
+                               OPEN_AUCTION, AUCTION_MODES)
+from modules.exceptions import PlayersNumberError, AuctionModeError
+from modules.simulation import Simulation, create_ai_game, game_seed
+from multiprocessing import Pool, cpu_count
+from random import SystemRandom
+
+
+def play_game(task: tuple) -> tuple:
+    '''
+    Plays one AI game in worker process.
+    Task is a tuple (index, number_of_players, number_of_rounds, seed,
+    auction_mode).
+    Returns compact result (index, winners_ids, rounds, fortunes) where
+    fortunes is a tuple ordered by player id.
+    '''
+    index, number_of_players, number_of_rounds, seed, auction_mode = task
+    game = create_ai_game(number_of_players, number_of_rounds, seed,
+                          auction_mode)
+    result = Simulation(game).run()
+    fortunes = tuple(result['fortunes'][id]
+                     for id in sorted(result['fortunes']))
+    return index, tuple(result['winners']), result['rounds'], fortunes
+
+
+class Tournament:
+    '''
+    Class Tournament. Plays many AI games in pool of processes
+    and aggregates their results.
+
+    Attributes:
+    -----------
+    _number_of_games: int
+        number of games to play
+    _number_of_players: int
+        number of players in every game
+    _number_of_rounds: int
+        max number of rounds in every game
+    _processes: int
+        number of worker processes
+    _seed: int
+        root seed from which seeds of all games are derived
+    _auction_mode: int
+        kind of auctions played in every game
+    _games_played: int
+        number of already aggregated games
+    _wins: dict
+        wins of every player id, draw is divided between winners
+    _rounds_sum: int
+        sum of rounds played in all games
+    _fortunes_sum: dict
+        sum of final fortunes of every player id
+
+    Methods:
+    -------
+    number_of_games:
+        getter
+    number_of_players:
+        getter
+    number_of_rounds:
+        getter
+    processes:
+        getter
+    seed:
+        getter
+    auction_mode:
+        getter
+    games_played:
+        getter
+    chunksize:
+        number of games sent to worker at once
+    tasks:
+        generates tasks for workers
+    results:
+        plays games and yields results as soon as they are ready
+    add_result:
+        aggregates result of one game
+    run:
+        plays all games and returns summary
+    summary:
+        aggregated statistics of played games
+    '''
+    def __init__(self, number_of_games: int, number_of_players: int,
+                 number_of_rounds: int = SIMULATION_ROUNDS,
+                 processes: int = None, seed: int = None,
+                 auction_mode: int = OPEN_AUCTION):
+        '''
+        Creates Tournament instance.
+        If seed is not given, random root seed is chosen.
+        '''
+        if not (MIN_NUMBER_OF_PLAYERS <= number_of_players
+                <= MAX_NUMBER_OF_PLAYERS):
+            raise PlayersNumberError
+        if number_of_games < 0:
+            raise ValueError('Number of games cannot be negative.')
+        if auction_mode not in AUCTION_MODES:
+            raise AuctionModeError
+        self._number_of_games = number_of_games
+        self._number_of_players = number_of_players
+        self._number_of_rounds = number_of_rounds
+        self._processes = processes if processes is not None else cpu_count()
+        if seed is None:
+            seed = SystemRandom().getrandbits(64)
+        self._seed = seed
+        self._auction_mode = auction_mode
+        self._games_played = 0
+        self._wins = {id: 0 for id in range(number_of_players)}
+        self._rounds_sum = 0
+        self._fortunes_sum = {id: 0 for id in range(number_of_players)}
+
+    def number_of_games(self) -> int:
+        '''
+        Returns number of games to play.
+        '''
+        return self._number_of_games
+
+    def number_of_players(self) -> int:
+        '''
+        Returns number of players in every game.
+        '''
+        return self._number_of_players
+
+    def number_of_rounds(self) -> int:
+        '''
+        Returns max number of rounds in every game.
+        '''
+        return self._number_of_rounds
+
+    def processes(self) -> int:
+        '''
+        Returns number of worker processes.
+        '''
+        return self._processes
+
+    def seed(self) -> int:
+        '''
+        Returns root seed of tournament.
+        '''
+        return self._seed
+
+    def auction_mode(self) -> int:
+        '''
+        Returns kind of auctions played in every game.
+        '''
+        return self._auction_mode
+
+    def games_played(self) -> int:
+        '''
+        Returns number of aggregated games.
+        '''
+        return self._games_played
+
+    def chunksize(self) -> int:
+        '''
+        Returns number of games sent to worker in one message.
+        Every worker gets about TASKS_PER_PROCESS chunks, so
+        sending tasks and results does not dominate short games
+        and work is still balanced at the end of tournament.
+        '''
+        chunks = self.processes() * TASKS_PER_PROCESS
+        return max(1, self.number_of_games() // chunks)
+
+    def tasks(self):
+        '''
+        Generates tasks for workers, one for every game.
+        Every game gets own seed derived from root seed.
+        '''
+        players = self.number_of_players()
+        rounds = self.number_of_rounds()
+        mode = self.auction_mode()
+        for index in range(self.number_of_games()):
+            yield index, players, rounds, game_seed(self.seed(), index), mode
+
+    def results(self):
+        '''
+        Plays games in pool of processes.
+        Yields results of games in order of finishing.
+        '''
+        with Pool(self.processes()) as pool:
+            results = pool.imap_unordered(play_game, self.tasks(),
+                                          self.chunksize())
+            for result in results:
+                yield result
+
+    def add_result(self, result: tuple) -> None:
+        '''
+        Aggregates result of one game.
+        '''
+        index, winners, rounds, fortunes = result
+        self._games_played += 1
+        for id in winners:
+            self._wins[id] += 1 / len(winners)
+        self._rounds_sum += rounds
+        for id, fortune in enumerate(fortunes):
+            self._fortunes_sum[id] += fortune
+
+    def run(self) -> dict:
+        '''
+        Plays all games and returns summary.
+        '''
+        for result in self.results():
+            self.add_result(result)
+        return self.summary()
+
+    def summary(self) -> dict:
+        '''
+        Returns aggregated statistics of played games:
+        number of games, wins and win rate of every player id,
+        mean number of rounds and mean fortune of every player id.
+        '''
+        games = self.games_played()
+        if games == 0:
+            win_rates = {id: 0 for id in self._wins}
+            mean_rounds = 0
+            mean_fortunes = {id: 0 for id in self._fortunes_sum}
+        else:
+            win_rates = {id: wins / games for id, wins in self._wins.items()}
+            mean_rounds = self._rounds_sum / games
+            mean_fortunes = {id: total / games
+                             for id, total in self._fortunes_sum.items()}
+        return {
+            'games': games,
+            'wins': dict(self._wins),
+            'win_rates': win_rates,
+            'mean_rounds': mean_rounds,
+            'mean_fortunes': mean_fortunes
+        }
@@ -0,0 +1,241 @@
+'''
+Zobrist hashing of game state. Every value of every part of state
+(position, jail round, get out cards and doubles of player, owner,
+level and mortage of field, current player) has random 64-bit key,
+money of player is mixed with its own random key. Hash of state is XOR
+of keys of its current values, so change of one value updates hash
+in O(1) by XOR with keys of old and new value.
+'''
+from modules.constants import (NUMBER_OF_FIELDS, MAX_NUMBER_OF_PLAYERS,
+                               MAX_PROPERTY_LEVEL, ZOBRIST_COUNTER_LIMIT)
+from random import Random
+
+
+# kinds of hashed state of player
+POSITION = 0
+MONEY = 1
+JAIL_ROUND = 2
+GET_OUT_CARDS = 3
+DOUBLES = 4
+
+# kinds of hashed state of field
+OWNER = 0
+LEVEL = 1
+MORTAGED = 2
+
+# number of keys of every kind of state, money has one key mixed with it
+PLAYER_STATES = (NUMBER_OF_FIELDS + 1, 1, ZOBRIST_COUNTER_LIMIT,
+                 ZOBRIST_COUNTER_LIMIT, ZOBRIST_COUNTER_LIMIT)
+FIELD_STATES = (MAX_NUMBER_OF_PLAYERS + 1, MAX_PROPERTY_LEVEL + 1, 2)
+
+MASK_64 = (1 << 64) - 1
+
+
+def position_index(position) -> int:
+    '''
+    Returns index of key of position, None is bancrupt player.
+    '''
+    if position is None:
+        return NUMBER_OF_FIELDS
+    return position % NUMBER_OF_FIELDS
+
+
+def counter_index(counter) -> int:
+    '''
+    Returns index of key of limited counter, None is zero.
+    '''
+    if not counter:
+        return 0
+    if counter < ZOBRIST_COUNTER_LIMIT:
+        return counter
+    return ZOBRIST_COUNTER_LIMIT - 1
+
+
+def money_key(key: int, money: int) -> int:
+    '''
+    Returns key of exact amount of money mixed with player's money key
+    by finalizer of SplitMix64, so every amount has different key.
+    '''
+    value = (key + money) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xbf58476d1ce4e5b9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94d049bb133111eb) & MASK_64
+    return value ^ (value >> 31)
+
+
+# index of key of value by kind of player's state, money is not indexed
+PLAYER_INDEXES = (position_index, None, counter_index, counter_index,
+                  counter_index)
+
+
+def player_key(keys: list, kind: int, value) -> int:
+    '''
+    Returns key of value of player's state from player's keys.
+    Position None is bancrupt, jail round None is free player
+    and counters are limited.
+    '''
+    if kind == MONEY:
+        return money_key(keys[MONEY][0], value)
+    return keys[kind][PLAYER_INDEXES[kind](value)]
+
+
+def field_index(kind: int, value) -> int:
+    '''
+    Returns index of key of value of field's state.
+    Owner is given by id, None is bank.
+    '''
+    if kind == OWNER:
+        return 0 if value is None else value + 1
+    return int(value)
+
+
+class ZobristKeys:
+    '''
+    Class ZobristKeys. Random keys of every value of game state.
+
+    Attributes
+    ---------
+    _players: list
+        keys of player id, kind of state and index of value
+    _fields: list
+        keys of field id, kind of state and index of value
+    _current_players: list
+        keys of id of current player
+
+    Methods
+    -------
+    players:
+        getter
+    fields:
+        getter
+    current_players:
+        getter
+    '''
+    __slots__ = ('_players', '_fields', '_current_players')
+
+    def __init__(self, seed=None):
+        '''
+        Generates keys from given seed, from random seed by default.
+        '''
+        generator = Random(seed)
+
+        def keys(number):
+            return [generator.getrandbits(64) for _ in range(number)]
+        self._players = [[keys(number) for number in PLAYER_STATES]
+                         for _ in range(MAX_NUMBER_OF_PLAYERS)]
+        self._fields = [[keys(number) for number in FIELD_STATES]
+                        for _ in range(NUMBER_OF_FIELDS)]
+        self._current_players = keys(MAX_NUMBER_OF_PLAYERS)
+
+    def players(self) -> list:
+        '''
+        Returns keys of players' states.
+        '''
+        return self._players
+
+    def fields(self) -> list:
+        '''
+        Returns keys of fields' states.
+        '''
+        return self._fields
+
+    def current_players(self) -> list:
+        '''
+        Returns keys of current player.
+        '''
+        return self._current_players
+
+
+class ZobristHash:
+    '''
+    Class ZobristHash. Hash of game state updated by players and fields
+    with every change of their state.
+
+    Attributes
+    ---------
+    _keys: ZobristKeys
+        keys of values of state
+    _value: int
+        current hash
+
+    Methods
+    -------
+    keys:
+        getter
+    value:
+        getter
+    update_player:
+        change value of player's state
+    update_field:
+        change value of field's state
+    update_current_player:
+        change current player
+    rehash:
+        calculate hash of whole game state
+    '''
+    __slots__ = ('_keys', '_value')
+
+    def __init__(self, seed=None):
+        '''
+        Creates hash of empty state with keys generated from given seed.
+        Hashes of games are comparable only if their keys have the same
+        seed, keys are generated from random seed by default.
+        '''
+        self._keys = ZobristKeys(seed)
+        self._value = 0
+
+    def keys(self) -> ZobristKeys:
+        '''
+        Returns keys of values of state.
+        '''
+        return self._keys
+
+    def value(self) -> int:
+        '''
+        Returns current hash.
+        '''
+        return self._value
+
+    def update_player(self, id: int, kind: int, old, new) -> None:
+        '''
+        Updates hash after change of player's state from old to new value.
+        '''
+        keys = self._keys.players()[id]
+        self._value ^= (player_key(keys, kind, old)
+                        ^ player_key(keys, kind, new))
+
+    def update_field(self, id: int, kind: int, old, new) -> None:
+        '''
+        Updates hash after change of field's state from old to new value.
+        '''
+        keys = self._keys.fields()[id][kind]
+        self._value ^= (keys[field_index(kind, old)]
+                        ^ keys[field_index(kind, new)])
+
+    def update_current_player(self, old: int, new: int) -> None:
+        '''
+        Updates hash after change of current player.
+        '''
+        keys = self._keys.current_players()
+        self._value ^= keys[old] ^ keys[new]
+
+    def rehash(self, game) -> None:
+        '''
+        Calculates hash of whole state of game.
+        '''
+        self._value = game_hash(game, self._keys)
+
+
+def game_hash(game, keys: ZobristKeys) -> int:
+    '''
+    Returns hash of state of game calculated from all players and fields.
+    '''
+    value = keys.current_players()[game.current_player_id()]
+    for player in game.players().values():
+        player_keys = keys.players()[player.id()]
+        for kind, state in enumerate(player.zobrist_state()):
+            value ^= player_key(player_keys, kind, state)
+    for field in game.fields().values():
+        field_keys = keys.fields()[field.id()]
+        for kind, state in enumerate(field.zobrist_state()):
+            value ^= field_keys[kind][field_index(kind, state)]
+    return value
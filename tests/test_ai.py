@@ -1,6 +1,7 @@
 from modules.ai import AiPlayer
 from modules.fields import Property
 from modules.constants import START_MONEY
+import pytest
 
 
 def test_short_description():
@@ -30,9 +31,9 @@ def test_want_to_bid_small_price(monkeypatch):
 
     def return_nine(a, b):
         return 9
-    monkeypatch.setattr('modules.ai.randint', return_nine)
     field = Property(data)
     player = AiPlayer(1, 'name')
+    monkeypatch.setattr(player.random(), 'randint', return_nine)
     current_bid = 10
     assert player.money() == START_MONEY
     assert player.want_to_bid(current_bid, field) is True
@@ -725,3 +726,48 @@ def test_build_houses_ids():
     player.add_field(field_2)
     field_2.set_owner(player)
     assert player.build_houses_ids() == [1, 3]
+
+
+def test_bid_limit():
+    data = {
+        "id": 1,
+        "name": "Ulica Konopacka",
+        "district": "grey",
+        "price": 60,
+        "house_price": 50,
+        "rents": {"0": 2, "1": 10, "2": 30, "3": 90, "4": 160, "5": 250}
+    }
+    field = Property(data)
+    player = AiPlayer(1, 'name')
+    assert player.bid_limit(field) == 50
+    player.set_money(340)
+    assert player.bid_limit(field) == 30
+    assert player.want_to_bid(40, field) is False
+
+
+def test_bids_before_pass_distribution():
+    player = AiPlayer(1, 'name')
+    player.random().seed(3)
+    draws = [player.bids_before_pass() for _ in range(20000)]
+    assert min(draws) == 0
+    assert draws.count(0) / len(draws) == pytest.approx(0.1, abs=0.01)
+    assert sum(draws) / len(draws) == pytest.approx(9, abs=0.3)
+
+
+def test_sealed_bid(monkeypatch):
+    data = {
+        "id": 1,
+        "name": "Ulica Konopacka",
+        "district": "grey",
+        "price": 60,
+        "house_price": 50,
+        "rents": {"0": 2, "1": 10, "2": 30, "3": 90, "4": 160, "5": 250}
+    }
+    field = Property(data)
+    player = AiPlayer(1, 'name')
+    monkeypatch.setattr(AiPlayer, 'bids_before_pass', lambda self: 3)
+    assert player.sealed_bid(field, 10) == 30
+    assert player.sealed_bid(field, 50) == 60
+    assert player.sealed_bid(field, 60) is None
+    monkeypatch.setattr(AiPlayer, 'bids_before_pass', lambda self: 0)
+    assert player.sealed_bid(field, 10) is None
@@ -0,0 +1,101 @@
+from modules.analytics import LandingChain, STAY_IN_JAIL, LEAVE_JAIL
+from modules.constants import (NUMBER_OF_FIELDS, JAIL_ID, GO_TO_JAIL_ID,
+                               DRAW_FIELD_IDS, MAX_DOUBLES_IN_ROW)
+from random import Random
+import numpy as np
+import pytest
+
+
+def test_create_chain():
+    chain = LandingChain()
+    assert chain.strategy() == STAY_IN_JAIL
+    states = chain.number_of_states()
+    assert chain.transition_matrix().shape == (states, states)
+
+
+def test_create_chain_wrong_strategy():
+    with pytest.raises(ValueError):
+        LandingChain('wait')
+
+
+def test_states():
+    chain = LandingChain()
+    assert chain.free_state(0, 0) == 0
+    assert chain.free_state(1, 2) == 5
+    assert chain.jail_state(1) == NUMBER_OF_FIELDS * MAX_DOUBLES_IN_ROW
+
+
+def test_transition_matrix_rows():
+    for strategy in (STAY_IN_JAIL, LEAVE_JAIL):
+        matrix = LandingChain(strategy).transition_matrix()
+        assert np.allclose(matrix.sum(axis=1), 1)
+
+
+def test_third_double_arrest():
+    chain = LandingChain()
+    matrix = chain.transition_matrix()
+    state = chain.free_state(5, MAX_DOUBLES_IN_ROW - 1)
+    assert matrix[state, chain.jail_state(1)] == pytest.approx(1 / 6)
+
+
+def test_stationary_distribution():
+    chain = LandingChain()
+    distribution = chain.stationary_distribution()
+    assert distribution.sum() == pytest.approx(1)
+    assert np.allclose(distribution @ chain.transition_matrix(),
+                       distribution)
+
+
+def test_position_probabilities():
+    stay = LandingChain(STAY_IN_JAIL).position_probabilities()
+    leave = LandingChain(LEAVE_JAIL).position_probabilities()
+    assert stay.sum() == pytest.approx(1)
+    assert stay[GO_TO_JAIL_ID] == pytest.approx(0, abs=1e-12)
+    assert stay.argmax() == JAIL_ID
+    assert stay[JAIL_ID] > leave[JAIL_ID]
+
+
+def test_landing_probabilities():
+    landings = LandingChain().landing_probabilities()
+    assert landings.sum() == pytest.approx(1)
+    assert landings[GO_TO_JAIL_ID] > 0
+    assert (landings > 0).all()
+
+
+def simulate_landings(rolls, seed):
+    generator = Random(seed)
+    landings = np.zeros(NUMBER_OF_FIELDS)
+    position = 0
+    doubles = 0
+    jail_round = None
+    moves = 0
+    for _ in range(rolls):
+        dice_1 = generator.randint(1, 6)
+        dice_2 = generator.randint(1, 6)
+        if jail_round is not None:
+            if dice_1 != dice_2 and jail_round < 3:
+                jail_round += 1
+                continue
+            jail_round = None
+            doubles = 0
+        elif dice_1 == dice_2:
+            doubles += 1
+            if doubles == 3:
+                position, doubles, jail_round = JAIL_ID, 0, 1
+                continue
+        else:
+            doubles = 0
+        position = (position + dice_1 + dice_2) % NUMBER_OF_FIELDS
+        landings[position] += 1
+        moves += 1
+        card = generator.randint(0, 16)
+        if position == GO_TO_JAIL_ID or (position in DRAW_FIELD_IDS
+                                         and card in (1, 14)):
+            position, doubles, jail_round = JAIL_ID, 0, 1
+    return landings / moves
+
+
+def test_landing_probabilities_monte_carlo():
+    exact = LandingChain().landing_probabilities()
+    simulated = simulate_landings(200000, 1)
+    assert np.abs(exact - simulated).max() < 0.003
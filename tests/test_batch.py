@@ -0,0 +1,189 @@
+from modules.batch import BatchGame, load_board_tables
+from modules.game import Game
+from modules.player import Player
+from modules.fields import Property, Station, Service, Tax
+from modules.exceptions import PlayersNumberError
+from modules.simulation import Simulation, create_ai_game
+from modules.constants import (FIELDS_PATH, START_MONEY, JAIL_ID,
+                               PROPERTY_KIND, STATION_KIND,
+                               SERVICE_KIND, TAX_KIND, GO_TO_JAIL_KIND)
+from random import Random
+import numpy as np
+import pytest
+
+
+def test_load_board_tables():
+    tables = load_board_tables()
+    game = Game()
+    game.create_fields(FIELDS_PATH)
+    for id, field in game.fields().items():
+        kind = tables.kinds()[id]
+        if isinstance(field, Property):
+            assert kind == PROPERTY_KIND
+            assert tables.prices()[id] == field.price()
+            assert tables.house_prices()[id] == field.house_price()
+            assert tables.rents()[id, 3] == field.rents()[3]
+            district = tables.districts()[id]
+            assert id in tables.district_fields()[district]
+        elif isinstance(field, Station):
+            assert kind == STATION_KIND
+            assert tables.station_rents()[id, 0] == field.rents()[0]
+        elif isinstance(field, Service):
+            assert kind == SERVICE_KIND
+            assert tables.multipliers()[id, 1] == field.multipliers()[1]
+        elif isinstance(field, Tax):
+            assert kind == TAX_KIND
+            assert tables.taxes()[id] == field.value()
+    assert tables.kinds()[30] == GO_TO_JAIL_KIND
+
+
+def test_create_batch_game():
+    batch = BatchGame(5, 3, 20, seed=1)
+    assert batch.number_of_games() == 5
+    assert batch.number_of_players() == 3
+    assert batch.number_of_rounds() == 20
+    assert (batch.money() == START_MONEY).all()
+    assert (batch.owners() == -1).all()
+    assert (batch.current_rounds() == 1).all()
+    assert not batch.finished().any()
+
+
+def test_create_batch_game_wrong_players_number():
+    with pytest.raises(PlayersNumberError):
+        BatchGame(5, 1)
+
+
+def test_rents_equal_fields_rents():
+    generator = Random(3)
+    game = Game()
+    game.create_fields(FIELDS_PATH)
+    players = {0: Player(0, 'player_0'), 1: Player(1, 'player_1')}
+    game.set_players(players)
+    batch = BatchGame(1, 2, tables=load_board_tables())
+    for field in game.fields().values():
+        if not hasattr(field, 'get_rent'):
+            continue
+        owner = players[generator.randint(0, 1)]
+        field.set_owner(owner)
+        owner.add_field(field)
+        batch.owners()[0, field.id()] = owner.id()
+    for field in game.fields().values():
+        if isinstance(field, Property) and field.all_district_owned():
+            level = generator.randint(0, 5)
+            field.set_level(level)
+            batch.levels()[0, field.id()] = level
+    games = np.zeros(1, dtype=int)
+    for field in game.fields().values():
+        id = np.array([field.id()])
+        if isinstance(field, Service):
+            rent = batch.rents(games, id, np.array([7]))[0]
+            assert rent == field.get_rent((3, 4))
+        elif hasattr(field, 'get_rent'):
+            assert batch.rents(games, id, np.array([7]))[0] == \
+                field.get_rent()
+
+
+def test_step():
+    batch = BatchGame(100, 4, 20, seed=5)
+    batch.step()
+    moved = (batch.positions()[:, 0] != 0) | (batch.jail_rounds()[:, 0] > 0)
+    assert moved.all()
+    assert set(batch.current_players()) <= {0, 1}
+
+
+def test_three_doubles_arrest(monkeypatch):
+    batch = BatchGame(2, 2, 20, seed=5)
+    batch.doubles()[:, 0] = 2
+
+    def return_doubles(number):
+        return np.full(number, 3), np.full(number, 3)
+    monkeypatch.setattr(batch, 'dices', return_doubles)
+    batch.step()
+    assert (batch.positions()[:, 0] == JAIL_ID).all()
+    assert (batch.jail_rounds()[:, 0] == 1).all()
+    assert (batch.doubles()[:, 0] == 0).all()
+    assert (batch.current_players() == 1).all()
+
+
+def test_run():
+    batch = BatchGame(200, 4, 50, seed=7)
+    batch.run()
+    assert batch.finished().all()
+    assert (batch.money() >= 0).all()
+    assert (batch.rounds_played() <= 50).all()
+    winners = batch.winners()
+    assert winners.any(axis=1).all()
+    assert not (winners & batch.bancrupts()).any()
+    owned = batch.owners() >= 0
+    assert not batch.bancrupts()[np.nonzero(owned)[0],
+                                 batch.owners()[owned]].any()
+
+
+def test_run_reproducible():
+    batch_1 = BatchGame(50, 3, 30, seed=11)
+    batch_2 = BatchGame(50, 3, 30, seed=11)
+    batch_1.run()
+    batch_2.run()
+    assert (batch_1.money() == batch_2.money()).all()
+    assert (batch_1.owners() == batch_2.owners()).all()
+
+
+def test_fortunes():
+    batch = BatchGame(1, 2, 20, seed=1)
+    batch.owners()[0, 1] = 0
+    batch.levels()[0, 1] = 2
+    batch.owners()[0, 5] = 1
+    batch.mortaged()[0, 5] = True
+    fortunes = batch.fortunes()[0]
+    assert fortunes[0] == START_MONEY + 30 + 50
+    assert fortunes[1] == START_MONEY
+
+
+def test_next_jail_rounds():
+    batch = BatchGame(3, 2, 20, seed=1)
+    batch.jail_rounds()[0, 1] = 1
+    batch.jail_rounds()[2, 0] = 2
+    batch.next_jail_rounds()
+    assert batch.jail_rounds().tolist() == [[0, 2], [0, 0], [3, 0]]
+    batch.next_jail_rounds(np.array([2]))
+    assert batch.jail_rounds().tolist() == [[0, 2], [0, 0], [4, 0]]
+
+
+def test_trade_missing_property():
+    batch = BatchGame(200, 2, 20, seed=3)
+    district = batch.tables().district_fields()[1]
+    batch.owners()[:, district] = 0
+    batch.owners()[:, district[2]] = 1
+    batch.owners()[:100, district[1]] = -1
+    games = np.arange(200)
+    batch._trade(games, np.zeros(200, dtype=int))
+    price = batch.tables().prices()[district[2]]
+    bought = batch.owners()[:, district[2]] == 0
+    assert not bought[:100].any()
+    assert bought[100:].any() and not bought[100:].all()
+    paid = START_MONEY - batch.money()[bought, 0]
+    assert ((paid >= price) & (paid <= 2 * price)).all()
+    assert (batch.money()[bought].sum(axis=1) == 2 * START_MONEY).all()
+    assert (batch.money()[~bought] == START_MONEY).all()
+
+
+def test_trade_without_money():
+    batch = BatchGame(20, 2, 20, seed=3)
+    district = batch.tables().district_fields()[0][:2]
+    batch.owners()[:, district] = [0, 1]
+    batch.money()[:, 0] = 300
+    batch._trade(np.arange(20), np.zeros(20, dtype=int))
+    assert (batch.owners()[:, district[1]] == 1).all()
+    assert (batch.money() == [300, START_MONEY]).all()
+
+
+def test_batch_follows_gameplay():
+    batch = BatchGame(100, 4, 100, seed=2)
+    batch.run()
+    bancrupts = []
+    for seed in range(100):
+        game = create_ai_game(4, 100, seed)
+        Simulation(game).run()
+        bancrupts.extend(player.is_bancrupt()
+                         for player in game.players().values())
+    assert abs(batch.bancrupts().mean() - np.mean(bancrupts)) < 0.1
@@ -0,0 +1,28 @@
+from modules.benchmark import (instance_size, bytes_per_game, memory_report,
+                               landing_time)
+from modules.simulation import create_ai_game
+import sys
+
+
+def test_instances_have_no_dict():
+    game = create_ai_game(2)
+    for field in game.fields().values():
+        assert not hasattr(field, '__dict__')
+    for player in game.players().values():
+        assert not hasattr(player, '__dict__')
+        assert instance_size(player) == sys.getsizeof(player)
+
+
+def test_bytes_per_game():
+    assert bytes_per_game(5) > 0
+    assert bytes_per_game(5, 3, 10) > 0
+
+
+def test_memory_report():
+    report = memory_report(3, 2, 5)
+    assert report['new_game'] > 0
+    assert set(report['instances']) >= {'Property', 'Station', 'AiPlayer'}
+
+
+def test_landing_time():
+    assert landing_time(80) > 0
@@ -0,0 +1,87 @@
+from modules.bitboard import (Bitboard, field_mask, mask_ids, DISTRICT_MASKS,
+                              STATIONS_MASK, SERVICES_MASK)
+from modules.simulation import Simulation, create_ai_game
+from modules.constants import (DISTRICTS_SIZES, PROPERTY_IDS, STATION_IDS,
+                               SERVICE_IDS)
+from modules.fields import Property
+
+
+def test_field_mask():
+    assert field_mask([]) == 0
+    assert field_mask([0, 3, 39]) == 1 | 8 | 1 << 39
+    assert mask_ids(field_mask([39, 3, 0])) == [0, 3, 39]
+    assert mask_ids(0) == []
+
+
+def test_masks():
+    assert list(DISTRICT_MASKS) == list(DISTRICTS_SIZES)
+    assert DISTRICT_MASKS['grey'] == field_mask([1, 3])
+    assert DISTRICT_MASKS['blue'] == field_mask([37, 39])
+    union = 0
+    for name, mask in DISTRICT_MASKS.items():
+        assert mask.bit_count() == DISTRICTS_SIZES[name]
+        assert union & mask == 0
+        union |= mask
+    assert union == field_mask(PROPERTY_IDS)
+    assert mask_ids(STATIONS_MASK) == STATION_IDS
+    assert mask_ids(SERVICES_MASK) == SERVICE_IDS
+
+
+def test_district_masks_match_board():
+    game = create_ai_game(2)
+    for name, mask in DISTRICT_MASKS.items():
+        ids = [field.id() for field in game.fields().values()
+               if isinstance(field, Property) and field.district() == name]
+        assert mask_ids(mask) == ids
+
+
+def test_bitboard():
+    game = create_ai_game(2)
+    fields = game.fields()
+    bitboard = Bitboard()
+    bitboard.add(fields[1])
+    assert bitboard.district_count('grey') == 1
+    assert not bitboard.owns_district('grey')
+    bitboard.add(fields[3])
+    bitboard.add(fields[5])
+    assert bitboard.owns_district('grey')
+    assert bitboard.stations() == 1
+    assert bitboard.services() == 0
+    assert not bitboard.district_mortaged('grey')
+    fields[3].set_mortaged(True)
+    fields[1].set_level(2)
+    bitboard.remove(fields[3])
+    bitboard.add(fields[3])
+    bitboard.remove(fields[1])
+    bitboard.add(fields[1])
+    assert bitboard.district_mortaged('grey')
+    assert bitboard.district_built('grey')
+    assert bitboard.mortaged() == field_mask([3])
+    assert bitboard.built() == field_mask([1])
+    bitboard.remove(fields[1])
+    assert bitboard.owned() == field_mask([3, 5])
+    assert bitboard.built() == 0
+
+
+def test_player_bitboards_after_games():
+    for seed in range(5):
+        game = create_ai_game(4, 60, seed)
+        Simulation(game).run()
+        for player in game.players().values():
+            bitboard = player.bitboard()
+            fields = player.fields().values()
+            assert mask_ids(bitboard.owned()) == list(player.fields())
+            assert bitboard.mortaged() == field_mask(
+                field.id() for field in fields if field.mortaged())
+            assert bitboard.built() == field_mask(
+                field.id() for field in fields
+                if isinstance(field, Property) and field.level() > 0)
+            for name in DISTRICTS_SIZES:
+                district = player.district(name).fields()
+                assert sorted(district) == [
+                    field.id() for field in fields
+                    if isinstance(field, Property)
+                    and field.district() == name]
+                assert bitboard.district_count(name) == len(district)
+                assert bitboard.district_mortaged(name) == any(
+                    field.mortaged() for field in district.values())
@@ -0,0 +1,145 @@
+from modules.board import (Board, load_board, read_cache, config_digest,
+                          field_kind, field_kinds)
+from modules.fields import Field, Jail, Property, Station
+from modules.player import Player
+from modules.constants import (FIELDS_PATH, JAIL_ID, NUMBER_OF_FIELDS,
+                               PROPERTY_KIND, JAIL_KIND, DRAW_KIND,
+                               SERVICE_KIND, PARKING_KIND)
+import json
+import pytest
+
+
+def copy_config(path, change=None):
+    with open(FIELDS_PATH) as handle:
+        data = json.load(handle)
+    if change is not None:
+        change(data)
+    with open(path, 'w') as handle:
+        json.dump(data, handle)
+    return data
+
+
+def test_create_fields():
+    board = load_board()
+    fields = board.create_fields()
+    assert list(fields) == list(range(NUMBER_OF_FIELDS))
+    for id, field in fields.items():
+        prototype = board.prototypes()[id]
+        assert field is not prototype
+        assert type(field) is type(prototype)
+        assert field.name() == prototype.name()
+    assert isinstance(fields[JAIL_ID], Jail)
+    assert fields[1].rents() == board.prototypes()[1].rents()
+
+
+def test_created_fields_are_independent():
+    board = load_board()
+    fields_1 = board.create_fields()
+    fields_2 = board.create_fields()
+    player = Player(0, 'name')
+    fields_1[JAIL_ID].add(player)
+    fields_1[1].set_owner(player)
+    fields_1[1].set_level(2)
+    assert fields_2[JAIL_ID].arrested_players() == {}
+    assert fields_2[1].owner() is None
+    assert fields_2[1].level() == 0
+    assert board.create_fields()[1].level() == 0
+
+
+def test_load_board_memory_cache():
+    assert load_board() is load_board()
+
+
+def test_load_board_disk_cache(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / 'fields.cache')
+    copy_config(tmp_path / 'fields_1.json')
+    board = load_board(str(tmp_path / 'fields_1.json'), cache_path)
+    assert read_cache(cache_path, board.digest()) is not None
+
+    def fail(*args):
+        raise AssertionError('Board compiled again.')
+    monkeypatch.setattr('modules.board.Board.__init__', fail)
+    copy_config(tmp_path / 'fields_2.json')
+    cached = load_board(str(tmp_path / 'fields_2.json'), cache_path)
+    assert cached.digest() == board.digest()
+    assert isinstance(cached.create_fields()[5], Station)
+
+
+def test_load_board_invalidated(tmp_path):
+    path = tmp_path / 'fields.json'
+    cache_path = str(tmp_path / 'fields.cache')
+    copy_config(path)
+    board = load_board(str(path), cache_path)
+    assert board.create_fields()[1].price() == 60
+
+    def change_price(data):
+        data['1']['price'] = 600
+    copy_config(path, change_price)
+    with open(path, 'rb') as handle:
+        digest = config_digest(handle.read())
+    changed = load_board(str(path), cache_path)
+    assert changed.digest() == digest != board.digest()
+    assert changed.create_fields()[1].price() == 600
+    assert read_cache(cache_path, board.digest()) is None
+
+
+def test_damaged_cache(tmp_path):
+    path = tmp_path / 'fields.json'
+    cache_path = tmp_path / 'fields.cache'
+    copy_config(path)
+    cache_path.write_bytes(b'damaged')
+    board = load_board(str(path), str(cache_path))
+    assert isinstance(board.create_fields()[1], Property)
+    assert read_cache(str(cache_path), board.digest()) is not None
+
+
+def test_cache_invalidated_by_source(tmp_path, monkeypatch):
+    path = tmp_path / 'fields.json'
+    cache_path = str(tmp_path / 'fields.cache')
+    copy_config(path)
+    board = load_board(str(path), cache_path)
+    monkeypatch.setattr('modules.board.SOURCE_DIGEST', b'changed')
+    with open(path, 'rb') as handle:
+        digest = config_digest(handle.read())
+    assert digest != board.digest()
+    assert read_cache(cache_path, digest) is None
+
+
+def test_board_validates_config():
+    with open(FIELDS_PATH) as handle:
+        data = json.load(handle)
+    data['1']['price'] = -5
+    with pytest.raises(ValueError):
+        Board(data)
+
+
+def test_games_share_field_definitions():
+    board = load_board()
+    fields_1 = board.create_fields()
+    fields_2 = board.create_fields()
+    for id, field in fields_1.items():
+        assert field.definition() is fields_2[id].definition()
+        assert field.definition() is board.prototypes()[id].definition()
+    definition = fields_1[1].definition()
+    assert definition.id == 1
+    assert definition.price == 60
+    assert definition.rents == fields_1[1].rents()
+    assert definition.multipliers is None
+    fields_1[1].set_mortaged(True)
+    assert not fields_2[1].mortaged()
+
+
+def test_field_kinds():
+    board = load_board()
+    fields = board.create_fields()
+    kinds = field_kinds(fields)
+    assert list(kinds) == list(range(NUMBER_OF_FIELDS))
+    assert kinds[1] == PROPERTY_KIND
+    assert kinds[JAIL_ID] == JAIL_KIND
+    assert kinds[2] == DRAW_KIND
+    assert kinds[12] == SERVICE_KIND
+
+    class OwnStation(Station):
+        __slots__ = ()
+    assert field_kind(OwnStation(board.data()['5'])) == field_kind(fields[5])
+    assert field_kind(Field(board.data()['0'])) == PARKING_KIND
@@ -0,0 +1,83 @@
+from modules.events import (EventLog, read_events, RECORD, TURN, ROLL,
+                            PURCHASE, SELL_FIELD, BANCRUPTCY, CHANCE)
+from modules.simulation import Simulation, create_ai_game
+from modules.fields import BuyableField
+from io import BytesIO
+import pytest
+
+
+def test_create_event_log():
+    log = EventLog()
+    assert log.turn() == 0
+    assert log.length() == 0
+    assert list(log.events()) == []
+
+
+def test_create_event_log_wrong_capacity():
+    with pytest.raises(ValueError):
+        EventLog(capacity=0)
+
+
+def test_record():
+    log = EventLog()
+    log.next_turn(1, 3)
+    log.record(ROLL, 1, 2, 5)
+    assert log.length() == 2
+    assert list(log.events()) == [(1, TURN, 1, -1, 3), (1, ROLL, 1, 2, 5)]
+
+
+def test_record_grows_buffer():
+    log = EventLog(capacity=2)
+    for value in range(5):
+        log.record(CHANCE, 0, value)
+    assert log.length() == 5
+    assert [event[3] for event in log.events()] == [0, 1, 2, 3, 4]
+
+
+def test_flush_and_read_events():
+    handle = BytesIO()
+    log = EventLog(handle, capacity=2)
+    for value in range(5):
+        log.record(PURCHASE, 1, value, 100 * value)
+    assert len(handle.getvalue()) == 4 * RECORD.size
+    log.flush()
+    assert log.length() == 5
+    assert list(log.events()) == []
+    handle.seek(0)
+    events = list(read_events(handle, chunk=3))
+    assert [event[4] for event in events] == [0, 100, 200, 300, 400]
+
+
+def test_recorded_simulation_turns():
+    game = create_ai_game(3, 20, seed=4)
+    log = EventLog()
+    game.set_event_log(log)
+    Simulation(game).run()
+    turns = [event for event in log.events() if event[1] == TURN]
+    assert len(turns) == log.turn()
+    assert turns[-1][4] <= game.number_of_rounds()
+
+
+def test_recorded_simulation_owners():
+    game = create_ai_game(4, 60, seed=9)
+    log = EventLog()
+    game.set_event_log(log)
+    Simulation(game).run()
+    owners = {}
+    for turn, kind, player, target, value in log.events():
+        if kind == PURCHASE:
+            owners[target] = player
+        elif kind == SELL_FIELD:
+            del owners[target]
+        elif kind == BANCRUPTCY:
+            for id, owner in list(owners.items()):
+                if owner == player:
+                    if target == -1:
+                        del owners[id]
+                    else:
+                        owners[id] = target
+    for field in game.fields().values():
+        if isinstance(field, BuyableField) and field.owner() is not None:
+            assert owners[field.id()] == field.owner().id()
+        else:
+            assert field.id() not in owners
@@ -6,7 +6,12 @@ from modules.exceptions import (UnequalBuildingError, AlreadyArrestedError,
                                 AlreadyMortagedError, NotOwnedDistrictError,
                                 PropertyLevelError, WrongIdError, BuiltUpError,
                                 NotMortagedError)
-from modules.constants import START_MONEY
+from modules.constants import (START_MONEY, FIELDS_PATH, ALLOWED, NOT_OWNED,
+                               ALREADY_MORTAGED, NOT_MORTAGED, BUILT_UP,
+                               DISTRICT_MORTAGED, NOT_OWNED_DISTRICT,
+                               MAX_LEVEL, MIN_LEVEL, UNEQUAL_BUILDING,
+                               NO_MONEY)
+from modules.board import load_board
 import pytest
 
 
@@ -275,12 +280,12 @@ def test_create_property():
     assert field.district() == 'grey'
     assert field.house_price() == 50
     assert len(field.rents()) == 6
-    assert field.rents()['0'] == 4
-    assert field.rents()['1'] == 20
-    assert field.rents()['2'] == 60
-    assert field.rents()['3'] == 180
-    assert field.rents()['4'] == 320
-    assert field.rents()['5'] == 450
+    assert field.rents()[0] == 4
+    assert field.rents()[1] == 20
+    assert field.rents()[2] == 60
+    assert field.rents()[3] == 180
+    assert field.rents()[4] == 320
+    assert field.rents()[5] == 450
 
 
 def test_create_property_wrong_house_price():
@@ -1221,10 +1226,10 @@ def test_create_station():
         }
     }
     field = Station(data)
-    assert field.rents()['1'] == 25
-    assert field.rents()['2'] == 50
-    assert field.rents()['3'] == 100
-    assert field.rents()['4'] == 200
+    assert field.rents()[0] == 25
+    assert field.rents()[1] == 50
+    assert field.rents()[2] == 100
+    assert field.rents()[3] == 200
 
 
 def test_create_station_wrong_rents_number():
@@ -1308,8 +1313,8 @@ def test_create_service():
         }
     }
     field = Service(data)
-    assert field.multipliers()['1'] == 4
-    assert field.multipliers()['2'] == 10
+    assert field.multipliers()[0] == 4
+    assert field.multipliers()[1] == 10
 
 
 def test_create_service_wrong_multipliers_number():
@@ -1372,3 +1377,106 @@ def test_get_rent_serivce():
     dices = (4, 6)
     assert field_1.get_rent(dices) == 100
     assert field_2.get_rent(dices) == 100
+
+
+def test_jail_sets_player_jail_round():
+    data = {
+        "id": 10,
+        "name": "jail"
+    }
+    jail = Jail(data)
+    player = Player(0, 'player')
+    jail.add(player)
+    assert player.arrested()
+    assert player.in_jail_round() == 1
+    assert player.position() == 10
+    jail.relase(player)
+    assert not player.arrested()
+    with pytest.raises(NotArrestedError):
+        jail.relase(player)
+
+
+def test_jail_next_round():
+    data = {
+        "id": 10,
+        "name": "jail"
+    }
+    jail = Jail(data)
+    player_0 = Player(0, 'player_0')
+    player_1 = Player(1, 'player_1')
+    player_2 = Player(2, 'player_2')
+    jail.add(player_0)
+    jail.add(player_1)
+    jail.next_round()
+    assert player_0.in_jail_round() == 2
+    assert player_1.in_jail_round() == 2
+    assert player_2.in_jail_round() is None
+    jail.next_round([1, 2])
+    assert player_0.in_jail_round() == 2
+    assert player_1.in_jail_round() == 3
+    assert player_2.in_jail_round() is None
+
+
+def owned_fields(player, ids):
+    fields = load_board(FIELDS_PATH).create_fields()
+    for id in ids:
+        fields[id].set_owner(player)
+        player.add_field(fields[id])
+    return fields
+
+
+def test_check_upgrade():
+    player = Player(0, 'player')
+    fields = owned_fields(player, [1, 6, 8])
+    assert fields[6].check_upgrade() == NOT_OWNED_DISTRICT
+    assert fields[1].check_upgrade() == NOT_OWNED_DISTRICT
+    fields = owned_fields(player, [1, 3])
+    assert fields[1].check_upgrade() == ALLOWED
+    fields[1].build_house()
+    assert fields[1].check_upgrade() == UNEQUAL_BUILDING
+    with pytest.raises(UnequalBuildingError):
+        fields[1].build_house()
+    fields[3].set_level(5)
+    assert fields[3].check_upgrade() == MAX_LEVEL
+    player.set_money(10)
+    assert fields[1].check_upgrade() == NO_MONEY
+    fields[1].set_level(0)
+    fields[3].set_level(0)
+    fields[3].set_mortaged(True)
+    assert fields[1].check_upgrade() == DISTRICT_MORTAGED
+    with pytest.raises(AlreadyMortagedError):
+        fields[1].allow_to_be_upgraded()
+
+
+def test_check_downgrade():
+    player = Player(0, 'player')
+    fields = owned_fields(player, [1, 3])
+    assert fields[1].check_downgrade() == MIN_LEVEL
+    fields[1].set_level(1)
+    assert fields[1].check_downgrade() == ALLOWED
+    assert fields[3].check_downgrade() == MIN_LEVEL
+    fields[3].set_level(2)
+    assert fields[1].check_downgrade() == UNEQUAL_BUILDING
+    with pytest.raises(UnequalBuildingError):
+        fields[1].remove_house()
+
+
+def test_check_mortage():
+    player = Player(0, 'player')
+    fields = owned_fields(player, [1, 3, 5])
+    assert fields[6].check_mortage() == NOT_OWNED
+    assert fields[5].check_mortage() == ALLOWED
+    fields[3].set_level(1)
+    assert fields[1].check_mortage() == BUILT_UP
+    with pytest.raises(BuiltUpError):
+        fields[1].start_mortage()
+    fields[5].start_mortage()
+    assert fields[5].check_mortage() == ALREADY_MORTAGED
+    assert fields[5].check_end_mortage() == ALLOWED
+    assert fields[1].check_end_mortage() == NOT_MORTAGED
+    player.set_money(10)
+    assert fields[5].check_end_mortage() == NO_MONEY
+    with pytest.raises(NoMoneyError):
+        fields[5].end_mortage()
+    assert fields[5].mortaged()
+    assert player.money() == 10
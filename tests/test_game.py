@@ -1,12 +1,14 @@
 from modules.game import Game
-from modules.player import Player
+from modules.player import Player, PlayerRing
 from modules.fields import Property, Field, Start, Jail, Service
 from modules.ai import AiPlayer
 from modules.exceptions import (RepeatedIdError, PlayersNumberError,
                                 TooShortGameError, AlreadyArrestedError,
-                                NotArrestedError, NotAllBancruptError)
+                                NotArrestedError, NotAllBancruptError,
+                                AuctionModeError)
 from modules.constants import (MIN_NUMBER_OF_ROUNDS, JAIL_ID, START_ID,
-                               START_MONEY)
+                               START_MONEY, OPEN_AUCTION, VICKREY_AUCTION,
+                               FIELDS_PATH)
 import pytest
 
 
@@ -43,6 +45,19 @@ def test_set_players():
     assert game.players()[1] == player_1
 
 
+def test_set_players_share_random():
+    player_0 = Player(0, 'player_0')
+    player_1 = AiPlayer(1, 'player_1')
+    players = {
+        0: player_0,
+        1: player_1
+    }
+    game = Game()
+    game.set_players(players)
+    assert player_0.random() is game.random()
+    assert player_1.random() is game.random()
+
+
 def test_set_players_repeated_id():
     player_0 = Player(0, 'player_0')
     player_1 = AiPlayer(0, 'player_1')
@@ -614,11 +629,11 @@ def test_next_bidder_id():
     game = Game()
     game.set_number_of_players(4)
     game.set_players(players)
-    participants = {
+    participants = PlayerRing({
         1: player_1,
         2: player_2,
         3: player_3
-    }
+    }, 4)
     id = 1
     id = game.next_bidder_id(id, participants)
     assert id == 2
@@ -636,6 +651,43 @@ def test_draw_card(monkeypatch):
     assert game.draw_card() == 7
 
 
+def test_draw_card_seed():
+    game_1 = Game(10)
+    game_2 = Game(10)
+    cards_1 = [game_1.draw_card() for _ in range(20)]
+    cards_2 = [game_2.draw_card() for _ in range(20)]
+    assert cards_1 == cards_2
+    assert all(0 <= id <= 16 for id in cards_1)
+
+
+def test_draw_card_from_shuffled_deck():
+    game = Game(3)
+    assert game.chance_deck() is None
+    game.set_chance_deck(range(17))
+    assert game.deck_position() == 17
+    cards_1 = [game.draw_card() for _ in range(17)]
+    assert sorted(cards_1) == list(range(17))
+    assert cards_1 == game.chance_deck()
+    assert game.deck_position() == 17
+    cards_2 = [game.draw_card() for _ in range(17)]
+    assert sorted(cards_2) == list(range(17))
+    assert cards_2 != cards_1
+
+
+def test_set_chance_deck():
+    game = Game()
+    game.set_chance_deck([16, 15, 14] + list(range(14)), 1)
+    assert game.draw_card() == 15
+    assert game.deck_position() == 2
+    with pytest.raises(ValueError):
+        game.set_chance_deck([1, 1, 2])
+    with pytest.raises(ValueError):
+        game.set_chance_deck(range(17), 18)
+    game.set_chance_deck(None)
+    assert game.chance_deck() is None
+    assert game.deck_position() == 0
+
+
 def test_remove_houses():
     data_1 = {
         "id": 12,
@@ -992,3 +1044,49 @@ def test_debt_to_bank():
     assert field_1.owner() is None
     assert field_2.owner() is None
     assert field_3.owner() is None
+
+
+def test_next_player_removes_bancrupts():
+    players = {id: Player(id, f'player_{id}') for id in range(4)}
+    game = Game()
+    game.set_number_of_players(4)
+    game.set_players(players)
+    players[1].set_bancrupt()
+    players[2].set_bancrupt()
+    game.next_player()
+    assert game.current_player_id() == 3
+    assert list(game.active_players()) == [0, 3]
+    game.next_player()
+    assert game.current_player_id() == 0
+    assert game.current_round() == 2
+    players[0].set_bancrupt()
+    game.next_player()
+    game.next_player()
+    assert game.current_player_id() == 3
+    assert game.current_round() == 3
+
+
+def test_set_auction_mode():
+    game = Game()
+    assert game.auction_mode() == OPEN_AUCTION
+    game.set_auction_mode(VICKREY_AUCTION)
+    assert game.auction_mode() == VICKREY_AUCTION
+    with pytest.raises(AuctionModeError):
+        game.set_auction_mode(3)
+
+
+def test_sell_estate():
+    game = Game()
+    game.create_fields(FIELDS_PATH)
+    game.set_number_of_players(2)
+    players = {0: Player(0, 'player_0'), 1: Player(1, 'player_1')}
+    game.set_players(players)
+    fields = game.fields()
+    game.sell_estate([(players[1], fields[1], 100),
+                      (players[0], fields[3], 50),
+                      (players[1], fields[5], 200)])
+    assert players[0].money() == START_MONEY - 50
+    assert players[1].money() == START_MONEY - 300
+    assert list(players[1].fields()) == [1, 5]
+    assert fields[3].owner() is players[0]
+    assert players[1].fortune() == START_MONEY - 300 + 30 + 100
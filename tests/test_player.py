@@ -1,10 +1,13 @@
-from modules.player import Player
+from modules.player import Player, OwnedFields, PlayerRing
 from modules.constants import (START_ID, START_MONEY, MAX_NUMBER_OF_PLAYERS,
-                               NUMBER_OF_FIELDS, PAYMENT, JAIL_ID)
+                               NUMBER_OF_FIELDS, PAYMENT, JAIL_ID, ALLOWED,
+                               NOT_OWNED, BUILT_UP, ALREADY_MORTAGED)
 from modules.exceptions import (WrongIdError, NoMoneyError, NotArrestedError,
                                 AlreadyArrestedError, NotOwnedError,
-                                BuiltUpError, AlreadyMortagedError)
+                                BuiltUpError, AlreadyMortagedError,
+                                FortuneError)
 from modules.fields import Property, Service, Station
+from modules.simulation import Simulation, create_ai_game
 import pytest
 
 
@@ -726,3 +729,178 @@ def test_jail_info():
     player.go_to_jail()
     jail_info = player.jail_info()
     assert jail_info == '1                     name              1\n'
+
+
+def grey_properties():
+    fields = []
+    for id in (1, 3):
+        data = {
+            "id": id,
+            "name": f"Ulica {id}",
+            "district": "grey",
+            "price": 60,
+            "house_price": 50,
+            "rents": {"0": 2, "1": 10, "2": 30, "3": 90, "4": 160, "5": 250}
+        }
+        fields.append(Property(data))
+    return fields
+
+
+def test_fortune_updates():
+    player = Player(0, 'name')
+    player.set_check_fortune(True)
+    field_1, field_2 = grey_properties()
+    for field in (field_1, field_2):
+        field.set_owner(player)
+        player.add_field(field)
+    assert player.capital() == 60
+    field_1.build_house()
+    assert player.capital() == 30 + 25 + 30
+    assert player.fortune() == player.money() + 85
+    field_1.remove_house()
+    field_2.start_mortage()
+    assert player.capital() == 30
+    assert player.fortune() == player.calculate_fortune()
+    player.sell_to_bank(field_1)
+    assert player.capital() == 0
+
+
+def test_fortune_check():
+    player = Player(0, 'name')
+    field_1, field_2 = grey_properties()
+    player.add_field(field_1)
+    field_1.set_level(3)
+    assert player.fortune() == player.money() + 30
+    player.set_check_fortune(True)
+    with pytest.raises(FortuneError):
+        player.fortune()
+
+
+def test_fortune_after_games():
+    for seed in range(10):
+        game = create_ai_game(4, 100, seed)
+        for player in game.players().values():
+            player.set_check_fortune(True)
+        Simulation(game).run()
+        for player in game.players().values():
+            assert player.fortune() == player.calculate_fortune()
+
+
+def test_owned_fields_sorted():
+    fields = OwnedFields()
+    game = create_ai_game(2)
+    for id in (39, 5, 12, 1, 28):
+        fields.add(game.fields()[id])
+    assert list(fields) == [1, 5, 12, 28, 39]
+    assert fields.keys() == [1, 5, 12, 28, 39]
+    assert [field.id() for field in fields.values()] == [1, 5, 12, 28, 39]
+    assert fields.items()[0] == (1, game.fields()[1])
+    fields.remove(game.fields()[12])
+    assert list(fields) == [1, 5, 28, 39]
+    assert 12 not in fields
+    assert fields.get(12) is None
+    assert len(fields) == 4
+    assert dict(fields) == {id: game.fields()[id] for id in (1, 5, 28, 39)}
+    with pytest.raises(KeyError):
+        fields.remove(game.fields()[12])
+
+
+def test_player_fields_sorted_after_games():
+    for seed in range(5):
+        game = create_ai_game(4, 40, seed)
+        Simulation(game).run()
+        for player in game.players().values():
+            assert list(player.fields()) == sorted(player.fields())
+
+
+def test_player_ring():
+    players = {id: Player(id, f'player_{id}') for id in (0, 2, 3, 5)}
+    ring = PlayerRing(players, 6)
+    assert list(ring) == [0, 2, 3, 5]
+    assert ring.next(0) == 2
+    assert ring.next(1) == 2
+    assert ring.next(5) == 0
+    ring.remove(2)
+    del ring[3]
+    assert 2 not in ring
+    assert len(ring) == 2
+    assert ring.next(0) == 5
+    assert ring.next(1) == 5
+    assert ring.next(2) == 5
+    assert ring.next(5) == 0
+    assert ring == {0: players[0], 5: players[5]}
+    with pytest.raises(KeyError):
+        ring.remove(3)
+    ring.remove(0)
+    assert ring.next(5) == 5
+    ring.remove(5)
+    with pytest.raises(ValueError):
+        ring.next(0)
+
+
+def test_check_sell():
+    game = create_ai_game(2)
+    player = game.players()[0]
+    fields = game.fields()
+    for id in (1, 3, 5):
+        game.make_deal(player, fields[id], 0)
+    assert player.check_sell(fields[6]) == NOT_OWNED
+    assert player.check_sell(fields[5]) == ALLOWED
+    fields[3].set_level(1)
+    assert player.check_sell(fields[1]) == BUILT_UP
+    with pytest.raises(BuiltUpError):
+        player.sell_to_bank(fields[1])
+    fields[5].set_mortaged(True)
+    assert player.check_sell(fields[5]) == ALREADY_MORTAGED
+    with pytest.raises(NotOwnedError):
+        player.sell_to_bank(fields[6])
+
+
+def full_rent(field):
+    owner = field.owner()
+    if isinstance(field, Property):
+        rent = field.rents()[field.level()]
+        if field.level() == 0 and field.all_district_owned():
+            rent *= 2
+        return rent
+    if isinstance(field, Station):
+        return field.rents()[owner.stations_owned() - 1]
+    return field.multipliers()[owner.services_owned() - 1]
+
+
+def test_rents_updated_after_games():
+    for seed in range(5):
+        game = create_ai_game(4, 60, seed)
+        Simulation(game).run()
+        for player in game.players().values():
+            for field in player.fields().values():
+                if isinstance(field, Service):
+                    assert field.get_rent((1, 2)) == 3 * full_rent(field)
+                else:
+                    assert field.get_rent() == full_rent(field)
+
+
+def test_rents_updated_with_owned_fields():
+    game = create_ai_game(2)
+    player, other = game.players().values()
+    fields = game.fields()
+    game.make_deal(player, fields[1], 0)
+    assert fields[1].get_rent() == 2
+    game.make_deal(player, fields[3], 0)
+    assert fields[1].get_rent() == 4
+    assert fields[3].get_rent() == 8
+    fields[1].set_level(1)
+    assert fields[1].get_rent() == 10
+    assert fields[3].get_rent() == 8
+    fields[1].set_level(0)
+    game.make_deal(other, fields[3], 0)
+    assert fields[1].get_rent() == 2
+    assert fields[3].get_rent() == 4
+    game.make_deal(player, fields[5], 0)
+    game.make_deal(player, fields[15], 0)
+    assert fields[5].get_rent() == fields[15].get_rent() == 50
+    game.make_deal(other, fields[15], 0)
+    assert fields[5].get_rent() == fields[15].get_rent() == 25
+    game.make_deal(player, fields[12], 0)
+    game.make_deal(player, fields[28], 0)
+    assert fields[12].get_rent((3, 4)) == 70
@@ -0,0 +1,71 @@
+from modules.replay import Replayer, game_state
+from modules.events import EventLog, TURN, MOVE
+from modules.simulation import Simulation, create_ai_game
+from modules.constants import START_MONEY
+import pytest
+
+
+def record_game(number_of_players, number_of_rounds, seed):
+    game = create_ai_game(number_of_players, number_of_rounds, seed)
+    log = EventLog()
+    game.set_event_log(log)
+    Simulation(game).run()
+    return game, list(log.events())
+
+
+def test_create_replayer():
+    game, events = record_game(3, 20, 4)
+    replayer = Replayer(events, 3, 20, interval=10)
+    assert replayer.number_of_players() == 3
+    assert replayer.interval() == 10
+    assert replayer.number_of_turns() == events[-1][0]
+    assert replayer.turn() == replayer.number_of_turns()
+
+
+def test_create_replayer_wrong_interval():
+    with pytest.raises(ValueError):
+        Replayer([], 2, interval=0)
+
+
+def test_replay_start():
+    game, events = record_game(3, 20, 4)
+    start = Replayer(events, 3).game_at(0)
+    for player in start.players().values():
+        assert player.money() == START_MONEY
+        assert player.position() == 0
+        assert player.fields() == {}
+
+
+def test_replay_whole_game():
+    for seed in range(5):
+        game, events = record_game(4, 60, seed)
+        replayer = Replayer(events, 4, 60, interval=25)
+        replayed = replayer.game_at(replayer.number_of_turns())
+        assert game_state(replayed)[2:] == game_state(game)[2:]
+
+
+def test_replay_random_access():
+    game, events = record_game(3, 40, 8)
+    sequential = Replayer(events, 3, 40, interval=1000)
+    states = [game_state(sequential.game_at(turn))[2:]
+              for turn in range(sequential.number_of_turns() + 1)]
+    replayer = Replayer(events, 3, 40, interval=7)
+    for turn in (50, 3, 21, 21, 0, len(states) - 1, 14):
+        assert game_state(replayer.game_at(turn))[2:] == states[turn]
+
+
+def test_replay_turn_start():
+    events = [(1, TURN, 1, -1, 2), (1, MOVE, 1, 7, 0)]
+    replayer = Replayer(events, 2)
+    game = replayer.game_at(1)
+    assert game.current_player_id() == 1
+    assert game.current_round() == 2
+    assert game.players()[1].position() == 7
+
+
+def test_replay_wrong_turn():
+    game, events = record_game(2, 10, 1)
+    replayer = Replayer(events, 2)
+    with pytest.raises(ValueError):
+        replayer.game_at(replayer.number_of_turns() + 1)
+
@@ -0,0 +1,244 @@
+from modules.simulation import (Simulation, HeadlessInterface, create_ai_game,
+                                game_seed)
+from modules.game import Game
+from modules.player import Player
+from modules.ai import AiPlayer
+from modules.exceptions import HumanPlayerError
+from modules.constants import (OPEN_AUCTION, FIRST_PRICE_AUCTION,
+                               VICKREY_AUCTION)
+import pytest
+
+
+def test_create_ai_game():
+    game = create_ai_game(4, 20)
+    assert game.number_of_players() == 4
+    assert game.number_of_rounds() == 20
+    assert len(game.fields()) == 40
+    for player in game.players().values():
+        assert isinstance(player, AiPlayer)
+
+
+def test_create_simulation_with_human_player():
+    game = Game()
+    game.set_number_of_players(2)
+    players = {
+        0: Player(0, 'player_0'),
+        1: AiPlayer(1, 'player_1')
+    }
+    game.set_players(players)
+    with pytest.raises(HumanPlayerError):
+        Simulation(game)
+
+
+def test_create_simulation():
+    game = create_ai_game(2)
+    simulation = Simulation(game)
+    assert simulation.game() is game
+    assert simulation.gameplay().game() is game
+    assert isinstance(simulation.gameplay().interface(), HeadlessInterface)
+
+
+def test_run_without_output(capsys):
+    simulation = Simulation(create_ai_game(3, 30, 0))
+    simulation.run()
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert simulation.game().finished() is True
+
+
+def test_run_result():
+    simulation = Simulation(create_ai_game(4, 30, 1))
+    result = simulation.run()
+    assert 1 <= result['rounds'] <= 30
+    assert set(result['fortunes']) == {0, 1, 2, 3}
+    max_fortune = max(result['fortunes'].values())
+    for id in result['winners']:
+        assert result['fortunes'][id] == max_fortune
+
+
+def test_run_many_games():
+    for seed in range(20):
+        simulation = Simulation(create_ai_game(2 + seed % 5, 50, seed))
+        result = simulation.run()
+        assert len(result['winners']) >= 1
+
+
+def test_run_reproducible():
+    result_1 = Simulation(create_ai_game(4, 50, 2022)).run()
+    result_2 = Simulation(create_ai_game(4, 50, 2022)).run()
+    assert result_1 == result_2
+
+
+def test_game_seed():
+    assert game_seed(1, 0) == game_seed(1, 0)
+    assert game_seed(1, 0) != game_seed(1, 1)
+    assert game_seed(1, 0) != game_seed(2, 0)
+    assert 0 <= game_seed(1, 0) < 2 ** 64
+
+
+def fixed_bids(monkeypatch, bids):
+    def bids_before_pass(player):
+        return bids[player.id()]
+    monkeypatch.setattr(AiPlayer, 'bids_before_pass', bids_before_pass)
+
+
+def test_ai_auction(monkeypatch):
+    game = create_ai_game(4, seed=1)
+    fixed_bids(monkeypatch, {1: 2, 2: 5, 3: 0})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field)
+    assert field.owner() is game.players()[2]
+    assert game.players()[2].money() == 1500 - 40
+
+
+def test_ai_auction_bid_limit(monkeypatch):
+    game = create_ai_game(3, seed=1)
+    game.players()[1].set_money(420)
+    fixed_bids(monkeypatch, {1: 100, 2: 100})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field)
+    assert field.owner() is game.players()[2]
+    assert game.players()[2].money() == 1500 - 120
+
+
+def test_ai_auction_nobody_bids(monkeypatch):
+    game = create_ai_game(3, seed=1)
+    fixed_bids(monkeypatch, {1: 0, 2: 0})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field)
+    assert field.owner() is None
+
+
+def test_ai_auction_single_bidder(monkeypatch):
+    game = create_ai_game(2, seed=1)
+    fixed_bids(monkeypatch, {1: 1})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field, 200)
+    assert field.owner() is game.players()[1]
+    assert game.players()[1].money() == 1500 - 200
+
+
+def test_ai_auction_without_participants():
+    game = create_ai_game(2, seed=1)
+    game.players()[1].set_bancrupt()
+    field = game.fields()[39]
+    gameplay = Simulation(game).gameplay()
+    assert gameplay.ai_auction_result(field, []) is None
+    gameplay.auction(field)
+    assert field.owner() is None
+
+
+def test_sealed_auction(monkeypatch):
+    game = create_ai_game(4, seed=1, auction_mode=FIRST_PRICE_AUCTION)
+    fixed_bids(monkeypatch, {1: 3, 2: 5, 3: 0})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field)
+    assert field.owner() is game.players()[2]
+    assert game.players()[2].money() == 1500 - 50
+
+
+def test_vickrey_auction(monkeypatch):
+    game = create_ai_game(4, seed=1, auction_mode=VICKREY_AUCTION)
+    fixed_bids(monkeypatch, {1: 3, 2: 5, 3: 5})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field)
+    assert field.owner() is game.players()[2]
+    assert game.players()[2].money() == 1500 - 50
+
+
+def test_vickrey_auction_single_bidder(monkeypatch):
+    game = create_ai_game(3, seed=1, auction_mode=VICKREY_AUCTION)
+    fixed_bids(monkeypatch, {1: 4, 2: 0})
+    field = game.fields()[39]
+    Simulation(game).gameplay().auction(field, 100)
+    assert field.owner() is game.players()[1]
+    assert game.players()[1].money() == 1500 - 100
+
+
+def test_run_sealed_auction_games():
+    for mode in (FIRST_PRICE_AUCTION, VICKREY_AUCTION):
+        game = create_ai_game(4, 50, seed=2, auction_mode=mode)
+        result = Simulation(game).run()
+        assert result['winners']
+
+
+def estate_result(monkeypatch, mode, batched):
+    game = create_ai_game(3, seed=1, auction_mode=mode)
+    game.players()[1].set_money(900)
+    game.players()[2].set_money(700)
+    fixed_bids(monkeypatch, {1: 100, 2: 100})
+    gameplay = Simulation(game).gameplay()
+    fields = [game.fields()[id] for id in (37, 39, 5)]
+    if batched:
+        gameplay.liquidate_estate(fields)
+    else:
+        for field in fields:
+            gameplay.auction(field)
+    owners = [field.owner().id() for field in fields]
+    money = [player.money() for player in game.players().values()]
+    return owners, money
+
+
+def test_liquidate_estate_as_auctions(monkeypatch):
+    for mode in (OPEN_AUCTION, FIRST_PRICE_AUCTION, VICKREY_AUCTION):
+        batched = estate_result(monkeypatch, mode, True)
+        assert batched == estate_result(monkeypatch, mode, False)
+    owners, money = estate_result(monkeypatch, OPEN_AUCTION, True)
+    assert owners == [1, 2, 1]
+    assert money == [1500, 900 - 350 - 150, 700 - 260]
+
+
+def test_chance_effects():
+    game = create_ai_game(2, seed=4)
+    gameplay = Simulation(game).gameplay()
+    player = game.players()[0]
+    for id in (1, 3, 5):
+        game.make_deal(player, game.fields()[id], 0)
+    game.fields()[1].set_level(2)
+    gameplay.chance(0)
+    assert player.money() == 1500 + 30
+    gameplay.chance(8)
+    assert player.money() == 1530 - 3 * 20
+    gameplay.chance(11)
+    assert player.money() == 1470 + 3 * 20
+    gameplay.chance(10)
+    assert player.money() == 1530 - 2 * 25
+    gameplay.chance(4)
+    assert player.money() == 1480
+    gameplay.chance(16)
+    assert player.get_out_cards_number() == 1
+    gameplay.chance(14)
+    assert player.in_jail_round() == 1
+
+
+def test_run_games_with_shuffled_deck():
+    game = create_ai_game(4, 50, seed=2, shuffled_deck=True)
+    result = Simulation(game).run()
+    assert result['winners']
+    assert sorted(game.chance_deck()) == list(range(17))
+
+
+def test_field_actions():
+    game = create_ai_game(2, seed=4)
+    gameplay = Simulation(game).gameplay()
+    actions = gameplay.field_actions()
+    assert actions is gameplay.field_actions()
+    assert actions[7] == gameplay.draw
+    assert actions[30] == gameplay.go_to_jail
+    assert actions[4] == gameplay.pay_tax
+    assert actions[39] == gameplay.stand_on_buyable
+    assert actions[20] == gameplay.no_action
+    player = game.players()[0]
+    player.set_position(30)
+    gameplay.field_action()
+    assert player.in_jail_round() == 1
+
+
+def test_service_rent():
+    game = create_ai_game(2, seed=4)
+    gameplay = Simulation(game).gameplay()
+    player, owner = game.players().values()
+    game.make_deal(owner, game.fields()[12], 0)
+    player.set_position(12)
+    gameplay.field_action()
+    assert 1500 - player.money() == owner.money() - 1500 > 0
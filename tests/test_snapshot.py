@@ -0,0 +1,121 @@
+from modules.snapshot import (to_bytes, from_bytes, save_game, load_game,
+                              HEADER, PLAYER, FIELD)
+from modules.replay import game_state
+from modules.simulation import Simulation, create_ai_game
+from modules.game import Game
+from modules.player import Player
+from modules.ai import AiPlayer
+from modules.exceptions import SnapshotError
+from modules.constants import FIELDS_PATH, JAIL_ID, VICKREY_AUCTION
+import pytest
+
+
+def play_turns(game, number_of_turns):
+    gameplay = Simulation(game).gameplay()
+    for _ in range(number_of_turns):
+        if game.finished():
+            break
+        gameplay.turn()
+        game.next_player()
+        gameplay.chcek_end()
+    return gameplay
+
+
+def test_snapshot_round_trip():
+    game = create_ai_game(4, 80, seed=3)
+    play_turns(game, 120)
+    loaded = from_bytes(to_bytes(game))
+    assert game_state(loaded) == game_state(game)
+    assert loaded.number_of_rounds() == 80
+    assert loaded.finished() == game.finished()
+    assert loaded.random().getstate() == game.random().getstate()
+    assert to_bytes(loaded) == to_bytes(game)
+
+
+def test_snapshot_players():
+    game = Game()
+    game.create_fields(FIELDS_PATH)
+    game.set_number_of_players(3)
+    game.set_players({0: Player(0, 'Żaneta'), 1: AiPlayer(1, 'AI 1'),
+                      2: Player(2, 'Bob')})
+    game.set_current_player_id(1)
+    game.arrest(game.players()[0])
+    game.players()[0].next_jail_round()
+    game.players()[2].set_bancrupt()
+    field = game.fields()[1]
+    game.make_deal(game.players()[1], field, 100)
+    field.set_mortaged(True)
+    loaded = from_bytes(to_bytes(game))
+    players = loaded.players()
+    assert players[0].name() == 'Żaneta'
+    assert players[0].in_jail_round() == 2
+    assert loaded.fields()[JAIL_ID].arrested_players() == {0: players[0]}
+    assert isinstance(players[1], AiPlayer)
+    assert not isinstance(players[0], AiPlayer)
+    assert players[2].is_bancrupt()
+    assert players[2].position() is None
+    assert loaded.fields()[1].owner() is players[1]
+    assert loaded.fields()[1].mortaged()
+    assert loaded.current_player_id() == 1
+    assert loaded.number_of_rounds() is None
+
+
+def test_loaded_game_plays_the_same():
+    game = create_ai_game(3, 60, seed=12)
+    gameplay = play_turns(game, 40)
+    loaded = from_bytes(to_bytes(game))
+    gameplay.play()
+    Simulation(loaded).run()
+    assert game_state(loaded) == game_state(game)
+
+
+def test_save_and_load_game(tmp_path):
+    game = create_ai_game(2, 30, seed=5)
+    play_turns(game, 20)
+    path = tmp_path / 'game.bin'
+    save_game(game, path)
+    assert game_state(load_game(path)) == game_state(game)
+
+
+def test_damaged_snapshot():
+    data = to_bytes(create_ai_game(2, seed=1))
+    with pytest.raises(SnapshotError):
+        from_bytes(data[:-1])
+    with pytest.raises(SnapshotError):
+        from_bytes(b'XXXX' + data[4:])
+
+
+def test_snapshot_wrong_field():
+    game = create_ai_game(2, seed=1)
+    field = game.fields()[1]
+    game.make_deal(game.players()[0], field, 100)
+    data = bytearray(to_bytes(game))
+    offset = HEADER.size + sum(PLAYER.size + len(player.name().encode())
+                               for player in game.players().values())
+    assert data[offset:offset + FIELD.size] == FIELD.pack(1, 0, 0, False)
+    for id in (JAIL_ID, 200):
+        data[offset] = id
+        with pytest.raises(SnapshotError):
+            from_bytes(bytes(data))
+    data[offset] = 1
+    data[offset + 1] = 5
+    with pytest.raises(SnapshotError):
+        from_bytes(bytes(data))
+    with pytest.raises(SnapshotError):
+        from_bytes(data[:5] + b'\x00' + data[6:])
+
+
+def test_snapshot_auction_mode():
+    game = create_ai_game(2, 30, seed=5, auction_mode=VICKREY_AUCTION)
+    assert from_bytes(to_bytes(game)).auction_mode() == VICKREY_AUCTION
+
+
+def test_snapshot_chance_deck():
+    game = create_ai_game(3, 40, seed=8, shuffled_deck=True)
+    play_turns(game, 30)
+    loaded = from_bytes(to_bytes(game))
+    assert loaded.chance_deck() == game.chance_deck()
+    assert loaded.deck_position() == game.deck_position()
+    assert [loaded.draw_card() for _ in range(20)] == \
+        [game.draw_card() for _ in range(20)]
+    assert from_bytes(to_bytes(create_ai_game(2))).chance_deck() is None
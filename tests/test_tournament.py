@@ -0,0 +1,101 @@
+from modules.tournament import Tournament, play_game
+from modules.simulation import game_seed
+from modules.exceptions import PlayersNumberError, AuctionModeError
+from modules.constants import OPEN_AUCTION, VICKREY_AUCTION
+import pytest
+
+
+def test_create_tournament():
+    tournament = Tournament(10, 3, 20, 2)
+    assert tournament.number_of_games() == 10
+    assert tournament.number_of_players() == 3
+    assert tournament.number_of_rounds() == 20
+    assert tournament.processes() == 2
+    assert tournament.games_played() == 0
+
+
+def test_create_tournament_wrong_players_number():
+    with pytest.raises(PlayersNumberError):
+        Tournament(10, 7)
+
+
+def test_create_tournament_negative_games_number():
+    with pytest.raises(ValueError):
+        Tournament(-1, 2)
+
+
+def test_chunksize():
+    assert Tournament(10, 2, processes=4).chunksize() == 1
+    assert Tournament(1600, 2, processes=4).chunksize() == 100
+
+
+def test_create_tournament_random_seed():
+    assert Tournament(1, 2).seed() != Tournament(1, 2).seed()
+
+
+def test_tasks():
+    tournament = Tournament(3, 2, 20, 1, seed=5)
+    assert tournament.seed() == 5
+    assert list(tournament.tasks()) == [
+        (0, 2, 20, game_seed(5, 0), OPEN_AUCTION),
+        (1, 2, 20, game_seed(5, 1), OPEN_AUCTION),
+        (2, 2, 20, game_seed(5, 2), OPEN_AUCTION)
+    ]
+
+
+def test_play_game():
+    index, winners, rounds, fortunes = play_game((7, 3, 10, 12, OPEN_AUCTION))
+    assert index == 7
+    assert 1 <= rounds <= 10
+    assert len(fortunes) == 3
+    for id in winners:
+        assert fortunes[id] == max(fortunes)
+
+
+def test_add_result():
+    tournament = Tournament(2, 2, 20, 1)
+    tournament.add_result((0, (0,), 20, (3000, 500)))
+    tournament.add_result((1, (0, 1), 10, (1000, 1000)))
+    summary = tournament.summary()
+    assert summary['games'] == 2
+    assert summary['wins'] == {0: 1.5, 1: 0.5}
+    assert summary['win_rates'] == {0: 0.75, 1: 0.25}
+    assert summary['mean_rounds'] == 15
+    assert summary['mean_fortunes'] == {0: 2000, 1: 750}
+
+
+def test_summary_no_games():
+    summary = Tournament(0, 2, 20, 1).summary()
+    assert summary['games'] == 0
+    assert summary['mean_rounds'] == 0
+
+
+def test_run():
+    tournament = Tournament(4, 2, 10, 2)
+    summary = tournament.run()
+    assert summary['games'] == 4
+    assert sum(summary['wins'].values()) == pytest.approx(4)
+
+
+def test_play_game_reproducible():
+    task = (0, 4, 50, 123, OPEN_AUCTION)
+    assert play_game(task) == play_game(task)
+
+
+def test_run_reproducible():
+    summary_1 = Tournament(6, 3, 20, 2, seed=99).run()
+    summary_2 = Tournament(6, 3, 20, 1, seed=99).run()
+    assert summary_1['mean_rounds'] == summary_2['mean_rounds']
+    assert summary_1['mean_fortunes'] == summary_2['mean_fortunes']
+    assert summary_1['wins'] == pytest.approx(summary_2['wins'])
+
+
+def test_create_tournament_wrong_auction_mode():
+    with pytest.raises(AuctionModeError):
+        Tournament(10, 2, auction_mode=5)
+
+
+def test_run_sealed_auctions():
+    tournament = Tournament(4, 3, 20, 1, seed=3, auction_mode=VICKREY_AUCTION)
+    assert tournament.auction_mode() == VICKREY_AUCTION
+    assert tournament.run()['games'] == 4
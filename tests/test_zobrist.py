@@ -0,0 +1,108 @@
+from modules.zobrist import (ZobristKeys, ZobristHash, game_hash,
+                             position_index, counter_index, money_key,
+                             field_index, OWNER, MORTAGED)
+from modules.snapshot import to_bytes, from_bytes
+from modules.simulation import Simulation, create_ai_game
+from modules.constants import NUMBER_OF_FIELDS, ZOBRIST_COUNTER_LIMIT
+
+
+def test_indexes():
+    assert position_index(3) == 3
+    assert position_index(NUMBER_OF_FIELDS + 2) == 2
+    assert position_index(None) == NUMBER_OF_FIELDS
+    assert counter_index(None) == 0
+    assert counter_index(2) == 2
+    assert counter_index(100) == ZOBRIST_COUNTER_LIMIT - 1
+    assert field_index(OWNER, None) == 0
+    assert field_index(OWNER, 2) == 3
+    assert field_index(MORTAGED, True) == 1
+
+
+def test_money_keys_differ():
+    keys = {money_key(12345, money) for money in range(-1000, 100000)}
+    assert len(keys) == 101000
+    assert all(0 <= key < 2 ** 64 for key in keys)
+
+
+def test_keys_from_seed():
+    assert ZobristKeys(5).players() == ZobristKeys(5).players()
+    assert ZobristKeys(5).fields() != ZobristKeys(6).fields()
+    assert ZobristKeys().fields() != ZobristKeys().fields()
+
+
+def test_hashing_is_optional():
+    game = create_ai_game(3, 20, seed=1)
+    assert game.zobrist() is None
+    assert game.zobrist_hash() is None
+    Simulation(game).run()
+    assert game.zobrist_hash() is None
+    zobrist = ZobristHash(1)
+    game.set_zobrist(zobrist)
+    assert game.zobrist_hash() == game_hash(game, zobrist.keys())
+    game.set_zobrist(None)
+    value = zobrist.value()
+    game.players()[0].add_money(10)
+    assert zobrist.value() == value
+
+
+def test_hash_updated_during_game():
+    game = create_ai_game(4, 60, seed=4, zobrist=True)
+    keys = game.zobrist().keys()
+    assert game.zobrist_hash() == game_hash(game, keys)
+    gameplay = Simulation(game).gameplay()
+    while not game.finished():
+        gameplay.turn()
+        game.next_player()
+        gameplay.chcek_end()
+        assert game.zobrist_hash() == game_hash(game, keys)
+
+
+def test_hash_reverts_with_state():
+    game = create_ai_game(3, seed=2, zobrist=True)
+    start = game.zobrist_hash()
+    player = game.players()[0]
+    player.add_money(1)
+    assert game.zobrist_hash() != start
+    player.substract_money(1)
+    assert game.zobrist_hash() == start
+    field = game.fields()[1]
+    field.set_owner(player)
+    field.set_mortaged(True)
+    assert game.zobrist_hash() != start
+    field.set_mortaged(False)
+    field.set_owner(None)
+    assert game.zobrist_hash() == start
+    game.set_current_player_id(1)
+    assert game.zobrist_hash() == game_hash(game, game.zobrist().keys())
+    assert game.zobrist_hash() != start
+
+
+def test_exact_money_hashed():
+    game = create_ai_game(2, seed=3, zobrist=True)
+    player = game.players()[0]
+    player.set_money(5000)
+    rich = game.zobrist_hash()
+    player.set_money(9000)
+    assert game.zobrist_hash() != rich
+
+
+def test_equal_states_equal_hashes():
+    game_1 = create_ai_game(3, 40, seed=7, zobrist=True)
+    game_2 = create_ai_game(3, 40, seed=7, zobrist=True)
+    assert game_1.zobrist_hash() == game_2.zobrist_hash()
+    Simulation(game_1).run()
+    assert game_1.zobrist_hash() != game_2.zobrist_hash()
+    Simulation(game_2).run()
+    assert game_1.zobrist_hash() == game_2.zobrist_hash()
+
+
+def test_snapshot_keeps_hash():
+    game = create_ai_game(4, 50, seed=9, zobrist=True)
+    gameplay = Simulation(game).gameplay()
+    for _ in range(60):
+        gameplay.turn()
+        game.next_player()
+    loaded = from_bytes(to_bytes(game))
+    assert loaded.zobrist_hash() is None
+    loaded.set_zobrist(ZobristHash(9))
+    assert loaded.zobrist_hash() == game.zobrist_hash()
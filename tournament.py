@@ -0,0 +1,30 @@
+'''
+This file runs tournament of AI games.
+'''
+
+
+if __name__ == '__main__':
+    from modules.tournament import Tournament
+    from modules.constants import (SIMULATION_ROUNDS, OPEN_AUCTION,
+                                   FIRST_PRICE_AUCTION, VICKREY_AUCTION)
+    import argparse
+    auction_modes = {'open': OPEN_AUCTION, 'first-price': FIRST_PRICE_AUCTION,
+                     'vickrey': VICKREY_AUCTION}
+    parser = argparse.ArgumentParser(description='Tournament of AI games.')
+    parser.add_argument('games', type=int, help='number of games')
+    parser.add_argument('players', type=int, help='players in every game')
+    parser.add_argument('--rounds', type=int, default=SIMULATION_ROUNDS)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--auction', choices=auction_modes, default='open')
+    args = parser.parse_args()
+    tournament = Tournament(args.games, args.players, args.rounds,
+                            args.processes, args.seed,
+                            auction_modes[args.auction])
+    summary = tournament.run()
+    print(f'Ziarno: {tournament.seed()}')
+    print(f'Rozegrane gry: {summary["games"]}')
+    print(f'Średnia liczba rund: {summary["mean_rounds"]:.2f}')
+    for id in summary['wins']:
+        print(f'Gracz {id}: wygrane {summary["win_rates"][id]:.3f}, '
+              f'średni majątek {summary["mean_fortunes"][id]:.0f}')